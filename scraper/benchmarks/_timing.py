@@ -0,0 +1,13 @@
+"""Timing helpers shared by the benchmark scripts."""
+
+import time
+
+
+def best_of(repeat: int, fn) -> float:
+    """Fastest of `repeat` calls to `fn`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
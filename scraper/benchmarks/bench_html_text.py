@@ -0,0 +1,54 @@
+"""Benchmark description text extraction against BeautifulSoup.
+
+Times html_to_text and the BeautifulSoup get_text it replaced over the
+Greenhouse content fragments checked in for the parity tests
+(tests/fixtures/greenhouse_content.json).
+
+Usage:
+    python benchmarks/bench_html_text.py [--copies 200] [--repeat 5]
+"""
+
+import argparse
+import html
+import json
+import re
+import warnings
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from tierjobs_scraper.html_text import html_to_text
+
+from _timing import best_of
+
+
+CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "greenhouse_content.json"
+
+
+def soup_html_to_text(content: str) -> str:
+    soup = BeautifulSoup(html.unescape(content), "html.parser")
+    text = soup.get_text(separator="\n", strip=True)
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=200, help="times the corpus is repeated")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The malformed samples make BeautifulSoup warn on every call
+    warnings.simplefilter("ignore")
+    samples = [sample["content"] for sample in json.loads(CORPUS.read_text())]
+    contents = samples * args.copies
+    size = sum(map(len, contents))
+
+    print(f"{len(contents)} fragments ({size / 1e6:.1f} MB), best of {args.repeat}")
+    soup = best_of(args.repeat, lambda: [soup_html_to_text(c) for c in contents])
+    fast = best_of(args.repeat, lambda: [html_to_text(c) for c in contents])
+    print(f"  BeautifulSoup  {soup:7.3f}s")
+    print(f"  html_to_text   {fast:7.3f}s  ({soup / fast:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark memory per scraped job as a pydantic Job and as a JobRecord.
+
+Builds N synthetic jobs the way a scraper does, from freshly decoded
+strings, and reports the bytes tracemalloc sees retained per job.
+
+Usage:
+    python benchmarks/bench_memory.py [--jobs 20000] [--description-chars 0]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+
+from tierjobs_scraper.models import Job, JobRecord
+
+
+COMPANIES = ["Stripe", "Anthropic", "Jane Street", "Databricks", "Figma"]
+LOCATIONS = ["San Francisco, CA", "New York, NY", "London, UK", "Remote", None]
+TEAMS = ["Engineering", "Research", "Infrastructure", "Product", None]
+
+
+def fresh(text: str | None) -> str | None:
+    """An equal but distinct string, as json.loads would hand back."""
+    return None if text is None else "".join(list(text))
+
+
+def job_fields(i: int, rng: random.Random, description_chars: int) -> dict:
+    company = rng.choice(COMPANIES)
+    team = rng.choice(TEAMS)
+    return {
+        "id": f"{company.lower()}_{i}",
+        "company": fresh(company),
+        "company_slug": fresh(company.lower().replace(" ", "_")),
+        "tier": fresh(rng.choice(["S+", "S", "A"])),
+        "tier_score": rng.choice([100, 95, 85]),
+        "title": f"Software Engineer, {rng.choice(['Payments', 'Platform', 'Growth'])} {i}",
+        "url": f"https://boards.greenhouse.io/{company.lower()}/jobs/{4000000 + i}",
+        "location": fresh(rng.choice(LOCATIONS)),
+        "team": fresh(team),
+        "departments": [fresh(team)] if team else [],
+        "job_type": fresh("swe"),
+        "level": fresh(rng.choice(["senior", "mid", "staff"])),
+        "description": "x" * description_chars if description_chars else None,
+        "posted_at": datetime(2024, 1, 1) + timedelta(hours=i),
+        "scraped_at": datetime(2024, 6, 1),
+        "internal_job_id": 4000000 + i,
+    }
+
+
+def bytes_per_job(build, n: int, description_chars: int) -> float:
+    rng = random.Random(0)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    jobs = [build(**job_fields(i, rng, description_chars)) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del jobs
+    return (after - before) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--description-chars", type=int, default=0)
+    args = parser.parse_args()
+
+    job = bytes_per_job(Job, args.jobs, args.description_chars)
+    record = bytes_per_job(JobRecord, args.jobs, args.description_chars)
+    print(f"{args.jobs} jobs, {args.description_chars}-char descriptions")
+    print(f"  Job        {job:8.0f} bytes/job")
+    print(f"  JobRecord  {record:8.0f} bytes/job  ({record / job:.0%} of Job)")
+
+
+if __name__ == "__main__":
+    main()
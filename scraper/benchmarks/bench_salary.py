@@ -0,0 +1,65 @@
+"""Benchmark salary extraction over synthetic job descriptions.
+
+Each description is a few KB of posting boilerplate, full of numbers that
+are not pay (years, team sizes, funding, 401(k)), with one of the salary
+phrasings from tests/fixtures/salary_cases.json somewhere in it or none.
+
+Usage:
+    python benchmarks/bench_salary.py [--descriptions 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+from tierjobs_scraper.salary import extract_salary
+
+from _timing import best_of
+
+
+CASES = Path(__file__).parent.parent / "tests" / "fixtures" / "salary_cases.json"
+
+BOILERPLATE = [
+    "Founded in 2011, we now serve over 2,000,000 businesses in 45 countries.",
+    "You will join a team of 8 - 12 engineers working on the payments platform.",
+    "We raised $50M in our Series C and are growing 3x year over year.",
+    "Benefits include a 401(k) match, 20 days of PTO and 12 weeks of parental leave.",
+    "You have 5+ years of experience with Python, Go or Java.",
+    "Our services handle 150,000 requests per second at p99 latency under 40ms.",
+    "Work from our offices at 510 Townsend St or remotely from UTC-8 to UTC+1.",
+    "We are an equal opportunity employer and value diversity at our company.",
+    "The interview process has 4 stages and usually takes 2 to 3 weeks.",
+]
+
+
+def make_descriptions(n: int, seed: int = 19) -> list[str]:
+    rng = random.Random(seed)
+    phrasings = [case["text"] for case in json.loads(CASES.read_text())["descriptions"]]
+    descriptions = []
+    for _ in range(n):
+        sentences = [rng.choice(BOILERPLATE) for _ in range(rng.randint(20, 40))]
+        if rng.random() < 0.7:
+            sentences.insert(rng.randrange(len(sentences)), rng.choice(phrasings))
+        descriptions.append("\n".join(sentences))
+    return descriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--descriptions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    descriptions = make_descriptions(args.descriptions)
+    size = sum(map(len, descriptions))
+    found = sum(extract_salary(text) is not None for text in descriptions)
+    elapsed = best_of(args.repeat, lambda: [extract_salary(text) for text in descriptions])
+
+    print(f"{args.descriptions} descriptions ({size / 1e6:.1f} MB), best of {args.repeat}")
+    print(f"  extract_salary  {elapsed / args.descriptions * 1e6:7.1f} us/description"
+          f"  ({size / elapsed / 1e6:.0f} MB/s, salary found in {found})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark Convex payload encoding with the stdlib json module and orjson.
+
+Times job_to_convex + dumps over a synthetic batch, the work done for every
+job on push, and job_fingerprint on top of it.
+
+Usage:
+    python benchmarks/bench_serialization.py [--jobs 20000] [--repeat 5]
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from tierjobs_scraper import serialization
+from tierjobs_scraper.convex_client import job_fingerprint
+from tierjobs_scraper.models import JobRecord
+from tierjobs_scraper.serialization import dumps, job_to_convex
+
+from _timing import best_of
+
+
+def make_jobs(n: int) -> list[JobRecord]:
+    start = datetime(2024, 1, 1)
+    description = "We are looking for a software engineer to join the platform team. " * 40
+    return [
+        JobRecord(
+            id=f"stripe_{i}",
+            company="Stripe",
+            company_slug="stripe",
+            tier="S",
+            tier_score=95,
+            title=f"Software Engineer, Payments {i}",
+            url=f"https://boards.greenhouse.io/stripe/jobs/{i}",
+            location="San Francisco, CA",
+            remote=i % 3 == 0,
+            job_type="swe",
+            level="senior",
+            team="Engineering",
+            description=description,
+            salary_min=150000,
+            salary_max=220000,
+            posted_at=start + timedelta(hours=i),
+            scraped_at=start,
+        )
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    backends = [("orjson", serialization.orjson), ("json", None)]
+    if serialization.orjson is None:
+        print("orjson is not installed; timing the json module only")
+        backends = backends[1:]
+
+    print(f"{args.jobs} jobs, best of {args.repeat}")
+    for name, module in backends:
+        serialization.orjson = module
+        encode = best_of(args.repeat, lambda: [dumps(job_to_convex(job)) for job in jobs])
+        fingerprint = best_of(args.repeat, lambda: [job_fingerprint(job_to_convex(job)) for job in jobs])
+        print(
+            f"  {name:<6}  encode {encode / args.jobs * 1e6:6.2f} us/job"
+            f"   fingerprint {fingerprint / args.jobs * 1e6:6.2f} us/job"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Content-addressed description blobs.
+
+Job descriptions are stored once per distinct text in a SQLite table keyed
+by the SHA-256 of the text and zlib-compressed. Stored jobs and in-memory
+JobRecords carry a BlobRef instead of the text, which is loaded (and
+decompressed) only when something reads it.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+
+
+# Job fields kept as blobs
+TEXT_FIELDS = ("description_html", "description")
+
+# Decompressed texts kept in memory, for jobs read more than once per run
+DEFAULT_CACHE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+"""
+
+
+def blob_hash(text: str) -> str:
+    """Content address of a text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class BlobStore:
+    """Compressed texts in SQLite, keyed by content hash.
+
+    Shares the connection and lock of the JobStore that owns it.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        lock: threading.RLock,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.conn = conn
+        self.lock = lock
+        self.conn.executescript(SCHEMA)
+        self.cache: OrderedDict[str, str] = OrderedDict()
+        self.cache_size = cache_size
+        # BlobRefs load from the event loop and from worker threads alike
+        self.cache_lock = threading.Lock()
+
+    def put_many(self, texts: list[str]) -> list[str]:
+        """Store texts (deduplicated) and return their hashes in order."""
+        hashes = [blob_hash(text) for text in texts]
+        rows = {h: text for h, text in zip(hashes, texts)}
+        with self.lock:
+            missing = set(rows) - self._existing(list(rows))
+            if missing:
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO blobs (hash, data) VALUES (?, ?)",
+                        [(h, zlib.compress(rows[h].encode())) for h in missing],
+                    )
+        return hashes
+
+    def _existing(self, hashes: list[str]) -> set[str]:
+        found = set()
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT hash FROM blobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def get(self, content_hash: str) -> str | None:
+        """Load a text by hash, or None if it isn't stored."""
+        with self.cache_lock:
+            text = self.cache.get(content_hash)
+            if text is not None:
+                self.cache.move_to_end(content_hash)
+                return text
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM blobs WHERE hash = ?", (content_hash,)
+            ).fetchone()
+        if row is None:
+            return None
+        text = zlib.decompress(row[0]).decode()
+
+        with self.cache_lock:
+            self.cache[content_hash] = text
+            self.cache.move_to_end(content_hash)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return text
+
+    def ref(self, content_hash: str) -> "BlobRef":
+        """Lazy reference to a stored text."""
+        return BlobRef(content_hash, self)
+
+    def count(self) -> int:
+        """Number of distinct texts stored."""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+
+class BlobRef:
+    """A stored text that is loaded on demand."""
+
+    __slots__ = ("hash", "store")
+
+    def __init__(self, content_hash: str, store: BlobStore):
+        self.hash = content_hash
+        self.store = store
+
+    def load(self) -> str:
+        text = self.store.get(self.hash)
+        if text is None:
+            raise KeyError(f"Blob {self.hash} is missing from the store")
+        return text
+
+    def __eq__(self, other):
+        return isinstance(other, BlobRef) and other.hash == self.hash
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __repr__(self):
+        return f"BlobRef({self.hash[:12]})"
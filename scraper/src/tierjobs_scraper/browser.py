@@ -0,0 +1,324 @@
+"""Shared headless browser for Playwright scrapers.
+
+One Chromium is launched per process on first use and kept until
+close_browser_pool(). Pages render in reusable browser contexts, each
+retired after a fixed number of pages so cookies and memory don't build up
+forever, and at most `max_pages` render at once. Images, fonts, media and
+well-known third-party trackers are blocked with request routing since
+scrapers only need the DOM.
+
+Boards that load their jobs from a JSON API can skip the DOM altogether:
+capture_json() hands back the API responses the page makes as soon as they
+arrive, along with the request that fetched them so it can be replayed
+over plain HTTP.
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, AsyncIterator, NamedTuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, Response, Route
+
+
+DEFAULT_MAX_PAGES = 4
+DEFAULT_PAGES_PER_CONTEXT = 25
+DEFAULT_TIMEOUT = 30_000  # milliseconds
+DEFAULT_SELECTOR_TIMEOUT = 10_000  # milliseconds
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Analytics and ad hosts that careers pages pull in (subdomains included)
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "clarity.ms",
+    "linkedin.com",
+    "licdn.com",
+    "bing.com",
+    "ads-twitter.com",
+    "onetrust.com",
+    "cookielaw.org",
+)
+
+
+def is_tracker(url: str, hosts: tuple[str, ...] = TRACKER_HOSTS) -> bool:
+    """Whether a URL belongs to one of `hosts` or a subdomain of one."""
+    host = urlsplit(url).hostname or ""
+    return any(host == h or host.endswith("." + h) for h in hosts)
+
+
+# A URL glob ("*/api/jobs*") or a compiled regex searched in the URL
+UrlPattern = str | re.Pattern
+
+
+def url_matches(url: str, patterns: tuple[UrlPattern, ...]) -> bool:
+    """Whether a URL matches any of `patterns`."""
+    return any(
+        pattern.search(url) if isinstance(pattern, re.Pattern) else fnmatchcase(url, pattern)
+        for pattern in patterns
+    )
+
+
+# Request headers the browser or connection manages, not worth replaying
+UNREPLAYED_HEADERS = frozenset({"host", "content-length", "connection", "cookie", "accept-encoding"})
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Whether an error is asyncio's or Playwright's timeout."""
+    if isinstance(error, TimeoutError):
+        return True
+    # Only pages raise Playwright's, so it's already imported by then
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    return isinstance(error, PlaywrightTimeoutError)
+
+
+class CapturedResponse(NamedTuple):
+    """A JSON response seen by the browser and the request that produced it."""
+
+    url: str
+    method: str
+    headers: dict[str, str]
+    post_data: str | None
+    status: int
+    data: Any
+
+
+class PooledContext:
+    """A browser context, the browser it belongs to and how many pages it has served."""
+
+    __slots__ = ("context", "browser", "pages")
+
+    def __init__(self, context: "BrowserContext", browser: "Browser"):
+        self.context = context
+        self.browser = browser
+        self.pages = 0
+
+
+class BrowserPool:
+    """Long-lived browser with a pool of reusable contexts.
+
+    Usage:
+        pool = BrowserPool(max_pages=8)
+        html = await pool.render("https://example.com/careers", wait_for=".job")
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        pages_per_context: int = DEFAULT_PAGES_PER_CONTEXT,
+        headless: bool = True,
+        block_resources: bool = True,
+        blocked_hosts: tuple[str, ...] = TRACKER_HOSTS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.max_pages = max(1, max_pages)
+        self.pages_per_context = max(1, pages_per_context)
+        self.headless = headless
+        self.block_resources = block_resources
+        self.blocked_hosts = blocked_hosts
+        self.timeout = timeout
+
+        self.slots = asyncio.Semaphore(self.max_pages)
+        self.lock = asyncio.Lock()
+        self.playwright: "Playwright | None" = None
+        self.browser: "Browser | None" = None
+        self.idle: list[PooledContext] = []
+        self.launches = 0
+        self.contexts_opened = 0
+        self.blocked = 0
+
+    async def start(self) -> "Browser":
+        """Launch the browser if it isn't running yet."""
+        async with self.lock:
+            if self.browser is None or not self.browser.is_connected():
+                if self.playwright is None:
+                    # Playwright takes a while to import; only browser scrapes need it
+                    from playwright.async_api import async_playwright
+
+                    self.playwright = await async_playwright().start()
+                # Idle contexts of the old browser are closed as they come up
+                self.browser = await self.playwright.chromium.launch(headless=self.headless)
+                self.launches += 1
+        return self.browser
+
+    async def _route(self, route: "Route"):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or is_tracker(request.url, self.blocked_hosts):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _is_current(self, pooled: PooledContext) -> bool:
+        """Whether a context belongs to the running browser."""
+        return pooled.browser is self.browser and pooled.browser.is_connected()
+
+    async def _close_context(self, pooled: PooledContext):
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass  # its browser already went away
+
+    async def _acquire_context(self) -> PooledContext:
+        # Relaunches a browser that crashed or disconnected, so idle
+        # contexts from before that are stale
+        browser = await self.start()
+        while self.idle:
+            pooled = self.idle.pop()
+            if self._is_current(pooled):
+                return pooled
+            await self._close_context(pooled)
+        context = await browser.new_context()
+        context.set_default_timeout(self.timeout)
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        self.contexts_opened += 1
+        return PooledContext(context, browser)
+
+    async def _release_context(self, pooled: PooledContext):
+        pooled.pages += 1
+        if pooled.pages >= self.pages_per_context or not self._is_current(pooled):
+            await self._close_context(pooled)
+        else:
+            self.idle.append(pooled)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """A fresh page in a pooled context, closed afterwards."""
+        async with self.slots:
+            pooled = await self._acquire_context()
+            try:
+                page = await pooled.context.new_page()
+                try:
+                    yield page
+                finally:
+                    await page.close()
+            finally:
+                await self._release_context(pooled)
+
+    async def render(
+        self,
+        url: str,
+        wait_for: str | None = None,
+        wait_until: str = "networkidle",
+        selector_timeout: float = DEFAULT_SELECTOR_TIMEOUT,
+    ) -> str:
+        """Page HTML after JS execution."""
+        async with self.page() as page:
+            await page.goto(url, wait_until=wait_until)
+            if wait_for:
+                await page.wait_for_selector(wait_for, timeout=selector_timeout)
+            return await page.content()
+
+    async def capture_json(
+        self,
+        url: str,
+        patterns: tuple[UrlPattern, ...],
+        count: int = 1,
+        timeout: float | None = None,
+    ) -> list[CapturedResponse]:
+        """JSON responses to requests matching `patterns` made while loading `url`.
+
+        Returns as soon as `count` of them have arrived, without waiting for
+        the page to settle. On timeout (waiting for responses, or Playwright
+        timing out the navigation) whatever arrived is returned, and
+        TimeoutError is raised if nothing did.
+        """
+        found: list[CapturedResponse] = []
+        enough = asyncio.get_running_loop().create_future()
+        reads: set[asyncio.Task] = set()
+
+        async def read(response: "Response"):
+            try:
+                data = await response.json()
+            except Exception:
+                return  # not JSON, or the page went away first
+            request = response.request
+            headers = {
+                name: value
+                for name, value in request.headers.items()
+                if name.lower() not in UNREPLAYED_HEADERS and not name.startswith(":")
+            }
+            found.append(
+                CapturedResponse(response.url, request.method, headers, request.post_data, response.status, data)
+            )
+            if len(found) >= count and not enough.done():
+                enough.set_result(None)
+
+        def on_response(response: "Response"):
+            if response.ok and url_matches(response.url, patterns):
+                task = asyncio.create_task(read(response))
+                reads.add(task)
+                task.add_done_callback(reads.discard)
+
+        async with self.page() as page:
+            page.on("response", on_response)
+            try:
+                await page.goto(url, wait_until="commit")
+                await asyncio.wait_for(asyncio.shield(enough), timeout=(timeout or self.timeout) / 1000)
+            except Exception as e:
+                if not is_timeout(e):
+                    raise
+                if not found:
+                    raise TimeoutError(f"No JSON response matching {patterns} while loading {url}") from e
+            finally:
+                for task in list(reads):
+                    task.cancel()
+                enough.cancel()
+        return found[:count]
+
+    async def close(self):
+        """Close every context, the browser and Playwright."""
+        async with self.lock:
+            idle, self.idle = self.idle, []
+            for pooled in idle:
+                await self._close_context(pooled)
+            if self.browser is not None:
+                browser, self.browser = self.browser, None
+                await browser.close()
+            if self.playwright is not None:
+                playwright, self.playwright = self.playwright, None
+                await playwright.stop()
+
+
+# Process-wide pool shared by all Playwright scrapers
+_shared: BrowserPool | None = None
+_shared_options: dict = {}
+
+
+def configure_browser(**options):
+    """Set options used when the shared browser pool is next created."""
+    global _shared_options
+    _shared_options = options
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the shared browser pool, creating it on first use."""
+    global _shared
+    if _shared is None:
+        _shared = BrowserPool(**_shared_options)
+    return _shared
+
+
+async def close_browser_pool():
+    """Shut down the shared browser, if it was ever started."""
+    global _shared
+    if _shared is not None:
+        pool, _shared = _shared, None
+        await pool.close()
@@ -0,0 +1,146 @@
+"""On-disk HTTP response cache.
+
+Stores decoded JSON bodies together with their ETag/Last-Modified
+validators so repeat runs can send conditional requests and reuse the
+cached body on a 304. Entries younger than the TTL are served without
+touching the network at all.
+
+Every job detail URL gets an entry, so the cache is pruned: entries not
+written (or revalidated) for `max_age` go first, then the oldest ones until
+the directory fits in `max_bytes`. That happens every `prune_every` writes
+and whenever the CLI opens the cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "tierjobs" / "http"
+DEFAULT_MAX_AGE = 7 * 86400.0  # seconds
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_PRUNE_EVERY = 1000  # writes between automatic prunes
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validators."""
+
+    url: str
+    body: object
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = 0.0
+
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return time.time() - self.stored_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for a conditional request against this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """File-per-URL cache of JSON responses."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        ttl: float = 0,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        prune_every: int = DEFAULT_PRUNE_EVERY,
+    ):
+        self.directory = Path(directory or os.getenv("TIERJOBS_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.prune_every = prune_every
+        self.writes = 0
+        self.counting = threading.Lock()
+        self.pruning = threading.Lock()
+
+    def path_for(self, url: str) -> Path:
+        """Path of the cache file for a URL."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Load the entry for a URL, or None if missing or unreadable."""
+        try:
+            with open(self.path_for(url)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("url") != url:
+            return None
+        return CacheEntry(**data)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry can be used without revalidating."""
+        return self.ttl > 0 and entry.age() < self.ttl
+
+    def put(self, entry: CacheEntry):
+        """Write an entry atomically."""
+        path = self.path_for(entry.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # put() runs in worker threads, so each write gets its own temp file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+        ) as f:
+            json.dump(entry.__dict__, f, separators=(",", ":"))
+        os.replace(f.name, path)
+
+        with self.counting:
+            self.writes += 1
+            due = self.prune_every and self.writes % self.prune_every == 0
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired entries, then the oldest until under max_bytes. Returns files removed."""
+        # put() runs in worker threads; one prune at a time is plenty
+        if not self.pruning.acquire(blocking=False):
+            return 0
+        try:
+            files = []
+            for path in self.directory.glob("*/*"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            cutoff = time.time() - self.max_age if self.max_age is not None else None
+            removed = 0
+            for mtime, size, path in files:
+                expired = cutoff is not None and mtime < cutoff
+                too_big = self.max_bytes is not None and total > self.max_bytes
+                if not (expired or too_big):
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
+        finally:
+            self.pruning.release()
+
+    def clear(self):
+        """Remove every cached entry."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*/*"):
+            path.unlink(missing_ok=True)
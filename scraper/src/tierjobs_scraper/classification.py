@@ -1,146 +1,148 @@
 """Job classification utilities.
 
 Infers job type and level from title and other fields.
+
+Rules are declared as tables of (label, keywords) in priority order and
+compiled once at import into one regex per label. Matching is plain
+substring matching on the lowercased text (no word boundaries), so labels
+are the same as the original chain of `any(x in text ...)` checks.
+Results are memoized since the same titles repeat across companies and runs.
 """
 
+import re
+from functools import lru_cache
+
 from .models import JobType, JobLevel
 
 
-def infer_job_type(title: str, team: str | None = None) -> str:
-    """Infer job type from title and team.
-    
-    Returns a JobType value (string).
-    """
-    title_lower = title.lower()
-    team_lower = (team or "").lower()
-    combined = f"{title_lower} {team_lower}"
-    
+# Max distinct titles remembered by the classifiers
+CACHE_SIZE = 65536
+
+# Checked top to bottom; the first label with a matching keyword wins
+JOB_TYPE_RULES: tuple[tuple[str, tuple[str, ...]], ...] = (
     # ML/AI - check first as they often contain "engineer" too
-    if any(x in combined for x in [
+    (JobType.ML_ENGINEER.value, (
         "machine learning", "ml engineer", "ml ", "ai engineer",
         "deep learning", "nlp", "computer vision", "cv engineer",
-        "llm", "language model", "generative ai"
-    ]):
-        return JobType.ML_ENGINEER.value
-    
+        "llm", "language model", "generative ai",
+    )),
     # Research
-    if any(x in combined for x in [
+    (JobType.RESEARCH.value, (
         "research scientist", "research engineer", "researcher",
-        "research fellow", "applied research"
-    ]):
-        return JobType.RESEARCH.value
-    
+        "research fellow", "applied research",
+    )),
     # Data Science
-    if any(x in combined for x in [
+    (JobType.DATA_SCIENTIST.value, (
         "data scientist", "data science", "analytics engineer",
-        "data analyst"
-    ]):
-        return JobType.DATA_SCIENTIST.value
-    
+        "data analyst",
+    )),
     # Quant
-    if any(x in combined for x in [
-        "quant", "quantitative", "trading", "algorithmic"
-    ]):
-        return JobType.QUANT.value
-    
+    (JobType.QUANT.value, (
+        "quant", "quantitative", "trading", "algorithmic",
+    )),
     # Product Management
-    if any(x in combined for x in [
+    (JobType.PRODUCT_MANAGER.value, (
         "product manager", "program manager", "technical program",
-        "tpm", "product lead", "product owner"
-    ]):
-        return JobType.PRODUCT_MANAGER.value
-    
+        "tpm", "product lead", "product owner",
+    )),
     # Design
-    if any(x in combined for x in [
+    (JobType.DESIGNER.value, (
         "designer", "design", "ux", "ui", "user experience",
-        "user interface", "visual design", "interaction design"
-    ]):
-        return JobType.DESIGNER.value
-    
+        "user interface", "visual design", "interaction design",
+    )),
     # DevOps/SRE/Platform
-    if any(x in combined for x in [
+    (JobType.DEVOPS.value, (
         "devops", "sre", "site reliability", "infrastructure",
-        "platform engineer", "cloud engineer", "systems engineer"
-    ]):
-        return JobType.DEVOPS.value
-    
+        "platform engineer", "cloud engineer", "systems engineer",
+    )),
     # Security
-    if any(x in combined for x in [
+    (JobType.SECURITY.value, (
         "security", "infosec", "cybersecurity", "appsec",
-        "penetration", "red team", "blue team"
-    ]):
-        return JobType.SECURITY.value
-    
+        "penetration", "red team", "blue team",
+    )),
     # Software Engineering (catch-all for engineering roles)
-    if any(x in combined for x in [
+    (JobType.SOFTWARE_ENGINEER.value, (
         "software engineer", "software developer", "backend",
         "frontend", "full stack", "fullstack", "web developer",
         "mobile engineer", "ios engineer", "android engineer",
-        "engineer", "developer", "sde"
-    ]):
-        return JobType.SOFTWARE_ENGINEER.value
-    
-    return JobType.OTHER.value
+        "engineer", "developer", "sde",
+    )),
+)
 
-
-def infer_level(title: str) -> str:
-    """Infer job level from title.
-    
-    Returns a JobLevel value (string).
-    """
-    title_lower = title.lower()
-    
+LEVEL_RULES: tuple[tuple[str, tuple[str, ...]], ...] = (
     # Executive level
-    if any(x in title_lower for x in ["cto", "ceo", "cfo", "coo", "chief"]):
-        return JobLevel.EXEC.value
-    
+    (JobLevel.EXEC.value, ("cto", "ceo", "cfo", "coo", "chief")),
     # VP level
-    if any(x in title_lower for x in ["vp", "vice president"]):
-        return JobLevel.VP.value
-    
+    (JobLevel.VP.value, ("vp", "vice president")),
     # Director level
-    if "director" in title_lower:
-        return JobLevel.DIRECTOR.value
-    
+    (JobLevel.DIRECTOR.value, ("director",)),
     # Principal/Distinguished
-    if any(x in title_lower for x in ["principal", "distinguished", "fellow"]):
-        return JobLevel.PRINCIPAL.value
-    
+    (JobLevel.PRINCIPAL.value, ("principal", "distinguished", "fellow")),
     # Staff level
-    if "staff" in title_lower:
-        return JobLevel.STAFF.value
-    
+    (JobLevel.STAFF.value, ("staff",)),
     # Senior level
-    if any(x in title_lower for x in ["senior", "sr.", "sr "]):
-        return JobLevel.SENIOR.value
-    
+    (JobLevel.SENIOR.value, ("senior", "sr.", "sr ")),
     # Junior level
-    if any(x in title_lower for x in ["junior", "jr.", "jr "]):
-        return JobLevel.JUNIOR.value
-    
+    (JobLevel.JUNIOR.value, ("junior", "jr.", "jr ")),
     # Entry level / New Grad
-    if any(x in title_lower for x in ["new grad", "entry level", "early career", "associate"]):
-        return JobLevel.NEW_GRAD.value
-    
+    (JobLevel.NEW_GRAD.value, ("new grad", "entry level", "early career", "associate")),
     # Intern
-    if "intern" in title_lower:
-        return JobLevel.INTERN.value
-    
-    # Default to mid-level
-    return JobLevel.MID.value
+    (JobLevel.INTERN.value, ("intern",)),
+)
+
+
+class RuleClassifier:
+    """Keyword rule table compiled into one regex per label."""
+
+    def __init__(self, rules: tuple[tuple[str, tuple[str, ...]], ...], default: str):
+        self.default = default
+        self.rules = [
+            # Longest keywords first so overlapping alternatives don't shadow each other
+            (label, re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))))
+            for label, keywords in rules
+        ]
+
+    def classify(self, text: str) -> str:
+        """Return the highest-priority label with a keyword in `text` (already lowercased)."""
+        for label, pattern in self.rules:
+            if pattern.search(text):
+                return label
+        return self.default
+
+
+JOB_TYPES = RuleClassifier(JOB_TYPE_RULES, JobType.OTHER.value)
+LEVELS = RuleClassifier(LEVEL_RULES, JobLevel.MID.value)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def infer_job_type(title: str, team: str | None = None) -> str:
+    """Infer job type from title and team.
+
+    Returns a JobType value (string).
+    """
+    return JOB_TYPES.classify(f"{title.lower()} {(team or '').lower()}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def infer_level(title: str) -> str:
+    """Infer job level from title.
+
+    Returns a JobLevel value (string). Defaults to mid-level.
+    """
+    return LEVELS.classify(title.lower())
 
 
 def matches_role_filter(job_type: str, role_filters: list[str]) -> bool:
     """Check if a job type matches any of the role filters.
-    
+
     Args:
         job_type: The job's type (e.g., "swe", "mle")
         role_filters: List of role filters to match against
-        
+
     Returns:
         True if job matches any filter, False otherwise
     """
     if not role_filters:
         return True
-    
+
     return job_type in role_filters
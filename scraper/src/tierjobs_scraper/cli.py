@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-from datetime import datetime
 from pathlib import Path
 
 import click
@@ -10,11 +9,33 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .models import Company, JobType
+from .models import Company, Job, JobRecord, JobType
 from .scrapers import GreenhouseScraper, LeverScraper
-from .scrapers.greenhouse import GREENHOUSE_BOARDS
+from .scrapers.greenhouse import GREENHOUSE_BOARDS, DEFAULT_DETAIL_CONCURRENCY
 from .scrapers.lever import LEVER_SITES
-from .convex_client import AsyncConvexClient
+from .convex_client import AsyncConvexClient, DEFAULT_MAX_BATCH_BYTES, DEFAULT_MAX_BATCH_JOBS
+from .push import PushPipeline, DEFAULT_MAX_IN_FLIGHT
+from .cache import ResponseCache
+from .store import JobStore, DEFAULT_STORE_PATH
+from .output import FORMATS, open_writer, read_jobs, iter_job_dicts
+from .reclassify import reclassify as reclassify_records, LABEL_FIELDS, DEFAULT_CHUNK_SIZE
+from .transport import configure_transport, close_transport, DEFAULT_RATE
+from .daemon import ScrapeDaemon, DEFAULT_MAX_REFRESHES
+from .scheduler import RefreshSchedule, DEFAULT_INTERVAL, DEFAULT_MIN_INTERVAL, DEFAULT_MAX_INTERVAL
+from .parsing import configure_parsing, close_parse_pool
+from .browser import configure_browser, close_browser_pool, DEFAULT_MAX_PAGES
+from .pipeline import (
+    ScrapePipeline,
+    CompanyRun,
+    Sink,
+    CollectSink,
+    PushSink,
+    WriterSink,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_HOST_CONCURRENCY,
+    DEFAULT_PARSE_CONCURRENCY,
+    DEFAULT_QUEUE_SIZE,
+)
 
 
 console = Console()
@@ -48,20 +69,140 @@ def load_companies() -> dict[str, Company]:
     return companies
 
 
-def get_scraper(company: Company, full: bool = False):
+def get_scraper(
+    company: Company,
+    full: bool = False,
+    detail_concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+    previous: dict[str, JobRecord] | None = None,
+    bulk: bool = True,
+):
     """Get the appropriate scraper for a company."""
     slug = company.slug
     
     # Check if it's a Greenhouse company
     if slug in GREENHOUSE_BOARDS:
-        return GreenhouseScraper(company, full=full)
+        scraper = GreenhouseScraper(company, full=full, detail_concurrency=detail_concurrency, previous=previous, bulk=bulk)
     
     # Check if it's a Lever company
-    if slug in LEVER_SITES:
-        return LeverScraper(company)
+    elif slug in LEVER_SITES:
+        scraper = LeverScraper(company)
     
     # Default to Greenhouse with company slug
-    return GreenhouseScraper(company, full=full)
+    else:
+        scraper = GreenhouseScraper(company, full=full, detail_concurrency=detail_concurrency, previous=previous, bulk=bulk)
+    
+    return scraper
+
+
+def make_cache(no_cache: bool, cache_ttl: float, clear_cache: bool = False) -> ResponseCache | None:
+    """Build the HTTP response cache from CLI options, clearing or pruning it first."""
+    cache = ResponseCache(ttl=cache_ttl)
+    if clear_cache:
+        cache.clear()
+    elif not no_cache:
+        cache.prune()
+    return None if no_cache else cache
+
+
+def load_previous_jobs(path: str | None) -> dict[str, dict[str, JobRecord]]:
+    """Load a previous run's output, grouped by company slug then job ID."""
+    by_company: dict[str, dict[str, JobRecord]] = {}
+    if not path or not Path(path).exists():
+        return by_company
+    
+    try:
+        for job in read_jobs(path):
+            by_company.setdefault(job.company_slug, {})[job.id] = JobRecord.from_job(job)
+    except (OSError, EOFError, ValueError) as e:
+        console.print(f"[yellow]Could not read previous jobs from {path}: {e}[/yellow]")
+    return by_company
+
+
+def make_store(no_store: bool, store_path: str | None) -> JobStore | None:
+    """Open the local job store from CLI options."""
+    if no_store:
+        return None
+    return JobStore(store_path)
+
+
+def load_incremental_base(
+    slugs: list[str],
+    previous: str | None,
+    output: str | None,
+    store: JobStore | None,
+) -> dict[str, dict[str, JobRecord]]:
+    """Previous jobs per company for incremental mode.
+    
+    An explicit --previous file wins, then the job store, then the output file.
+    """
+    if previous or not store:
+        return load_previous_jobs(previous or output)
+    return {slug: store.jobs_for_company(slug) for slug in slugs}
+
+
+def print_jobs_table(jobs: list, title: str, limit: int = 20):
+    """Print a table of jobs."""
+    table = Table(title=title)
+    table.add_column("Title", style="white", max_width=40)
+    table.add_column("Type", style="magenta", max_width=8)
+    table.add_column("Level", style="blue", max_width=8)
+    table.add_column("Location", style="dim", max_width=15)
+    table.add_column("Salary", style="green")
+    
+    for job in jobs[:limit]:
+        salary = ""
+        if job.salary_min and job.salary_max:
+            salary = f"${job.salary_min//1000}k-${job.salary_max//1000}k"
+        
+        # Use normalized location if available
+        location = job.location_normalized or job.location or "N/A"
+        
+        table.add_row(
+            job.title[:40],
+            job.job_type,
+            job.level,
+            location[:15] if location else "—",
+            salary or "—",
+        )
+    
+    console.print(table)
+    
+    if len(jobs) > limit:
+        console.print(f"... and {len(jobs) - limit} more")
+
+
+def print_push_stats(stats: dict):
+    """Print a Convex push summary."""
+    console.print(
+        f"[green]✓[/green] Pushed to Convex: {stats['created']} created, "
+        f"{stats['updated']} updated, {stats['skipped']} unchanged "
+        f"in {stats['batches']} batches ({stats['bytes'] // 1024} KB sent)"
+    )
+    console.print(f"[green]✓[/green] Updated {stats['companies']} company job counts")
+    for error in stats["errors"]:
+        console.print(f"[red]✗[/red] {error}")
+
+
+def print_stage_stats(stats: list[dict]):
+    """Print per-stage pipeline counters."""
+    table = Table(title="Pipeline stages")
+    table.add_column("Stage", style="cyan")
+    for column in ("Workers", "Batches", "In", "Out", "Errors", "Busy", "Max queued"):
+        table.add_column(column, justify="right")
+    
+    for stage in stats:
+        table.add_row(
+            stage["stage"],
+            str(stage["concurrency"]),
+            str(stage["batches"]),
+            str(stage["jobs_in"]),
+            str(stage["jobs_out"]),
+            str(stage["errors"]),
+            f"{stage['busy_ms']}ms",
+            str(stage["max_queued"]),
+        )
+    
+    console.print(table)
 
 
 def validate_roles(roles: tuple[str, ...]) -> list[str] | None:
@@ -77,13 +218,6 @@ def validate_roles(roles: tuple[str, ...]) -> list[str] | None:
     return list(roles)
 
 
-def filter_jobs_by_role(jobs: list, roles: list[str]) -> list:
-    """Filter jobs by role type."""
-    if not roles:
-        return jobs
-    return [job for job in jobs if job.job_type in roles]
-
-
 @click.group()
 def main():
     """TierJobs Scraper - Scrape jobs from top tech companies."""
@@ -148,11 +282,25 @@ def roles():
 @main.command()
 @click.argument("company_slug")
 @click.option("--output", "-o", type=click.Path(), help="Output JSON file")
+@click.option("--format", "output_format", type=click.Choice(FORMATS), help="Output format (default: ndjson for .ndjson/.jsonl[.gz] files, else json)")
 @click.option("--role", "-r", "roles", multiple=True, help=f"Filter by role type ({ROLE_HELP})")
 @click.option("--push", is_flag=True, help="Push jobs to Convex database")
+@click.option("--force-push", is_flag=True, help="With --push, send every job even if unchanged since the last push")
 @click.option("--full", is_flag=True, help="Fetch full job details including description (slower)")
 @click.option("--full-id", type=str, help="Fetch full details for a single job ID (for testing)")
-def scrape(company_slug: str, output: str | None, roles: tuple[str, ...], push: bool, full: bool, full_id: str | None):
+@click.option("--detail-concurrency", type=click.IntRange(min=1), default=DEFAULT_DETAIL_CONCURRENCY, show_default=True, help="Max job-detail requests in flight per company with --full")
+@click.option("--cache-ttl", type=click.FloatRange(min=0), default=0, show_default=True, help="Reuse cached responses younger than this many seconds without revalidating")
+@click.option("--no-cache", is_flag=True, help="Disable the on-disk HTTP response cache")
+@click.option("--clear-cache", is_flag=True, help="Delete the on-disk HTTP response cache before starting")
+@click.option("--incremental", is_flag=True, help="With --full, only fetch details for jobs new or updated since the previous run")
+@click.option("--previous", type=click.Path(dir_okay=False), help="Previous run's JSON output for --incremental (defaults to the job store)")
+@click.option("--no-bulk", is_flag=True, help="With --full, fetch each job's details separately instead of one bulk content request")
+@click.option("--store", "store_path", type=click.Path(dir_okay=False), default=DEFAULT_STORE_PATH, show_default=True, envvar="TIERJOBS_STORE", help="Local SQLite job store")
+@click.option("--no-store", is_flag=True, help="Don't record jobs in the local job store")
+@click.option("--parse-workers", type=click.IntRange(min=0), help="Processes for parsing full job details (default: CPU count; 0 parses on the event loop)")
+@click.option("--parse-concurrency", type=click.IntRange(min=1), default=DEFAULT_PARSE_CONCURRENCY, show_default=True, help="Max batches being parsed at once")
+@click.option("--queue-size", type=click.IntRange(min=1), default=DEFAULT_QUEUE_SIZE, show_default=True, help="Max batches waiting in front of each pipeline stage")
+def scrape(company_slug: str, output: str | None, output_format: str | None, roles: tuple[str, ...], push: bool, force_push: bool, full: bool, full_id: str | None, detail_concurrency: int, cache_ttl: float, no_cache: bool, clear_cache: bool, incremental: bool, previous: str | None, no_bulk: bool, store_path: str, no_store: bool, parse_workers: int | None, parse_concurrency: int, queue_size: int):
     """Scrape jobs from a specific company.
     
     Examples:
@@ -164,6 +312,8 @@ def scrape(company_slug: str, output: str | None, roles: tuple[str, ...], push:
         tierjobs scrape anthropic --role swe --role mle --push
         
         tierjobs scrape stripe --full -o stripe_jobs.json
+        
+        tierjobs scrape stripe --full --incremental -o stripe_jobs.json
     """
     all_companies = load_companies()
 
@@ -178,6 +328,8 @@ def scrape(company_slug: str, output: str | None, roles: tuple[str, ...], push:
         return
 
     company = all_companies[company_slug]
+    configure_transport(cache=make_cache(no_cache, cache_ttl, clear_cache))
+    configure_parsing(workers=parse_workers)
     
     # Handle --full-id for single job testing
     if full_id:
@@ -185,118 +337,149 @@ def scrape(company_slug: str, output: str | None, roles: tuple[str, ...], push:
         scraper = get_scraper(company, full=True)
         
         async def fetch_single():
-            job = await scraper.fetch_single_job(full_id)
-            return job
+            try:
+                return await scraper.fetch_single_job(full_id)
+            finally:
+                await close_transport()
         
         job = asyncio.run(fetch_single())
         if job:
             console.print(f"[green]✓[/green] Fetched job: {job.title}")
             # Print all fields
-            job_dict = job.model_dump()
+            job_dict = job.as_dict()
             for k, v in job_dict.items():
                 val = str(v)[:100] + "..." if v and len(str(v)) > 100 else str(v)
                 status = "✓" if v not in [None, [], ""] else "✗"
                 console.print(f"  {status} {k}: {val}")
             
             if output:
-                with open(output, "w") as f:
-                    json.dump([job.model_dump()], f, indent=2, default=str)
+                with open_writer(output, output_format) as writer:
+                    writer.write([job])
                 console.print(f"Saved to {output}")
         else:
             console.print(f"[red]✗[/red] Failed to fetch job {full_id}")
         return
     
-    scraper = get_scraper(company, full=full)
-
-    mode_msg = " [yellow](full mode - fetching descriptions)[/yellow]" if full else ""
-    role_msg = f" [dim](filtering: {', '.join(role_filters)})[/dim]" if role_filters else ""
-    console.print(f"Scraping [cyan]{company.name}[/cyan] ({company.tier}){mode_msg}{role_msg}...")
-
-    async def run():
-        result = await scraper.run()
-        return result, scraper.jobs
-
-    result, jobs = asyncio.run(run())
-
-    if result.success:
-        # Apply role filter
-        original_count = len(jobs)
-        jobs = filter_jobs_by_role(jobs, role_filters)
-        filtered_count = len(jobs)
+    job_store = make_store(no_store, store_path)
+    
+    try:
+        previous_jobs = {}
+        if full and incremental:
+            previous_jobs = load_incremental_base([company.slug], previous, output, job_store).get(company.slug, {})
         
-        filter_note = ""
-        if role_filters and filtered_count != original_count:
-            filter_note = f" ({filtered_count} after filtering)"
+        scraper = get_scraper(
+            company,
+            full=full,
+            detail_concurrency=detail_concurrency,
+            previous=previous_jobs,
+            bulk=not no_bulk,
+        )
+
+        mode_msg = " [yellow](full mode - fetching descriptions)[/yellow]" if full else ""
+        role_msg = f" [dim](filtering: {', '.join(role_filters)})[/dim]" if role_filters else ""
+        console.print(f"Scraping [cyan]{company.name}[/cyan] ({company.tier}){mode_msg}{role_msg}...")
+
+        async def run():
+            client = None
+            push_pipeline = None
+            collected = CollectSink()
+            sinks: list[Sink] = [collected]
+            try:
+                if push:
+                    client = AsyncConvexClient(store=job_store)
+                    if await client.health_check():
+                        push_pipeline = PushPipeline(client, force=force_push)
+                        sinks.append(PushSink(push_pipeline))
+                    else:
+                        console.print("[red]✗[/red] Convex unreachable")
+                
+                pipeline = ScrapePipeline(
+                    [scraper],
+                    store=job_store,
+                    roles=role_filters,
+                    sinks=sinks,
+                    parse_concurrency=parse_concurrency,
+                    queue_size=queue_size,
+                )
+                try:
+                    [company_run] = await pipeline.run()
+                finally:
+                    await close_transport()
+                    await close_browser_pool()
+                    close_parse_pool()
+                
+                push_stats = await push_pipeline.close() if push_pipeline else None
+            finally:
+                if client:
+                    await client.close()
+            return company_run, collected.jobs(company.slug), push_stats
         
-        console.print(f"[green]✓[/green] Found {original_count} jobs{filter_note} in {result.duration_ms}ms")
+        company_run, jobs, push_stats = asyncio.run(run())
+        result = company_run.result()
         
-        if jobs:
-            table = Table(title=f"Jobs at {company.name}")
-            table.add_column("Title", style="white", max_width=40)
-            table.add_column("Type", style="magenta", max_width=8)
-            table.add_column("Level", style="blue", max_width=8)
-            table.add_column("Location", style="dim", max_width=15)
-            table.add_column("Salary", style="green")
+        if result.success:
+            original_count = result.jobs_found
+            filtered_count = len(jobs)
             
-            for job in jobs[:20]:  # Show first 20
-                salary = ""
-                if job.salary_min and job.salary_max:
-                    salary = f"${job.salary_min//1000}k-${job.salary_max//1000}k"
-                
-                # Use normalized location if available
-                location = job.location_normalized or job.location or "N/A"
-                
-                table.add_row(
-                    job.title[:40],
-                    job.job_type,
-                    job.level,
-                    location[:15] if location else "—",
-                    salary or "—",
-                )
+            filter_note = ""
+            if role_filters and filtered_count != original_count:
+                filter_note = f" ({filtered_count} after filtering)"
             
-            console.print(table)
+            reused_note = ""
+            if getattr(scraper, "reused_count", 0):
+                reused_note = f" [dim]({scraper.reused_count} unchanged, reused)[/dim]"
             
-            if len(jobs) > 20:
-                console.print(f"... and {len(jobs) - 20} more")
-        
-        # Push to Convex
-        if push and jobs:
-            async def push_to_convex():
-                async with AsyncConvexClient() as client:
-                    # Check health
-                    if not await client.health_check():
-                        console.print("[red]✗[/red] Convex unreachable")
-                        return False
-                    
-                    # Bulk upsert jobs
-                    result = await client.bulk_upsert_jobs(jobs)
-                    console.print(f"[green]✓[/green] Pushed to Convex: {result['created']} created, {result['updated']} updated")
-                    
-                    # Update company job count
-                    await client.update_company_job_count(
-                        company.slug,
-                        len(jobs),
-                        datetime.utcnow()
-                    )
-                    return True
+            console.print(f"[green]✓[/green] Found {original_count} jobs{filter_note} in {result.duration_ms}ms{reused_note}")
+            if job_store:
+                console.print(f"  {result.jobs_new} new, {result.jobs_updated} updated since last run")
             
-            asyncio.run(push_to_convex())
-        
-        if output:
-            with open(output, "w") as f:
-                json.dump([job.model_dump() for job in jobs], f, indent=2, default=str)
-            console.print(f"Saved to {output}")
-    else:
-        console.print(f"[red]✗[/red] Failed: {result.error}")
+            if jobs:
+                print_jobs_table(jobs, f"Jobs at {company.name}")
+            
+            if push_stats:
+                print_push_stats(push_stats)
+            
+            if output:
+                with open_writer(output, output_format) as writer:
+                    writer.write(jobs)
+                console.print(f"Saved to {output}")
+        else:
+            console.print(f"[red]✗[/red] Failed: {result.error}")
+    finally:
+        if job_store:
+            job_store.close()
 
 
 @main.command("scrape-all")
 @click.option("--output", "-o", type=click.Path(), default="jobs.json", help="Output JSON file")
+@click.option("--format", "output_format", type=click.Choice(FORMATS), help="Output format (default: ndjson for .ndjson/.jsonl[.gz] files, else json)")
 @click.option("--tier", "-t", "tiers", multiple=True, help="Only scrape specific tiers (e.g., -t S+ -t S)")
 @click.option("--role", "-r", "roles", multiple=True, help=f"Filter by role type ({ROLE_HELP})")
 @click.option("--push", is_flag=True, help="Push jobs to Convex database")
+@click.option("--force-push", is_flag=True, help="With --push, send every job even if unchanged since the last push")
 @click.option("--full", is_flag=True, help="Fetch full job details including description (slower)")
-def scrape_all(output: str, tiers: tuple[str, ...], roles: tuple[str, ...], push: bool, full: bool):
+@click.option("--concurrency", "-c", type=click.IntRange(min=1), default=DEFAULT_CONCURRENCY, show_default=True, help="Max companies scraped at once")
+@click.option("--host-concurrency", type=click.IntRange(min=1), default=DEFAULT_HOST_CONCURRENCY, show_default=True, help="Max companies scraped at once per ATS host")
+@click.option("--detail-concurrency", type=click.IntRange(min=1), default=DEFAULT_DETAIL_CONCURRENCY, show_default=True, help="Max job-detail requests in flight per company with --full")
+@click.option("--push-batch-bytes", type=click.IntRange(min=1024), default=DEFAULT_MAX_BATCH_BYTES, show_default=True, help="Max serialized bytes per Convex push batch")
+@click.option("--push-batch-jobs", type=click.IntRange(min=1), default=DEFAULT_MAX_BATCH_JOBS, show_default=True, help="Max jobs per Convex push batch")
+@click.option("--push-gzip", is_flag=True, help="Gzip Convex push request bodies (endpoint must accept Content-Encoding: gzip)")
+@click.option("--push-concurrency", type=click.IntRange(min=1), default=DEFAULT_MAX_IN_FLIGHT, show_default=True, help="Max Convex push batches in flight")
+@click.option("--rate-limit", type=click.FloatRange(min=0, min_open=True), default=DEFAULT_RATE, show_default=True, help="Max requests per second per ATS host")
+@click.option("--cache-ttl", type=click.FloatRange(min=0), default=0, show_default=True, help="Reuse cached responses younger than this many seconds without revalidating")
+@click.option("--no-cache", is_flag=True, help="Disable the on-disk HTTP response cache")
+@click.option("--clear-cache", is_flag=True, help="Delete the on-disk HTTP response cache before starting")
+@click.option("--incremental", is_flag=True, help="With --full, only fetch details for jobs new or updated since the previous run")
+@click.option("--previous", type=click.Path(dir_okay=False), help="Previous run's JSON output for --incremental (defaults to the job store)")
+@click.option("--no-bulk", is_flag=True, help="With --full, fetch each job's details separately instead of one bulk content request")
+@click.option("--store", "store_path", type=click.Path(dir_okay=False), default=DEFAULT_STORE_PATH, show_default=True, envvar="TIERJOBS_STORE", help="Local SQLite job store")
+@click.option("--no-store", is_flag=True, help="Don't record jobs in the local job store")
+@click.option("--parse-workers", type=click.IntRange(min=0), help="Processes for parsing full job details (default: CPU count; 0 parses on the event loop)")
+@click.option("--parse-concurrency", type=click.IntRange(min=1), default=DEFAULT_PARSE_CONCURRENCY, show_default=True, help="Max batches being parsed at once")
+@click.option("--render-concurrency", type=click.IntRange(min=1), default=DEFAULT_MAX_PAGES, show_default=True, help="Max pages rendering at once in the shared headless browser")
+@click.option("--queue-size", type=click.IntRange(min=1), default=DEFAULT_QUEUE_SIZE, show_default=True, help="Max batches waiting in front of each pipeline stage")
+@click.option("--stats", "show_stats", is_flag=True, help="Print per-stage pipeline counters at the end")
+def scrape_all(output: str, output_format: str | None, tiers: tuple[str, ...], roles: tuple[str, ...], push: bool, force_push: bool, full: bool, concurrency: int, host_concurrency: int, detail_concurrency: int, push_batch_bytes: int, push_batch_jobs: int, push_gzip: bool, push_concurrency: int, rate_limit: float, cache_ttl: float, no_cache: bool, clear_cache: bool, incremental: bool, previous: str | None, no_bulk: bool, store_path: str, no_store: bool, parse_workers: int | None, parse_concurrency: int, render_concurrency: int, queue_size: int, show_stats: bool):
     """Scrape jobs from all companies.
     
     Examples:
@@ -308,6 +491,14 @@ def scrape_all(output: str, tiers: tuple[str, ...], roles: tuple[str, ...], push
         tierjobs scrape-all --role swe --role mle --push
         
         tierjobs scrape-all --full --push  # Get full descriptions
+        
+        tierjobs scrape-all --full -o jobs.ndjson.gz  # Stream jobs as they're scraped
+        
+        tierjobs scrape-all --full --incremental  # Only refetch changed jobs
+        
+        tierjobs scrape-all -c 32 --host-concurrency 8
+        
+        tierjobs scrape-all --cache-ttl 3600  # Skip boards fetched in the last hour
     """
     all_companies = load_companies()
 
@@ -325,79 +516,365 @@ def scrape_all(output: str, tiers: tuple[str, ...], roles: tuple[str, ...], push
     if role_filters:
         console.print(f"Filtering for roles: {', '.join(role_filters)}")
     
-    all_jobs = []
-    results = []
-    company_job_counts: dict[str, int] = {}
+    configure_transport(rate=rate_limit, cache=make_cache(no_cache, cache_ttl, clear_cache))
+    configure_parsing(workers=parse_workers)
+    configure_browser(max_pages=render_concurrency)
     
-    async def run_all():
+    job_store = make_store(no_store, store_path)
+    writer = None
+    try:
+        previous_jobs = {}
+        if full and incremental:
+            previous_jobs = load_incremental_base(list(all_companies), previous, output, job_store)
+        
+        scrapers = []
         for slug, company in all_companies.items():
             try:
-                scraper = get_scraper(company, full=full)
-                console.print(f"  Scraping [cyan]{company.name}[/cyan]...", end=" ")
-                result = await scraper.run()
-                results.append(result)
-
-                if result.success:
-                    jobs = scraper.jobs
-                    original_count = len(jobs)
+                scrapers.append(get_scraper(
+                    company,
+                    full=full,
+                    detail_concurrency=detail_concurrency,
+                    previous=previous_jobs.get(slug),
+                    bulk=not no_bulk,
+                ))
+            except Exception as e:
+                console.print(f"  Scraping [cyan]{company.name}[/cyan]... [red]error: {e}[/red]")
+        
+        # NDJSON output is written company by company as each one finishes; the
+        # JSON array is written at the end, in company order
+        writer = WriterSink(
+            open_writer(output, output_format),
+            order=[scraper.company.slug for scraper in scrapers],
+        )
+        push_stats = None
+        stage_stats = []
+        
+        async def run_all():
+            nonlocal push_stats, stage_stats
+            client = None
+            if push:
+                client = AsyncConvexClient(
+                    store=job_store,
+                    max_batch_bytes=push_batch_bytes,
+                    max_batch_jobs=push_batch_jobs,
+                    compress=push_gzip,
+                )
+            
+            # Push jobs while the rest are still being scraped
+            sinks: list[Sink] = [writer]
+            push_pipeline = None
+            if client:
+                if await client.health_check():
+                    push_pipeline = PushPipeline(
+                        client,
+                        max_in_flight=push_concurrency,
+                        force=force_push,
+                    )
+                    sinks.append(PushSink(push_pipeline))
+                else:
+                    console.print("[red]✗[/red] Convex unreachable, not pushing")
+            
+            try:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("{task.description}"),
+                    console=console,
+                    transient=True,
+                ) as progress:
+                    task = progress.add_task("Scraping...", total=len(scrapers))
                     
-                    # Apply role filter
-                    jobs = filter_jobs_by_role(jobs, role_filters)
+                    def on_done(company_run: CompanyRun):
+                        progress.update(task, advance=1, description=f"Scraped {company_run.scraper.company.name}")
+                    
+                    pipeline = ScrapePipeline(
+                        scrapers,
+                        store=job_store,
+                        roles=role_filters,
+                        sinks=sinks,
+                        concurrency=concurrency,
+                        host_concurrency=host_concurrency,
+                        parse_concurrency=parse_concurrency,
+                        queue_size=queue_size,
+                        on_done=on_done,
+                    )
+                    try:
+                        runs = await pipeline.run()
+                    finally:
+                        await close_transport()
+                        await close_browser_pool()
+                        close_parse_pool()
+                    stage_stats = pipeline.stats()
+                    
+                    if push_pipeline:
+                        progress.update(task, description="Finishing Convex push...")
+                        push_stats = await push_pipeline.close()
+            finally:
+                if client:
+                    await client.close()
+            
+            return runs
+        
+        # Runs come back in company order, so output stays deterministic
+        runs = asyncio.run(run_all())
+        results = []
+        for company_run in runs:
+            scraper = company_run.scraper
+            result = company_run.result()
+            results.append(result)
+            console.print(f"  Scraping [cyan]{scraper.company.name}[/cyan]...", end=" ")
+            
+            if result.success:
+                original_count = result.jobs_found
+                filtered_count = company_run.jobs_kept
+
+                filter_msg = f" ({filtered_count} filtered)" if role_filters and filtered_count != original_count else ""
+                reused_msg = f", {scraper.reused_count} reused" if getattr(scraper, "reused_count", 0) else ""
+                if job_store:
+                    reused_msg += f", {result.jobs_new} new, {result.jobs_updated} updated"
+                console.print(f"[green]{original_count} jobs{filter_msg}[/green] [dim]({result.duration_ms}ms{reused_msg})[/dim]")
+            else:
+                console.print(f"[red]failed: {result.error}[/red]")
+        
+        # Summary
+        successful = sum(1 for r in results if r.success)
+        total_jobs = sum(run.jobs_kept for run in runs if run.success)
+        
+        console.print(f"\n[green]✓[/green] Scraped {successful}/{len(results)} companies")
+        console.print(f"[green]✓[/green] Found {total_jobs} total jobs")
+        if job_store:
+            total_new = sum(r.jobs_new for r in results if r.success)
+            total_updated = sum(r.jobs_updated for r in results if r.success)
+            console.print(f"[green]✓[/green] {total_new} new, {total_updated} updated ({job_store.count()} in store)")
+        
+        if push_stats:
+            print_push_stats(push_stats)
+        
+        if show_stats:
+            print_stage_stats(stage_stats)
+    finally:
+        # Write out whatever finished, even if the run was interrupted
+        if writer:
+            writer.close()
+        if job_store:
+            job_store.close()
+    console.print(f"Saved to {output}")
 
-                    filter_msg = f" ({len(jobs)} filtered)" if role_filters and len(jobs) != original_count else ""
-                    console.print(f"[green]{original_count} jobs{filter_msg}[/green]")
-                    all_jobs.extend(jobs)
-                    company_job_counts[slug] = len(jobs)
-                else:
-                    console.print(f"[red]failed: {result.error}[/red]")
-            except Exception as e:
-                console.print(f"[red]error: {e}[/red]")
+
+@main.command()
+@click.option("--tier", "-t", "tiers", multiple=True, help="Only scrape specific tiers (e.g., -t S+ -t S)")
+@click.option("--role", "-r", "roles", multiple=True, help=f"Only push jobs of these role types ({ROLE_HELP})")
+@click.option("--push", is_flag=True, help="Push new and changed jobs to Convex as they're found")
+@click.option("--full", is_flag=True, help="Fetch full job details including description; only new or updated jobs are refetched")
+@click.option("--interval", type=click.FloatRange(min=1), default=DEFAULT_INTERVAL, show_default=True, help="Average seconds between refreshes of a company; total requests match scraping everything this often")
+@click.option("--min-interval", type=click.FloatRange(min=1), default=DEFAULT_MIN_INTERVAL, show_default=True, help="Shortest refresh interval for any company")
+@click.option("--max-interval", type=click.FloatRange(min=1), default=DEFAULT_MAX_INTERVAL, show_default=True, help="Longest refresh interval for any company")
+@click.option("--concurrency", "-c", type=click.IntRange(min=1), default=DEFAULT_CONCURRENCY, show_default=True, help="Max companies scraped at once per refresh")
+@click.option("--max-refreshes", type=click.IntRange(min=1), default=DEFAULT_MAX_REFRESHES, show_default=True, help="Max refreshes running at once; companies that come due during a slow refresh start another")
+@click.option("--host-concurrency", type=click.IntRange(min=1), default=DEFAULT_HOST_CONCURRENCY, show_default=True, help="Max companies scraped at once per ATS host")
+@click.option("--detail-concurrency", type=click.IntRange(min=1), default=DEFAULT_DETAIL_CONCURRENCY, show_default=True, help="Max job-detail requests in flight per company with --full")
+@click.option("--push-concurrency", type=click.IntRange(min=1), default=DEFAULT_MAX_IN_FLIGHT, show_default=True, help="Max Convex push batches in flight")
+@click.option("--rate-limit", type=click.FloatRange(min=0, min_open=True), default=DEFAULT_RATE, show_default=True, help="Max requests per second per ATS host")
+@click.option("--keepalive", type=click.FloatRange(min=0), default=300, show_default=True, help="Seconds to keep idle HTTP connections open between refreshes")
+@click.option("--no-cache", is_flag=True, help="Disable the on-disk HTTP response cache")
+@click.option("--clear-cache", is_flag=True, help="Delete the on-disk HTTP response cache before starting")
+@click.option("--store", "store_path", type=click.Path(dir_okay=False), default=DEFAULT_STORE_PATH, show_default=True, envvar="TIERJOBS_STORE", help="Local SQLite job store (also holds the refresh schedule)")
+@click.option("--parse-workers", type=click.IntRange(min=0), help="Processes for parsing full job details (default: CPU count; 0 parses on the event loop)")
+@click.option("--parse-concurrency", type=click.IntRange(min=1), default=DEFAULT_PARSE_CONCURRENCY, show_default=True, help="Max batches being parsed at once")
+@click.option("--render-concurrency", type=click.IntRange(min=1), default=DEFAULT_MAX_PAGES, show_default=True, help="Max pages rendering at once in the shared headless browser")
+@click.option("--queue-size", type=click.IntRange(min=1), default=DEFAULT_QUEUE_SIZE, show_default=True, help="Max batches waiting in front of each pipeline stage")
+def daemon(tiers: tuple[str, ...], roles: tuple[str, ...], push: bool, full: bool, interval: float, min_interval: float, max_interval: float, concurrency: int, max_refreshes: int, host_concurrency: int, detail_concurrency: int, push_concurrency: int, rate_limit: float, keepalive: float, no_cache: bool, clear_cache: bool, store_path: str, parse_workers: int | None, parse_concurrency: int, render_concurrency: int, queue_size: int):
+    """Keep refreshing companies, busiest and highest-tier first.
+    
+    Each company is refreshed on its own interval, shorter for higher
+    tiers and for boards whose listing changed in recent runs, while the
+    total request volume stays that of scraping everything every
+    --interval seconds. Stops cleanly on SIGTERM or Ctrl-C.
     
-    asyncio.run(run_all())
+    Examples:
     
-    # Summary
-    successful = sum(1 for r in results if r.success)
-    total_jobs = len(all_jobs)
+        tierjobs daemon --full --push
+        
+        tierjobs daemon --interval 1800 --tier S+ --tier S
+    """
+    all_companies = load_companies()
     
-    console.print(f"\n[green]✓[/green] Scraped {successful}/{len(results)} companies")
-    console.print(f"[green]✓[/green] Found {total_jobs} total jobs")
+    role_filters = validate_roles(roles)
+    if role_filters is None:
+        return
     
-    # Push to Convex
-    if push and all_jobs:
-        async def push_to_convex():
-            async with AsyncConvexClient() as client:
-                # Check health
-                if not await client.health_check():
-                    console.print("[red]✗[/red] Convex unreachable")
-                    return
-                
-                # Bulk upsert jobs in batches of 100
-                batch_size = 100
-                created = 0
-                updated = 0
-                
-                for i in range(0, len(all_jobs), batch_size):
-                    batch = all_jobs[i:i + batch_size]
-                    result = await client.bulk_upsert_jobs(batch)
-                    created += result.get("created", 0)
-                    updated += result.get("updated", 0)
-                    console.print(f"  Pushed batch {i // batch_size + 1}...")
-                
-                console.print(f"[green]✓[/green] Pushed to Convex: {created} created, {updated} updated")
-                
-                # Update company job counts
-                now = datetime.utcnow()
-                for slug, count in company_job_counts.items():
-                    await client.update_company_job_count(slug, count, now)
-                
-                console.print(f"[green]✓[/green] Updated {len(company_job_counts)} company job counts")
+    if tiers:
+        all_companies = {k: v for k, v in all_companies.items() if v.tier in tiers}
+    if not all_companies:
+        console.print("[red]No companies to refresh[/red]")
+        return
+    
+    configure_transport(
+        rate=rate_limit,
+        cache=make_cache(no_cache, 0, clear_cache),
+        keepalive_expiry=keepalive,
+    )
+    configure_parsing(workers=parse_workers)
+    configure_browser(max_pages=render_concurrency)
+    
+    def make_scraper(company: Company, previous: dict[str, JobRecord]):
+        return get_scraper(
+            company,
+            full=full,
+            detail_concurrency=detail_concurrency,
+            previous=previous,
+        )
+    
+    with JobStore(store_path) as job_store:
+        schedule = RefreshSchedule(
+            list(all_companies.values()),
+            saved=job_store.load_schedule(),
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        
+        async def run():
+            client = AsyncConvexClient(store=job_store) if push else None
+            try:
+                await ScrapeDaemon(
+                    all_companies,
+                    job_store,
+                    schedule,
+                    make_scraper,
+                    client=client,
+                    roles=role_filters,
+                    concurrency=concurrency,
+                    host_concurrency=host_concurrency,
+                    parse_concurrency=parse_concurrency,
+                    queue_size=queue_size,
+                    push_concurrency=push_concurrency,
+                    max_refreshes=max_refreshes,
+                    log=console.log,
+                ).run()
+            finally:
+                if client:
+                    await client.close()
         
-        asyncio.run(push_to_convex())
+        mode_msg = " [yellow](full mode)[/yellow]" if full else ""
+        console.log(f"Refreshing {len(all_companies)} companies, one every {interval / len(all_companies):.0f}s on average{mode_msg}")
+        asyncio.run(run())
+
+
+@main.command("jobs")
+@click.option("--store", "store_path", type=click.Path(dir_okay=False, exists=True), default=DEFAULT_STORE_PATH, show_default=True, envvar="TIERJOBS_STORE", help="Local SQLite job store")
+@click.option("--company", "-c", "company_slug", help="Only jobs from this company slug")
+@click.option("--tier", "-t", "tiers", multiple=True, help="Only jobs from specific tiers")
+@click.option("--role", "-r", "roles", multiple=True, help=f"Filter by role type ({ROLE_HELP})")
+@click.option("--level", "-l", "levels", multiple=True, help="Filter by level (e.g., intern, new_grad)")
+@click.option("--remote", is_flag=True, default=None, help="Only remote jobs")
+@click.option("--limit", type=click.IntRange(min=1), default=50, show_default=True, help="Max jobs to show")
+def jobs_command(store_path: str, company_slug: str | None, tiers: tuple[str, ...], roles: tuple[str, ...], levels: tuple[str, ...], remote: bool | None, limit: int):
+    """List jobs from the local job store.
     
-    # Save
-    with open(output, "w") as f:
-        json.dump([job.model_dump() for job in all_jobs], f, indent=2, default=str)
-    console.print(f"Saved to {output}")
+    Examples:
+    
+        tierjobs jobs --role swe --level intern
+        
+        tierjobs jobs -c anthropic
+    """
+    role_filters = validate_roles(roles)
+    if role_filters is None:
+        return
+    
+    with JobStore(store_path) as job_store:
+        jobs = list(job_store.query(
+            company_slug=company_slug,
+            tiers=list(tiers),
+            job_types=role_filters,
+            levels=list(levels),
+            remote=remote,
+            limit=limit,
+        ))
+        total = job_store.count()
+    
+    print_jobs_table(jobs, f"Jobs in {store_path}", limit=limit)
+    console.print(f"\nShowing {len(jobs)} of {total} stored jobs")
+
+
+@main.command()
+@click.argument("jobs_file", required=False, type=click.Path(dir_okay=False, exists=True))
+@click.option("--output", "-o", type=click.Path(), help="Where to write the relabelled jobs file (default: overwrite JOBS_FILE)")
+@click.option("--format", "output_format", type=click.Choice(FORMATS), help="Output format (default: ndjson for .ndjson/.jsonl[.gz] files, else json)")
+@click.option("--store", "store_path", type=click.Path(dir_okay=False), default=DEFAULT_STORE_PATH, show_default=True, envvar="TIERJOBS_STORE", help="Local SQLite job store, used when no JOBS_FILE is given")
+@click.option("--workers", "-w", type=click.IntRange(min=1), help="Worker processes (default: CPU count)")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True, help="Jobs per worker task")
+@click.option("--diff", is_flag=True, help="List every job whose labels changed")
+@click.option("--dry-run", is_flag=True, help="Report changes without writing anything")
+def reclassify(jobs_file: str | None, output: str | None, output_format: str | None, store_path: str, workers: int | None, chunk_size: int, diff: bool, dry_run: bool):
+    """Rerun classification and location rules over already scraped jobs.
+    
+    Reads JOBS_FILE (JSON or NDJSON), or the local job store if no file is
+    given, and writes the relabelled jobs back.
+    
+    Examples:
+    
+        tierjobs reclassify --diff --dry-run
+        
+        tierjobs reclassify jobs.json -o jobs.relabelled.json
+    """
+    if not jobs_file and not Path(store_path).exists():
+        raise click.BadParameter(f"File '{store_path}' does not exist.", param_hint="'--store'")
+    job_store = None if jobs_file else JobStore(store_path)
+    source = jobs_file or store_path
+    records = iter_job_dicts(jobs_file) if jobs_file else job_store.iter_records()
+    
+    total = 0
+    field_counts = dict.fromkeys(LABEL_FIELDS, 0)
+    all_records = []
+    changed_records = []
+    diff_rows = []
+    
+    try:
+        with console.status(f"Reclassifying jobs from {source}..."):
+            for record, changes in reclassify_records(records, workers=workers, chunk_size=chunk_size):
+                total += 1
+                if jobs_file:
+                    all_records.append(record)
+                if not changes:
+                    continue
+                changed_records.append(record)
+                for field, (old, new) in changes.items():
+                    field_counts[field] += 1
+                    if diff:
+                        diff_rows.append((record.get("company_slug", ""), record.get("title", ""), field, str(old), str(new)))
+        
+        if diff_rows:
+            table = Table(title=f"Changed labels ({len(changed_records)} jobs)")
+            table.add_column("Company", style="cyan")
+            table.add_column("Title", style="white")
+            table.add_column("Field", style="yellow")
+            table.add_column("Old", style="red")
+            table.add_column("New", style="green")
+            for row in diff_rows:
+                table.add_row(*row)
+            console.print(table)
+        
+        summary = ", ".join(f"{field} {count}" for field, count in field_counts.items() if count)
+        console.print(f"[green]✓[/green] Reclassified {total} jobs: {len(changed_records)} changed" + (f" ({summary})" if summary else ""))
+        
+        if dry_run:
+            return
+        
+        if job_store:
+            if changed_records:
+                job_store.update_records(changed_records)
+                console.print(f"Updated {len(changed_records)} jobs in {store_path}")
+        else:
+            output = output or jobs_file
+            # Only rewriting JOBS_FILE in place can be skipped; a separate -o file is always written
+            if not changed_records and Path(output).resolve() == Path(jobs_file).resolve():
+                return
+            with open_writer(output, output_format) as writer:
+                writer.write([Job(**record) for record in all_records])
+            console.print(f"Saved to {output}")
+    finally:
+        if job_store:
+            job_store.close()
 
 
 if __name__ == "__main__":
@@ -1,79 +1,142 @@
 """Convex database client for TierJobs."""
 
+import asyncio
+import gzip
+import hashlib
 import os
 from datetime import datetime
-from typing import Literal
+from typing import Literal, NamedTuple
 
-import httpx
-
-from .models import Job, Company
+from .models import Company, JobLike
+from .serialization import company_to_convex, dumps, job_to_convex
+from .store import JobStore
 
 
 # Default to the dev deployment URL
 DEFAULT_SITE_URL = "https://greedy-weasel-36.convex.site"
 
+# Convex fields that change every scrape without the job itself changing
+VOLATILE_FIELDS = {"scrapedAt"}
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Bulk upserts are split so each request stays under both limits
+DEFAULT_MAX_BATCH_BYTES = 1_000_000
+DEFAULT_MAX_BATCH_JOBS = 500
+
+# Size of the {"jobs":[...]} wrapper around a batch
+BATCH_OVERHEAD = len(b'{"jobs":[]}')
+
+
+def job_fingerprint(data: dict) -> str:
+    """Stable hash of a job's Convex payload, ignoring volatile fields."""
+    stable = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS}
+    return hashlib.sha256(dumps(stable, sort_keys=True)).hexdigest()
+
+
+class EncodedJob(NamedTuple):
+    """A job's Convex payload serialized once, ready to batch."""
+
+    job_id: str
+    body: bytes
+    fingerprint: str
+
+
+def encode_payload(data: dict) -> EncodedJob:
+    """Serialize a Convex job payload."""
+    body = dumps(data)
+    return EncodedJob(data["jobId"], body, job_fingerprint(data))
+
+
+def plan_batches(
+    items: list[EncodedJob],
+    max_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    max_jobs: int = DEFAULT_MAX_BATCH_JOBS,
+) -> list[list[EncodedJob]]:
+    """Split encoded jobs into batches by serialized size and job count.
+    
+    A single job larger than max_bytes is sent in a batch of its own.
+    """
+    batches = []
+    current: list[EncodedJob] = []
+    size = BATCH_OVERHEAD
+    
+    for item in items:
+        item_size = len(item.body) + 1  # plus separating comma
+        if current and (len(current) >= max_jobs or size + item_size > max_bytes):
+            batches.append(current)
+            current = []
+            size = BATCH_OVERHEAD
+        current.append(item)
+        size += item_size
+    
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_request(items: list[EncodedJob], compress: bool = False) -> tuple[bytes, dict[str, str]]:
+    """Build the request body and headers for a bulk upsert batch."""
+    body = b'{"jobs":[' + b",".join(item.body for item in items) + b"]}"
+    headers = dict(JSON_HEADERS)
+    if compress:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
 
 class ConvexClient:
     """HTTP client for Convex database."""
 
-    def __init__(self, site_url: str | None = None):
+    def __init__(
+        self,
+        site_url: str | None = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_jobs: int = DEFAULT_MAX_BATCH_JOBS,
+        compress: bool = False,
+    ):
         self.site_url = site_url or os.getenv("CONVEX_SITE_URL", DEFAULT_SITE_URL)
-        self.client = httpx.Client(timeout=30.0)
+        import httpx
 
-    def _job_to_convex(self, job: Job) -> dict:
-        """Convert a Job model to Convex format."""
-        return {
-            "jobId": job.id,
-            "company": job.company,
-            "companySlug": job.company_slug,
-            "tier": job.tier,
-            "tierScore": job.tier_score,
-            "title": job.title,
-            "url": job.url,
-            "location": job.location,
-            "remote": job.remote,
-            "level": job.level.value if hasattr(job.level, "value") else job.level,
-            "jobType": job.job_type.value if hasattr(job.job_type, "value") else job.job_type,
-            "team": job.team,
-            "description": job.description,
-            "salaryMin": job.salary_min,
-            "salaryMax": job.salary_max,
-            "postedAt": int(job.posted_at.timestamp() * 1000) if job.posted_at else None,
-            "scrapedAt": int(job.scraped_at.timestamp() * 1000),
-            "score": job.score,
-        }
-
-    def _company_to_convex(self, company: Company) -> dict:
-        """Convert a Company model to Convex format."""
-        return {
-            "name": company.name,
-            "slug": company.slug,
-            "domain": company.domain,
-            "careersUrl": company.careers_url,
-            "tier": company.tier,
-            "tierScore": company.tier_score,
-            "lastScraped": int(company.last_scraped.timestamp() * 1000) if company.last_scraped else None,
-            "jobCount": company.job_count,
-        }
+        self.client = httpx.Client(timeout=30.0)
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_jobs = max_batch_jobs
+        # Gzip request bodies (for endpoints that accept Content-Encoding: gzip)
+        self.compress = compress
 
-    def upsert_job(self, job: Job) -> dict:
+    def upsert_job(self, job: JobLike) -> dict:
         """Upsert a single job."""
-        data = self._job_to_convex(job)
-        response = self.client.post(f"{self.site_url}/jobs", json=data)
+        data = job_to_convex(job)
+        response = self.client.post(f"{self.site_url}/jobs", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
-    def bulk_upsert_jobs(self, jobs: list[Job]) -> dict:
-        """Bulk upsert multiple jobs."""
-        data = {"jobs": [self._job_to_convex(job) for job in jobs]}
-        response = self.client.post(f"{self.site_url}/jobs/bulk", json=data)
-        response.raise_for_status()
-        return response.json()
+    def bulk_upsert_jobs(self, jobs: list[JobLike]) -> dict:
+        """Bulk upsert multiple jobs, split into size-bounded batches.
+        
+        Returns summed created/updated counts plus the number of batches
+        and bytes sent.
+        """
+        items = [encode_payload(job_to_convex(job)) for job in jobs]
+        totals = {"created": 0, "updated": 0, "batches": 0, "bytes": 0}
+        
+        for batch in plan_batches(items, self.max_batch_bytes, self.max_batch_jobs):
+            body, headers = batch_request(batch, self.compress)
+            response = self.client.post(f"{self.site_url}/jobs/bulk", content=body, headers=headers)
+            response.raise_for_status()
+            result = response.json()
+            totals["created"] += result.get("created", 0)
+            totals["updated"] += result.get("updated", 0)
+            totals["batches"] += 1
+            totals["bytes"] += len(body)
+        
+        return totals
 
     def upsert_company(self, company: Company) -> dict:
         """Upsert a company."""
-        data = self._company_to_convex(company)
-        response = self.client.post(f"{self.site_url}/companies", json=data)
+        data = company_to_convex(company)
+        response = self.client.post(f"{self.site_url}/companies", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
@@ -88,7 +151,7 @@ class ConvexClient:
         if last_scraped:
             data["lastScraped"] = int(last_scraped.timestamp() * 1000)
         
-        response = self.client.post(f"{self.site_url}/companies/job-count", json=data)
+        response = self.client.post(f"{self.site_url}/companies/job-count", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
@@ -112,66 +175,99 @@ class ConvexClient:
 
 
 class AsyncConvexClient:
-    """Async HTTP client for Convex database."""
+    """Async HTTP client for Convex database.
+    
+    With a job store, records a fingerprint of every job it pushes so later
+    pushes can send only jobs that are new or changed (see changed_jobs).
+    """
 
-    def __init__(self, site_url: str | None = None):
+    def __init__(
+        self,
+        site_url: str | None = None,
+        store: JobStore | None = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_jobs: int = DEFAULT_MAX_BATCH_JOBS,
+        compress: bool = False,
+    ):
         self.site_url = site_url or os.getenv("CONVEX_SITE_URL", DEFAULT_SITE_URL)
-        self.client = httpx.AsyncClient(timeout=30.0)
+        import httpx
 
-    def _job_to_convex(self, job: Job) -> dict:
-        """Convert a Job model to Convex format."""
-        return {
-            "jobId": job.id,
-            "company": job.company,
-            "companySlug": job.company_slug,
-            "tier": job.tier,
-            "tierScore": job.tier_score,
-            "title": job.title,
-            "url": job.url,
-            "location": job.location,
-            "remote": job.remote,
-            "level": job.level.value if hasattr(job.level, "value") else job.level,
-            "jobType": job.job_type.value if hasattr(job.job_type, "value") else job.job_type,
-            "team": job.team,
-            "description": job.description,
-            "salaryMin": job.salary_min,
-            "salaryMax": job.salary_max,
-            "postedAt": int(job.posted_at.timestamp() * 1000) if job.posted_at else None,
-            "scrapedAt": int(job.scraped_at.timestamp() * 1000),
-            "score": job.score,
-        }
-
-    def _company_to_convex(self, company: Company) -> dict:
-        """Convert a Company model to Convex format."""
-        return {
-            "name": company.name,
-            "slug": company.slug,
-            "domain": company.domain,
-            "careersUrl": company.careers_url,
-            "tier": company.tier,
-            "tierScore": company.tier_score,
-            "lastScraped": int(company.last_scraped.timestamp() * 1000) if company.last_scraped else None,
-            "jobCount": company.job_count,
-        }
+        self.client = httpx.AsyncClient(timeout=30.0)
+        self.store = store
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_jobs = max_batch_jobs
+        # Gzip request bodies (for endpoints that accept Content-Encoding: gzip)
+        self.compress = compress
 
-    async def upsert_job(self, job: Job) -> dict:
+    async def upsert_job(self, job: JobLike) -> dict:
         """Upsert a single job."""
-        data = self._job_to_convex(job)
-        response = await self.client.post(f"{self.site_url}/jobs", json=data)
+        data = job_to_convex(job)
+        response = await self.client.post(f"{self.site_url}/jobs", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
-    async def bulk_upsert_jobs(self, jobs: list[Job]) -> dict:
-        """Bulk upsert multiple jobs."""
-        data = {"jobs": [self._job_to_convex(job) for job in jobs]}
-        response = await self.client.post(f"{self.site_url}/jobs/bulk", json=data)
+    def encode_jobs(self, jobs: list[JobLike]) -> list[EncodedJob]:
+        """Serialize jobs to Convex payloads."""
+        return [encode_payload(job_to_convex(job)) for job in jobs]
+
+    def unpushed(self, items: list[EncodedJob]) -> list[EncodedJob]:
+        """Drop jobs whose payload matches what was last pushed to this deployment.
+        
+        Without a store every job is kept. This queries SQLite; call it
+        through asyncio.to_thread from the event loop.
+        """
+        if not self.store or not items:
+            return items
+        
+        pushed = self.store.pushed_fingerprints(self.site_url, [item.job_id for item in items])
+        return [item for item in items if pushed.get(item.job_id) != item.fingerprint]
+
+    async def changed_jobs(self, jobs: list[JobLike]) -> list[JobLike]:
+        """Jobs whose payload differs from what was last pushed to this deployment."""
+        unpushed = await asyncio.to_thread(self.unpushed, self.encode_jobs(jobs))
+        changed = {item.job_id for item in unpushed}
+        return [job for job in jobs if job.id in changed]
+
+    async def post_batch(self, items: list[EncodedJob]) -> dict:
+        """Send one bulk upsert request for already-encoded jobs.
+        
+        Returns Convex's response with the number of bytes sent added.
+        """
+        body, headers = batch_request(items, self.compress)
+        response = await self.client.post(f"{self.site_url}/jobs/bulk", content=body, headers=headers)
         response.raise_for_status()
-        return response.json()
+        
+        # Only record fingerprints once Convex has accepted the batch
+        if self.store:
+            await asyncio.to_thread(
+                self.store.mark_pushed, self.site_url, {item.job_id: item.fingerprint for item in items}
+            )
+        
+        result = response.json()
+        result["bytes"] = len(body)
+        return result
+
+    async def bulk_upsert_jobs(self, jobs: list[JobLike]) -> dict:
+        """Bulk upsert multiple jobs, split into size-bounded batches.
+        
+        Returns summed created/updated counts plus the number of batches
+        and bytes sent.
+        """
+        totals = {"created": 0, "updated": 0, "batches": 0, "bytes": 0}
+        
+        for batch in plan_batches(self.encode_jobs(jobs), self.max_batch_bytes, self.max_batch_jobs):
+            result = await self.post_batch(batch)
+            totals["created"] += result.get("created", 0)
+            totals["updated"] += result.get("updated", 0)
+            totals["batches"] += 1
+            totals["bytes"] += result["bytes"]
+        
+        return totals
 
     async def upsert_company(self, company: Company) -> dict:
         """Upsert a company."""
-        data = self._company_to_convex(company)
-        response = await self.client.post(f"{self.site_url}/companies", json=data)
+        data = company_to_convex(company)
+        response = await self.client.post(f"{self.site_url}/companies", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
@@ -186,7 +282,7 @@ class AsyncConvexClient:
         if last_scraped:
             data["lastScraped"] = int(last_scraped.timestamp() * 1000)
         
-        response = await self.client.post(f"{self.site_url}/companies/job-count", json=data)
+        response = await self.client.post(f"{self.site_url}/companies/job-count", content=dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
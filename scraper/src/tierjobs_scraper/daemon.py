@@ -0,0 +1,220 @@
+"""Long-running scrape daemon.
+
+Keeps one HTTP transport and parse pool open for its whole life and
+refreshes companies as the RefreshSchedule says they're due. Each refresh
+runs the due companies through the scrape pipeline in incremental mode
+against the job store, and each company is rescheduled as soon as its own
+scrape finishes. Companies that come due meanwhile start another refresh
+(up to `max_refreshes` at once), so one slow board doesn't hold up the
+rest. Jobs whose payload changed since they were last pushed go to Convex
+as they come through, followed by the company's job count and scrape
+time. SIGTERM or SIGINT lets the refreshes in progress finish, then shuts
+down; a second signal cancels them.
+"""
+
+import asyncio
+import signal
+import time
+from typing import Callable
+
+from .browser import close_browser_pool
+from .convex_client import AsyncConvexClient
+from .models import Company, JobRecord
+from .parsing import close_parse_pool
+from .pipeline import (
+    CompanyRun,
+    ScrapePipeline,
+    PushSink,
+    Sink,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_HOST_CONCURRENCY,
+    DEFAULT_PARSE_CONCURRENCY,
+    DEFAULT_QUEUE_SIZE,
+)
+from .push import PushPipeline, DEFAULT_MAX_IN_FLIGHT
+from .scheduler import RefreshSchedule
+from .scrapers.base import BaseScraper
+from .store import JobStore
+from .transport import close_transport
+
+
+# Longest the daemon sleeps before looking at the schedule again
+MAX_IDLE = 60.0
+
+# Refreshes running at once, each with its own pipeline
+DEFAULT_MAX_REFRESHES = 4
+
+ScraperFactory = Callable[[Company, dict[str, JobRecord]], BaseScraper]
+
+
+class ScrapeDaemon:
+    """Refreshes companies on their own schedules until stopped.
+
+    Usage:
+        daemon = ScrapeDaemon(companies, store, schedule, make_scraper)
+        await daemon.run()
+    """
+
+    def __init__(
+        self,
+        companies: dict[str, Company],
+        store: JobStore,
+        schedule: RefreshSchedule,
+        make_scraper: ScraperFactory,
+        client: AsyncConvexClient | None = None,
+        roles: list[str] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        parse_concurrency: int = DEFAULT_PARSE_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        push_concurrency: int = DEFAULT_MAX_IN_FLIGHT,
+        max_refreshes: int = DEFAULT_MAX_REFRESHES,
+        log: Callable[[str], None] = print,
+    ):
+        self.companies = companies
+        self.store = store
+        self.schedule = schedule
+        self.make_scraper = make_scraper
+        self.client = client
+        self.roles = roles
+        self.concurrency = concurrency
+        self.host_concurrency = host_concurrency
+        self.parse_concurrency = parse_concurrency
+        self.queue_size = queue_size
+        self.push_concurrency = push_concurrency
+        self.max_refreshes = max(1, max_refreshes)
+        self.log = log
+
+        self.refreshes = 0
+        self.stopping = asyncio.Event()
+        self.running: set[asyncio.Task] = set()
+
+    def stop(self):
+        """Finish the refreshes in progress and exit; when already stopping, cancel them."""
+        if self.stopping.is_set():
+            if self.running:
+                self.log("Cancelling the refreshes in progress")
+                for task in self.running:
+                    task.cancel()
+            return
+        self.log("Stopping after the refreshes in progress")
+        self.stopping.set()
+
+    async def run(self):
+        """Refresh due companies until stop() is called, then clean up."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
+
+        try:
+            while not self.stopping.is_set():
+                slugs = self.schedule.due() if len(self.running) < self.max_refreshes else []
+                if not slugs:
+                    await self._idle()
+                    continue
+
+                task = asyncio.create_task(self._run_refresh(slugs))
+                self.running.add(task)
+                task.add_done_callback(self.running.discard)
+        finally:
+            if self.running:
+                await asyncio.wait(self.running)
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(sig)
+            await close_transport()
+            await close_browser_pool()
+            close_parse_pool()
+            self.store.save_schedule(self.schedule.snapshot())
+            self.log(f"Stopped after {self.refreshes} refreshes")
+
+    async def _idle(self):
+        """Wait until a company comes due, a refresh finishes or stop() is called."""
+        next_due = self.schedule.next_due()
+        if next_due is None or len(self.running) >= self.max_refreshes:
+            delay = MAX_IDLE
+        else:
+            delay = min(MAX_IDLE, max(0.0, next_due - time.time()))
+        stopping = asyncio.create_task(self.stopping.wait())
+        try:
+            await asyncio.wait({stopping, *self.running}, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopping.cancel()
+
+    async def _run_refresh(self, slugs: list[str]):
+        try:
+            await self.refresh(slugs)
+        except Exception as e:
+            self.log(f"Refresh failed: {e}")
+
+    def _record(self, run: CompanyRun):
+        """Reschedule a company as soon as its scrape is through the pipeline."""
+        if run.success:
+            changed = self.schedule.changed(run.slug, run.jobs_new, run.jobs_updated, run.jobs_found)
+            self.schedule.record(run.slug, changed, run.jobs_found)
+        else:
+            self.schedule.record_failure(run.slug)
+            self.log(f"{run.scraper.company.name}: failed: {run.error}")
+
+    async def refresh(self, slugs: list[str]):
+        """Scrape some companies once, push what changed and reschedule them."""
+        recorded: set[str] = set()
+
+        def finished(run: CompanyRun):
+            self._record(run)
+            recorded.add(run.slug)
+
+        push = None
+        try:
+            # Loading previous jobs scans the store; keep it off the event loop
+            # so other refreshes and pushes carry on meanwhile
+            scrapers = []
+            for slug in slugs:
+                previous = await asyncio.to_thread(self.store.jobs_for_company, slug)
+                scrapers.append(self.make_scraper(self.companies[slug], previous))
+
+            sinks: list[Sink] = []
+            if self.client:
+                if await self.client.health_check():
+                    push = PushPipeline(self.client, max_in_flight=self.push_concurrency)
+                    sinks.append(PushSink(push))
+                else:
+                    self.log("Convex unreachable, not pushing this refresh")
+
+            pipeline = ScrapePipeline(
+                scrapers,
+                store=self.store,
+                roles=self.roles,
+                sinks=sinks,
+                concurrency=self.concurrency,
+                host_concurrency=self.host_concurrency,
+                parse_concurrency=self.parse_concurrency,
+                queue_size=self.queue_size,
+                on_done=finished,
+            )
+            runs = await pipeline.run()
+        except Exception:
+            # Try the companies it didn't get through again later rather
+            # than in a tight loop
+            for slug in slugs:
+                if slug not in recorded:
+                    self.schedule.record_failure(slug)
+            raise
+
+        push_stats = await push.close() if push else None
+        await asyncio.to_thread(self.store.save_schedule, self.schedule.snapshot(slugs))
+        self.refreshes += 1
+
+        changed = sum(run.jobs_new + run.jobs_updated for run in runs if run.success)
+        message = f"Refreshed {len(runs)} companies: {changed} new or updated jobs"
+        if push_stats:
+            message += (
+                f", pushed {push_stats['created']} created, {push_stats['updated']} updated, "
+                f"{push_stats['companies']} job counts"
+            )
+        next_due = self.schedule.next_due()
+        if next_due is not None:
+            message += f"; next refresh in {max(0, int(next_due - time.time()))}s"
+        self.log(message)
+        if push_stats:
+            for error in push_stats["errors"]:
+                self.log(f"Push error: {error}")
@@ -0,0 +1,116 @@
+"""HTML to plain text for job descriptions.
+
+Produces the same text as BeautifulSoup's
+`get_text(separator="\\n", strip=True)` with the html.parser builder, but
+with a single regex pass over the markup instead of building a tree. Only
+well-formed markup takes the fast path. Anything the tokenizer isn't sure
+it reads the same way html.parser does (stray "<", raw-text elements like
+<script>, CDATA, numeric character references, odd comments) is handed to
+BeautifulSoup.
+"""
+
+import html
+import re
+from html.entities import html5
+
+
+# Start tags with well-formed attributes, end tags and plain comments
+_TOKEN_RE = re.compile(
+    r"""<(?:
+        [a-zA-Z][-.:a-zA-Z0-9]*
+        (?:\s+[a-zA-Z_:][-.:a-zA-Z0-9_]*(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*
+        \s*/?>
+      | /[a-zA-Z][-.:a-zA-Z0-9]*\s*>
+      | !--(?P<comment>.*?)-->
+    )""",
+    re.S | re.X,
+)
+
+# Markup the fast path doesn't model
+_NEEDS_SOUP_RE = re.compile(
+    r"<(?:[!?](?!--)|/?(?:script|style|template|rt|rp|textarea|title|xmp|iframe"
+    r"|noembed|noframes|noscript|plaintext)\b)|&#",
+    re.I,
+)
+
+# Named character references as html.parser reports them (no semicolon)
+_ENTITY_RE = re.compile(r"&([a-zA-Z][-.a-zA-Z0-9]*);?")
+_TRAILING_ENTITY_RE = re.compile(r"&[a-zA-Z][-.a-zA-Z0-9]*;?$")
+
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
+def _entity_table() -> dict[str, str]:
+    """Entity names without semicolons, as BeautifulSoup resolves them."""
+    table: dict[str, str] = {}
+    for name, character in sorted(html5.items()):
+        table.setdefault(name.removesuffix(";"), character)
+    return table
+
+
+_ENTITIES = _entity_table()
+
+
+def _replace_entity(match: re.Match) -> str:
+    name = match.group(1)
+    return _ENTITIES.get(name, f"&{name}")
+
+
+class _FallBack(Exception):
+    """Markup the fast path can't handle exactly."""
+
+
+def _fast_strings(markup: str) -> list[str]:
+    """Stripped text nodes of well-formed markup, in document order."""
+    strings = []
+    pos = 0
+
+    def add(text: str):
+        if "<" in text:
+            raise _FallBack
+        if "&" in text:
+            text = _ENTITY_RE.sub(_replace_entity, text)
+        text = text.strip()
+        if text:
+            strings.append(text)
+
+    for match in _TOKEN_RE.finditer(markup):
+        comment = match.group("comment")
+        # html.parser ends comments at "--" followed by ">" (with optional
+        # whitespace), and Python versions differ on "<!-->" and "<!--->"
+        if comment is not None and ("--" in comment or comment[:1] in (">", "-")):
+            raise _FallBack
+        if match.start() > pos:
+            add(markup[pos:match.start()])
+        pos = match.end()
+
+    tail = markup[pos:]
+    # html.parser treats an entity at the very end of the input specially
+    if _TRAILING_ENTITY_RE.search(tail):
+        raise _FallBack
+    add(tail)
+    return strings
+
+
+def _soup_text(markup: str) -> str:
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(markup, "html.parser").get_text(separator="\n", strip=True)
+
+
+def extract_text(markup: str) -> str:
+    """Text of an HTML fragment, one text node per line."""
+    if not _NEEDS_SOUP_RE.search(markup):
+        try:
+            return "\n".join(_fast_strings(markup))
+        except _FallBack:
+            pass
+    return _soup_text(markup)
+
+
+def html_to_text(content: str) -> str:
+    """Clean text from entity-escaped HTML such as Greenhouse job content."""
+    # First decode HTML entities (&lt; -> <, etc.)
+    text = extract_text(html.unescape(content))
+    # Clean up multiple newlines
+    return _MULTI_NEWLINE_RE.sub("\n\n", text)
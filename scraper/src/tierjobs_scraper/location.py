@@ -1,9 +1,16 @@
 """Location normalization utilities.
 
 Provides consistent city/location names across job listings.
+
+The lookup tables below are compiled once at import: city aliases go into
+a prefix trie, the remote patterns are precompiled, and resolve_location()
+returns the normalized name, remote flag and remote region together from
+a bounded cache, so each distinct location string is only worked out once.
 """
 
 import re
+from functools import lru_cache
+from typing import NamedTuple
 
 # Common city abbreviations and mappings
 CITY_MAPPINGS = {
@@ -75,6 +82,135 @@ US_STATES = {
 }
 
 
+# Remote region spellings collapsed to one label
+REMOTE_REGIONS = {
+    "united states": "US",
+    "usa": "US",
+    "us": "US",
+    "united kingdom": "UK",
+    "uk": "UK",
+    "emea": "EMEA",
+    "apac": "APAC",
+}
+
+# Other phrases that count as remote/flexible work
+FLEXIBLE_INDICATORS = ("hybrid", "flexible", "work from home", "wfh")
+
+# Max distinct location strings remembered
+CACHE_SIZE = 16384
+
+REMOTE_PREFIX_RE = re.compile(r'^remote\s*[-–—/]\s*(.+)$', re.IGNORECASE)
+REMOTE_REGION_RE = re.compile(r'remote\s*[-–—/]\s*(\w+)')
+
+# Second comma-separated part that marks a US "City, State" location. Only
+# full lowercase state names can match since the part is lowercased first.
+_STATE_NAMES = frozenset(US_STATES) | frozenset(US_STATES.values())
+
+
+class CityTrie:
+    """Character trie over city aliases for prefix lookups.
+
+    When several aliases are prefixes of the same string, the one listed
+    first in the mapping wins, matching a scan over the mapping in order.
+    """
+
+    _END = ""
+
+    def __init__(self, mappings: dict[str, str]):
+        self.root: dict = {}
+        for index, (alias, name) in enumerate(mappings.items()):
+            node = self.root
+            for char in alias:
+                node = node.setdefault(char, {})
+            node.setdefault(self._END, (index, name))
+
+    def match_prefix(self, text: str) -> str | None:
+        """Name for the earliest-listed alias that `text` starts with."""
+        node = self.root
+        best = None
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(self._END)
+            if found and (best is None or found[0] < best[0]):
+                best = found
+        return best[1] if best else None
+
+
+CITY_TRIE = CityTrie(CITY_MAPPINGS)
+
+
+class LocationInfo(NamedTuple):
+    """Everything derived from a raw location string."""
+
+    normalized: str | None
+    remote: bool
+    remote_region: str | None
+
+    @property
+    def city(self) -> str | None:
+        """Normalized city, or None for remote locations."""
+        if not self.normalized or self.normalized.startswith("Remote"):
+            return None
+        return self.normalized
+
+
+def _normalize(loc: str) -> str:
+    """Normalize a non-empty location string (see normalize_location)."""
+    stripped = loc.strip()
+
+    # Handle remote variations
+    remote_match = REMOTE_PREFIX_RE.match(stripped)
+    if remote_match:
+        region = remote_match.group(1).strip()
+        simple = REMOTE_REGIONS.get(region.lower())
+        return f"Remote ({simple or region})"
+
+    full_lower = stripped.lower()
+    if full_lower == "remote":
+        return "Remote"
+
+    # Split by comma to get city part
+    parts = [p.strip() for p in stripped.split(",")]
+
+    # Check direct city mapping, then any alias the full location starts with
+    city = CITY_MAPPINGS.get(parts[0].lower()) or CITY_TRIE.match_prefix(full_lower)
+    if city:
+        return city
+
+    # "City, State" with an unknown city: return the city cleaned up
+    if len(parts) >= 2 and parts[1].lower() in _STATE_NAMES:
+        return parts[0].title()
+
+    # Return original if no transformation needed
+    return loc
+
+
+def _remote_info(loc: str) -> tuple[bool, str | None]:
+    """Remote flag and region for a non-empty location string."""
+    loc_lower = loc.lower()
+
+    # Clear remote indicators
+    if "remote" in loc_lower:
+        match = REMOTE_REGION_RE.search(loc_lower)
+        return True, match.group(1).upper() if match else None
+
+    # Hybrid/flexible indicators
+    if any(x in loc_lower for x in FLEXIBLE_INDICATORS):
+        return True, None
+
+    return False, None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def resolve_location(location: str | None) -> LocationInfo:
+    """Normalize a location and extract its remote info in one lookup."""
+    if not location:
+        return LocationInfo(None, False, None)
+    return LocationInfo(_normalize(location), *_remote_info(location))
+
+
 def normalize_location(location: str | None) -> str | None:
     """Normalize a location string to a consistent format.
     
@@ -84,54 +220,7 @@ def normalize_location(location: str | None) -> str | None:
         "Remote - US" -> "Remote (US)"
         "London, United Kingdom" -> "London"
     """
-    if not location:
-        return None
-    
-    original = location
-    loc = location.strip()
-    
-    # Handle remote variations
-    remote_match = re.match(r'^remote\s*[-–—/]\s*(.+)$', loc, re.IGNORECASE)
-    if remote_match:
-        region = remote_match.group(1).strip()
-        # Simplify region
-        if region.lower() in ["united states", "usa", "us"]:
-            return "Remote (US)"
-        elif region.lower() in ["united kingdom", "uk"]:
-            return "Remote (UK)"
-        elif region.lower() == "emea":
-            return "Remote (EMEA)"
-        elif region.lower() == "apac":
-            return "Remote (APAC)"
-        return f"Remote ({region})"
-    
-    if loc.lower() == "remote":
-        return "Remote"
-    
-    # Split by comma to get city part
-    parts = [p.strip() for p in loc.split(",")]
-    city_part = parts[0].lower()
-    
-    # Check direct city mapping
-    if city_part in CITY_MAPPINGS:
-        return CITY_MAPPINGS[city_part]
-    
-    # Check if full location maps
-    full_lower = loc.lower()
-    for city, abbrev in CITY_MAPPINGS.items():
-        if full_lower.startswith(city):
-            return abbrev
-    
-    # Strip state/country suffix if city is recognized
-    if len(parts) >= 2:
-        state_or_country = parts[1].lower().strip()
-        # If second part is a US state, we've already captured city
-        if state_or_country in US_STATES or state_or_country in US_STATES.values():
-            # City wasn't in our mapping, return as-is but cleaned
-            return parts[0].title()
-    
-    # Return original if no transformation needed
-    return original
+    return resolve_location(location).normalized
 
 
 def extract_remote_info(location: str | None) -> tuple[bool, str | None]:
@@ -140,34 +229,10 @@ def extract_remote_info(location: str | None) -> tuple[bool, str | None]:
     Returns:
         (is_remote, remote_region) - e.g., (True, "US") or (False, None)
     """
-    if not location:
-        return False, None
-    
-    loc_lower = location.lower()
-    
-    # Clear remote indicators
-    if "remote" in loc_lower:
-        # Try to extract region
-        match = re.search(r'remote\s*[-–—/]\s*(\w+)', loc_lower)
-        if match:
-            return True, match.group(1).upper()
-        return True, None
-    
-    # Hybrid/flexible indicators
-    if any(x in loc_lower for x in ["hybrid", "flexible", "work from home", "wfh"]):
-        return True, None
-    
-    return False, None
+    info = resolve_location(location)
+    return info.remote, info.remote_region
 
 
 def get_city_from_location(location: str | None) -> str | None:
     """Extract just the city name from a location string."""
-    if not location:
-        return None
-    
-    # Normalize first
-    normalized = normalize_location(location)
-    if not normalized or normalized.startswith("Remote"):
-        return None
-    
-    return normalized
+    return resolve_location(location).city
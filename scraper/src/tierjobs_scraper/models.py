@@ -1,9 +1,12 @@
 """Data models for job listings."""
 
+import sys
 from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .blobs import BlobRef, TEXT_FIELDS
+
 
 class JobLevel(str, Enum):
     INTERN = "intern"
@@ -80,6 +83,121 @@ class Job(BaseModel):
         use_enum_values = True
 
 
+# Job fields whose values repeat across many jobs, interned to share one copy
+INTERNED_FIELDS = frozenset({
+    "company", "company_slug", "tier", "job_type", "level",
+    "location", "location_normalized", "team", "salary_currency",
+})
+
+
+# (default, default_factory) for each optional Job field
+_JOB_DEFAULTS = {
+    name: (field.default, field.default_factory)
+    for name, field in Job.model_fields.items()
+    if not field.is_required()
+}
+
+_JOB_FIELDS = tuple(Job.model_fields)
+_JOB_FIELD_SET = frozenset(_JOB_FIELDS)
+_LIST_FIELDS = frozenset({"departments", "offices"})
+_MISSING = object()
+
+
+def _text_field(name: str) -> property:
+    """Description field that may hold a BlobRef, loaded when read."""
+    slot = f"_{name}"
+    
+    def get(self):
+        value = getattr(self, slot)
+        return value.load() if type(value) is BlobRef else value
+    
+    def set(self, value):
+        setattr(self, slot, value)
+    
+    return property(get, set)
+
+
+class JobRecord:
+    """Compact, unvalidated job used inside the scrape pipeline.
+    
+    Same fields as Job, stored in __slots__ with repeated strings interned.
+    Scrapers build these from trusted, already-typed values, so nothing is
+    validated; convert with to_job()/from_job() where a Job is needed.
+    Descriptions may be BlobRefs into the job store and are only loaded
+    when read.
+    """
+    
+    __slots__ = tuple(
+        f"_{name}" if name in TEXT_FIELDS else name for name in _JOB_FIELDS
+    )
+    
+    description_html = _text_field("description_html")
+    description = _text_field("description")
+    
+    def __init__(self, **fields):
+        unknown = fields.keys() - _JOB_FIELD_SET
+        if unknown:
+            raise TypeError(f"Unknown job field(s): {', '.join(sorted(unknown))}")
+        for name in _JOB_FIELDS:
+            value = fields.get(name, _MISSING)
+            if value is _MISSING:
+                if name not in _JOB_DEFAULTS:
+                    raise TypeError(f"Missing required job field: {name}")
+                default, factory = _JOB_DEFAULTS[name]
+                value = factory() if factory else default
+            elif value is not None and name in INTERNED_FIELDS:
+                value = sys.intern(value.value if isinstance(value, Enum) else value)
+            elif value and name in _LIST_FIELDS:
+                value = [sys.intern(v) for v in value]
+            setattr(self, name, value)
+    
+    @classmethod
+    def from_job(cls, job: "JobLike", **changes) -> "JobRecord":
+        """Build a record from a Job (or another record), applying `changes`.
+        
+        Descriptions that are still BlobRefs are carried over unloaded.
+        """
+        if isinstance(job, JobRecord):
+            fields = {name: job.text_ref(name) if name in TEXT_FIELDS else getattr(job, name) for name in _JOB_FIELDS}
+        else:
+            fields = {name: getattr(job, name) for name in _JOB_FIELDS}
+        return cls(**{**fields, **changes})
+    
+    def text_ref(self, name: str) -> str | BlobRef | None:
+        """A description field as stored, without loading it."""
+        return getattr(self, f"_{name}")
+    
+    def to_job(self) -> Job:
+        """Convert to a Job without revalidating."""
+        return Job.model_construct(**self.as_dict())
+    
+    def as_dict(self) -> dict:
+        """Field values as a dict, in Job field order."""
+        return {name: getattr(self, name) for name in _JOB_FIELDS}
+    
+    def __reduce__(self):
+        # Rebuilt through __init__ so strings are interned again after
+        # crossing a process boundary. BlobRefs are loaded, since the store
+        # they point into doesn't cross with them.
+        return (_rebuild_record, (tuple(getattr(self, name) for name in _JOB_FIELDS),))
+    
+    def __eq__(self, other):
+        if not isinstance(other, JobRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+    
+    def __repr__(self):
+        return f"JobRecord(id={self.id!r}, title={self.title!r})"
+
+
+def _rebuild_record(values: tuple) -> JobRecord:
+    return JobRecord(**dict(zip(_JOB_FIELDS, values)))
+
+
+# Anything the serializers, store and writers accept
+JobLike = Job | JobRecord
+
+
 class Company(BaseModel):
     """A company we scrape."""
     
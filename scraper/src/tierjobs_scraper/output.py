@@ -0,0 +1,120 @@
+"""Job output files.
+
+Supports the original pretty-printed JSON array and streaming NDJSON
+(one job per line, optionally gzipped). NDJSON writers flush each
+company's jobs as soon as they are written, so a crash loses at most the
+company in progress and readers can stream the file line by line.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import IO, Iterator
+
+from .models import Job, JobLike
+from .serialization import dumps, job_to_record, loads
+
+
+FORMATS = ("json", "ndjson")
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def infer_format(path: str | Path) -> str:
+    """Guess the output format from a file name."""
+    name = str(path).lower().removesuffix(".gz")
+    return "ndjson" if name.endswith(NDJSON_SUFFIXES) else "json"
+
+
+def _open(path: str | Path, mode: str) -> IO:
+    """Open a file, transparently gzipped if the name ends in .gz."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class JobWriter:
+    """Writes jobs to a file in batches."""
+
+    # Whether jobs reach the file as they're written rather than on close
+    streaming = False
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.count = 0
+
+    def write(self, jobs: list[JobLike]):
+        """Write a batch of jobs."""
+        raise NotImplementedError
+
+    def close(self):
+        """Finish the file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class JSONWriter(JobWriter):
+    """Pretty-printed JSON array, written in one go on close."""
+
+    def __init__(self, path: str | Path):
+        super().__init__(path)
+        self.jobs: list[JobLike] = []
+
+    def write(self, jobs: list[JobLike]):
+        self.jobs.extend(jobs)
+        self.count += len(jobs)
+
+    def close(self):
+        with _open(self.path, "wt") as f:
+            json.dump([job_to_record(job) for job in self.jobs], f, indent=2, default=str)
+        self.jobs = []
+
+
+class NDJSONWriter(JobWriter):
+    """One JSON object per line, flushed after every batch."""
+
+    streaming = True
+
+    def __init__(self, path: str | Path):
+        super().__init__(path)
+        self.file = _open(self.path, "wb")
+
+    def write(self, jobs: list[JobLike]):
+        self.file.writelines(dumps(job_to_record(job)) + b"\n" for job in jobs)
+        self.file.flush()
+        self.count += len(jobs)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def open_writer(path: str | Path, fmt: str | None = None) -> JobWriter:
+    """Open a job writer, inferring the format from the path if not given."""
+    fmt = fmt or infer_format(path)
+    if fmt == "ndjson":
+        return NDJSONWriter(path)
+    return JSONWriter(path)
+
+
+def iter_job_dicts(path: str | Path) -> Iterator[dict]:
+    """Stream raw job dicts from a JSON array or NDJSON file."""
+    if infer_format(path) == "ndjson":
+        with _open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+        return
+
+    with _open(path, "rb") as f:
+        yield from loads(f.read())
+
+
+def read_jobs(path: str | Path) -> Iterator[Job]:
+    """Stream jobs from a JSON array or NDJSON file."""
+    for data in iter_job_dicts(path):
+        yield Job(**data)
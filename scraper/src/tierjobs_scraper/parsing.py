@@ -0,0 +1,141 @@
+"""Job parsing off the event loop.
+
+Turning full API payloads into jobs (HTML to text, salary extraction,
+classification) is CPU-bound. ParsePool sends payloads to a
+ProcessPoolExecutor in batches so it runs on every core while fetching
+stays on the event loop. With workers=0 parsing runs inline on the event
+loop, which is handy for debugging and for tiny runs; small batches are
+parsed inline too, where a round trip to a worker costs more than it saves.
+
+Workers are started with forkserver (or spawn where that isn't available)
+rather than fork: by the time the pool starts, the process already runs
+threads (asyncio.to_thread, the store), and forking a process with threads
+can leave the child holding locks nobody will release.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from .models import Company, JobRecord
+
+if TYPE_CHECKING:
+    from .scrapers.base import BaseScraper
+
+
+DEFAULT_BATCH_SIZE = 25
+
+# Fewer payloads than this are parsed inline
+DEFAULT_INLINE_BELOW = 8
+
+# Scrapers rebuilt inside a worker, keyed by (class, company slug, args)
+_worker_scrapers: dict[tuple, "BaseScraper"] = {}
+
+
+def default_workers() -> int:
+    """Worker processes to use when not configured: one per core."""
+    return os.cpu_count() or 1
+
+
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for worker processes that is safe once threads exist."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _parse_batch(
+    scraper_cls: type["BaseScraper"],
+    company: Company,
+    scraper_args: dict,
+    payloads: list[dict],
+    options: dict,
+) -> list[JobRecord | None]:
+    """Worker entry point: parse payloads with a scraper rebuilt in this process."""
+    key = (scraper_cls, company.slug, tuple(sorted(scraper_args.items())))
+    scraper = _worker_scrapers.get(key)
+    if scraper is None:
+        scraper = _worker_scrapers[key] = scraper_cls(company, **scraper_args)
+    return [scraper.parse_job(payload, **options) for payload in payloads]
+
+
+class ParsePool:
+    """Parses raw job payloads in worker processes.
+
+    Usage:
+        jobs = await pool.parse(scraper, payloads, full=True)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        inline_below: int = DEFAULT_INLINE_BELOW,
+    ):
+        self.workers = default_workers() if workers is None else workers
+        self.batch_size = max(1, batch_size)
+        self.inline_below = inline_below
+        self.executor: ProcessPoolExecutor | None = None
+
+    @property
+    def inline(self) -> bool:
+        """Whether parsing runs on the event loop instead of in workers."""
+        return self.workers == 0
+
+    async def parse(self, scraper: "BaseScraper", payloads: list[dict], **options) -> list[JobRecord | None]:
+        """Parse payloads with scraper.parse_job, keeping their order.
+
+        Failed payloads come back as None, as parse_job returns them.
+        """
+        if self.inline or len(payloads) < self.inline_below:
+            return [scraper.parse_job(payload, **options) for payload in payloads]
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=worker_context())
+
+        loop = asyncio.get_running_loop()
+        args = scraper.worker_args()
+        batches = [
+            payloads[i:i + self.batch_size]
+            for i in range(0, len(payloads), self.batch_size)
+        ]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.executor, _parse_batch, type(scraper), scraper.company, args, batch, options
+            )
+            for batch in batches
+        ))
+        return [job for batch in results for job in batch]
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self.executor is not None:
+            executor, self.executor = self.executor, None
+            executor.shutdown(cancel_futures=True)
+
+
+_shared: ParsePool | None = None
+_shared_options: dict = {}
+
+
+def configure_parsing(**options):
+    """Set options used when the shared parse pool is next created."""
+    global _shared_options
+    _shared_options = options
+
+
+def get_parse_pool() -> ParsePool:
+    """Get the shared parse pool, creating it on first use."""
+    global _shared
+    if _shared is None:
+        _shared = ParsePool(**_shared_options)
+    return _shared
+
+
+def close_parse_pool():
+    """Shut down the shared parse pool's workers, if any were started."""
+    global _shared
+    if _shared is not None:
+        pool, _shared = _shared, None
+        pool.close()
@@ -0,0 +1,412 @@
+"""Staged scrape pipeline.
+
+Jobs flow through fetch → parse → store → role filter → sinks in batches,
+with a bounded asyncio queue in front of every stage. A stage that falls
+behind fills its queue, which blocks the stage before it and eventually
+the fetchers, so a slow sink slows down scraping instead of letting
+batches pile up in memory. Each stage has its own number of workers and
+keeps counters of what went through it.
+
+Classification and location normalization happen in the parse stage:
+create_job derives those labels while building each job, in the parse
+pool's worker processes.
+"""
+
+import asyncio
+import inspect
+import time
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from .models import JobRecord, ScrapeResult
+from .output import JobWriter
+from .push import PushPipeline
+from .scrapers.base import BaseScraper
+from .store import JobStore
+
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_HOST_CONCURRENCY = 4
+
+# Batches in flight to the parse pool
+DEFAULT_PARSE_CONCURRENCY = 8
+
+# Batches waiting in front of each stage
+DEFAULT_QUEUE_SIZE = 16
+
+
+class CompanyRun:
+    """Progress and counts for one scraper going through the pipeline."""
+
+    def __init__(self, scraper: BaseScraper):
+        self.scraper = scraper
+        self.started: datetime | None = None
+        self.finished: datetime | None = None
+        self.error: str | None = None
+
+        self.jobs_found = 0  # after parsing
+        self.jobs_new = 0
+        self.jobs_updated = 0
+        self.jobs_kept = 0  # after the role filter
+
+        self.batches = 0
+        self.pending = 0  # batches not yet through the last stage
+        self.fetched = False  # scraper has no more batches
+
+    @property
+    def slug(self) -> str:
+        return self.scraper.company.slug
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def done(self) -> bool:
+        return self.fetched and self.pending == 0
+
+    def fail(self, error: Exception):
+        """Record the first error; the company's later batches are dropped."""
+        if self.error is None:
+            self.error = str(error)
+
+    def result(self) -> ScrapeResult:
+        end = self.finished or datetime.utcnow()
+        duration = int((end - (self.started or end)).total_seconds() * 1000)
+        if not self.success:
+            return ScrapeResult(
+                company=self.scraper.company.name,
+                success=False,
+                error=self.error,
+                duration_ms=duration,
+            )
+        return ScrapeResult(
+            company=self.scraper.company.name,
+            success=True,
+            jobs_found=self.jobs_found,
+            jobs_new=self.jobs_new,
+            jobs_updated=self.jobs_updated,
+            duration_ms=duration,
+        )
+
+
+class Batch:
+    """Jobs (or raw payloads, before parsing) from one company."""
+
+    __slots__ = ("run", "items", "seq")
+
+    def __init__(self, run: CompanyRun, items: list, seq: int):
+        self.run = run
+        self.items = items
+        # Position within the company, for sinks that need scrape order
+        self.seq = seq
+
+
+StageFn = Callable[[Batch], list | Awaitable[list]]
+
+
+class Stage:
+    """One step of the pipeline, run by `concurrency` workers."""
+
+    def __init__(self, name: str, fn: StageFn | None = None, concurrency: int = 1):
+        self.name = name
+        self.fn = fn
+        self.concurrency = max(1, concurrency)
+
+        # Counters
+        self.batches = 0
+        self.jobs_in = 0
+        self.jobs_out = 0
+        self.errors = 0
+        self.busy = 0.0  # seconds spent working on batches
+        self.max_queued = 0  # most batches ever waiting in front of this stage
+
+    async def process(self, batch: Batch):
+        """Run the stage over a batch, replacing its items with the result."""
+        if not batch.run.success:
+            batch.items = []
+        self.batches += 1
+        self.jobs_in += len(batch.items)
+        if not batch.items or self.fn is None:
+            self.jobs_out += len(batch.items)
+            return
+
+        start = time.perf_counter()
+        try:
+            items = self.fn(batch)
+            if inspect.isawaitable(items):
+                items = await items
+        except Exception as e:
+            self.errors += 1
+            batch.run.fail(e)
+            items = []
+        finally:
+            self.busy += time.perf_counter() - start
+
+        batch.items = items
+        self.jobs_out += len(items)
+
+    def stats(self) -> dict:
+        return {
+            "stage": self.name,
+            "concurrency": self.concurrency,
+            "batches": self.batches,
+            "jobs_in": self.jobs_in,
+            "jobs_out": self.jobs_out,
+            "errors": self.errors,
+            "busy_ms": int(self.busy * 1000),
+            "max_queued": self.max_queued,
+        }
+
+
+class Sink:
+    """Where kept jobs end up. Called from the last stage."""
+
+    async def write(self, batch: Batch):
+        """Take a batch of jobs that passed the role filter."""
+
+    async def company_done(self, run: CompanyRun):
+        """Called once all of a company's batches have been written."""
+
+
+class WriterSink(Sink):
+    """Writes jobs to an output file.
+
+    A company's batches are held until the company is done, so a company
+    that fails part way through is left out entirely and each company's
+    jobs come out in scrape order. Streaming formats then get the company's
+    jobs straight away; otherwise companies are written in `order` on close.
+    """
+
+    def __init__(self, writer: JobWriter, order: list[str]):
+        self.writer = writer
+        self.order = order
+        self.held: dict[str, list[Batch]] = {}
+
+    async def write(self, batch: Batch):
+        self.held.setdefault(batch.run.slug, []).append(batch)
+
+    async def company_done(self, run: CompanyRun):
+        if not run.success:
+            self.held.pop(run.slug, None)
+        elif self.writer.streaming:
+            self._write(self.held.pop(run.slug, []))
+
+    def close(self):
+        # Whatever a streaming writer hasn't had is from unfinished companies
+        if not self.writer.streaming:
+            for slug in self.order:
+                self._write(self.held.pop(slug, []))
+        self.writer.close()
+
+    def _write(self, batches: list[Batch]):
+        for batch in sorted(batches, key=lambda b: b.seq):
+            self.writer.write(batch.items)
+
+
+class CollectSink(Sink):
+    """Keeps every job in memory, per company in scrape order."""
+
+    def __init__(self):
+        self.batches: dict[str, list[Batch]] = {}
+
+    async def write(self, batch: Batch):
+        self.batches.setdefault(batch.run.slug, []).append(batch)
+
+    def jobs(self, slug: str) -> list[JobRecord]:
+        batches = sorted(self.batches.get(slug, []), key=lambda b: b.seq)
+        return [job for batch in batches for job in batch.items]
+
+
+class PushSink(Sink):
+    """Hands jobs to a Convex PushPipeline.
+
+    A company's job count, and when it was scraped, are only updated once
+    the whole company has been scraped successfully.
+    """
+
+    def __init__(self, push: PushPipeline):
+        self.push = push
+
+    async def write(self, batch: Batch):
+        await self.push.add_jobs(batch.run.slug, batch.items)
+
+    async def company_done(self, run: CompanyRun):
+        if run.success:
+            self.push.seal(run.slug, last_scraped=run.finished)
+
+
+class ScrapePipeline:
+    """Runs scrapers through the pipeline stages.
+
+    Usage:
+        pipeline = ScrapePipeline(scrapers, store=store, roles=["swe"], sinks=[sink])
+        runs = await pipeline.run()
+    """
+
+    def __init__(
+        self,
+        scrapers: list[BaseScraper],
+        store: JobStore | None = None,
+        roles: list[str] | None = None,
+        sinks: list[Sink] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        parse_concurrency: int = DEFAULT_PARSE_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        on_done: Callable[[CompanyRun], Awaitable[None] | None] | None = None,
+    ):
+        self.runs = [CompanyRun(scraper) for scraper in scrapers]
+        self.store = store
+        self.roles = set(roles or ())
+        self.sinks = sinks or []
+        self.concurrency = max(1, concurrency)
+        self.host_concurrency = max(1, host_concurrency)
+        self.queue_size = max(1, queue_size)
+        self.on_done = on_done
+
+        # Fetching is driven by the scrapers themselves; this only counts
+        self.fetch = Stage("fetch", concurrency=self.concurrency)
+        self.stages = [Stage("parse", self._parse, parse_concurrency)]
+        if store:
+            # One writer at a time; SQLite serializes them anyway
+            self.stages.append(Stage("store", self._store))
+        self.stages.append(Stage("filter", self._filter))
+        # One worker keeps sink calls for a company in order
+        self.stages.append(Stage("sink", self._sink))
+
+    async def run(self) -> list[CompanyRun]:
+        """Run every scraper to completion; runs come back in scraper order."""
+        queues = [asyncio.Queue(self.queue_size) for _ in self.stages]
+        tasks = [asyncio.create_task(self._fetch_all(queues[0]))]
+        for i, stage in enumerate(self.stages):
+            downstream = (self.stages[i + 1], queues[i + 1]) if i + 1 < len(self.stages) else None
+            tasks.append(asyncio.create_task(self._run_stage(stage, queues[i], downstream)))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.runs
+
+    def stats(self) -> list[dict]:
+        """Counters for every stage, in pipeline order."""
+        return [stage.stats() for stage in (self.fetch, *self.stages)]
+
+    async def _fetch_all(self, queue: asyncio.Queue):
+        global_limit = asyncio.Semaphore(self.concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def fetch_one(run: CompanyRun):
+            # Scrapers without a known host get their own bucket
+            scraper = run.scraper
+            host = scraper.host or scraper.company.slug
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(self.host_concurrency)
+
+            # Take the host slot first so waiting on a busy host doesn't hold
+            # a global slot. Slots stay held while the queue is full, which is
+            # how a slow stage downstream slows the fetchers.
+            async with host_limits[host], global_limit:
+                run.started = datetime.utcnow()
+                batches = scraper.fetch_batches()
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        items = await anext(batches)
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        self.fetch.errors += 1
+                        run.fail(e)
+                        break
+                    finally:
+                        self.fetch.busy += time.perf_counter() - start
+                    self.fetch.jobs_out += len(items)
+                    await self._put(self.stages[0], queue, self._batch(run, items))
+
+                # An empty closing batch, so even a company with nothing
+                # fetched reaches the end of the pipeline and gets finished
+                run.fetched = True
+                await self._put(self.stages[0], queue, self._batch(run, []))
+
+        await asyncio.gather(*(fetch_one(run) for run in self.runs))
+        for _ in range(self.stages[0].concurrency):
+            await queue.put(None)
+
+    def _batch(self, run: CompanyRun, items: list) -> Batch:
+        batch = Batch(run, items, run.batches)
+        run.batches += 1
+        run.pending += 1
+        self.fetch.batches += 1
+        return batch
+
+    async def _put(self, stage: Stage, queue: asyncio.Queue, batch: Batch):
+        await queue.put(batch)
+        stage.max_queued = max(stage.max_queued, queue.qsize())
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        queue: asyncio.Queue,
+        downstream: tuple[Stage, asyncio.Queue] | None,
+    ):
+        async def worker():
+            while (batch := await queue.get()) is not None:
+                await stage.process(batch)
+                if downstream:
+                    await self._put(*downstream, batch)
+                else:
+                    await self._finish_batch(batch)
+
+        await asyncio.gather(*(worker() for _ in range(stage.concurrency)))
+        if downstream:
+            next_stage, next_queue = downstream
+            for _ in range(next_stage.concurrency):
+                await next_queue.put(None)
+
+    async def _finish_batch(self, batch: Batch):
+        run = batch.run
+        run.pending -= 1
+        if not run.done:
+            return
+
+        run.finished = datetime.utcnow()
+        if not self.store:
+            # Without a store, every job counts as new
+            run.jobs_new = run.jobs_found
+        for sink in self.sinks:
+            await sink.company_done(run)
+        if self.on_done:
+            done = self.on_done(run)
+            if inspect.isawaitable(done):
+                await done
+
+    async def _parse(self, batch: Batch) -> list[JobRecord]:
+        jobs = await batch.run.scraper.parse_batch(batch.items)
+        batch.run.jobs_found += len(jobs)
+        return jobs
+
+    async def _store(self, batch: Batch) -> list[JobRecord]:
+        # Sinks serialize every job next, so descriptions stay in memory
+        # rather than being swapped for BlobRefs and read straight back
+        jobs_new, jobs_updated = await asyncio.to_thread(
+            self.store.upsert_jobs, batch.items, release_texts=False
+        )
+        batch.run.jobs_new += jobs_new
+        batch.run.jobs_updated += jobs_updated
+        return batch.items
+
+    def _filter(self, batch: Batch) -> list[JobRecord]:
+        jobs = batch.items
+        if self.roles:
+            jobs = [job for job in jobs if job.job_type in self.roles]
+        batch.run.jobs_kept += len(jobs)
+        return jobs
+
+    async def _sink(self, batch: Batch) -> list[JobRecord]:
+        for sink in self.sinks:
+            await sink.write(batch)
+        return batch.items
@@ -0,0 +1,180 @@
+"""Pipelined Convex push.
+
+Lets scrape-all push each company's jobs while other companies are still
+being scraped. Jobs are packed into batches under the client's byte and
+job-count budget, a bounded number of batches are in flight at once
+through one AsyncConvexClient, and each company's job count is updated as
+soon as all of its batches are acknowledged.
+"""
+
+import asyncio
+from datetime import datetime
+
+from .convex_client import AsyncConvexClient, EncodedJob, BATCH_OVERHEAD
+from .models import JobLike
+
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+class PushPipeline:
+    """Pushes jobs to Convex in the background as companies finish scraping.
+
+    Usage:
+        pipeline = PushPipeline(client)
+        await pipeline.add_company("stripe", jobs)  # once per company
+        await pipeline.close()                      # flush and wait
+
+    or, for jobs that arrive in batches:
+        await pipeline.add_jobs("stripe", batch)    # as often as needed
+        pipeline.seal("stripe")                     # once all are added
+    """
+
+    def __init__(
+        self,
+        client: AsyncConvexClient,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        force: bool = False,
+    ):
+        self.client = client
+        self.slots = asyncio.Semaphore(max(1, max_in_flight))
+        # Push every job, not only those changed since the last push
+        self.force = force
+
+        self.buffer: list[EncodedJob] = []
+        self.buffer_bytes = BATCH_OVERHEAD
+        self.buffer_companies: set[str] = set()
+        self.tasks: set[asyncio.Task] = set()
+
+        # Per-company bookkeeping
+        self.counts: dict[str, int] = {}
+        self.pending: dict[str, int] = {}  # batches sent but not yet acknowledged
+        self.sealed: set[str] = set()  # all jobs added
+        self.failed: set[str] = set()
+        self.finished: set[str] = set()  # job count updated
+        self.scraped_at: dict[str, datetime] = {}  # sent as lastScraped
+
+        # Stats
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.batches = 0
+        self.bytes = 0
+        self.errors: list[str] = []
+
+    async def add_company(self, slug: str, jobs: list[JobLike]):
+        """Queue all of a company's jobs for pushing, then seal it."""
+        await self.add_jobs(slug, jobs)
+        self.seal(slug)
+
+    async def add_jobs(self, slug: str, jobs: list[JobLike]):
+        """Queue some of a company's jobs for pushing; may be called repeatedly.
+
+        Waits for an in-flight slot whenever a batch fills up, so a slow
+        push slows the caller down instead of queueing without bound.
+        """
+        items = await asyncio.to_thread(self.client.encode_jobs, jobs)
+        if not self.force:
+            items = await asyncio.to_thread(self.client.unpushed, items)
+        self.skipped += len(jobs) - len(items)
+        self.counts[slug] = self.counts.get(slug, 0) + len(jobs)
+        self.pending.setdefault(slug, 0)
+
+        for item in items:
+            item_size = len(item.body) + 1
+            if self.buffer and (
+                len(self.buffer) >= self.client.max_batch_jobs
+                or self.buffer_bytes + item_size > self.client.max_batch_bytes
+            ):
+                await self.flush()
+            self.buffer.append(item)
+            self.buffer_bytes += item_size
+            self.buffer_companies.add(slug)
+
+    def seal(self, slug: str, last_scraped: datetime | None = None):
+        """Mark a company as complete; its job count is updated once its jobs are acknowledged.
+
+        `last_scraped` is sent along with the count, defaulting to when the
+        update is made.
+        """
+        if last_scraped:
+            self.scraped_at[slug] = last_scraped
+        self.counts.setdefault(slug, 0)
+        self.pending.setdefault(slug, 0)
+        self.sealed.add(slug)
+        self._maybe_finish(slug)
+
+    async def flush(self):
+        """Send whatever is buffered as one batch."""
+        if not self.buffer:
+            return
+
+        batch, companies = self.buffer, self.buffer_companies
+        self.buffer, self.buffer_companies = [], set()
+        self.buffer_bytes = BATCH_OVERHEAD
+        for slug in companies:
+            self.pending[slug] += 1
+
+        await self.slots.acquire()
+        self._spawn(self._send(batch, companies))
+
+    async def close(self) -> dict:
+        """Flush remaining jobs, wait for every batch and count update, and return stats."""
+        await self.flush()
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks))
+
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "batches": self.batches,
+            "bytes": self.bytes,
+            "companies": len(self.finished),
+            "failed": sorted(self.failed),
+            "errors": self.errors,
+        }
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _send(self, batch: list[EncodedJob], companies: set[str]):
+        try:
+            result = await self.client.post_batch(batch)
+            self.created += result.get("created", 0)
+            self.updated += result.get("updated", 0)
+            self.batches += 1
+            self.bytes += result["bytes"]
+        except Exception as e:
+            self.errors.append(f"batch of {len(batch)} jobs failed: {e}")
+            self.failed |= companies
+        finally:
+            self.slots.release()
+
+        for slug in companies:
+            self.pending[slug] -= 1
+            self._maybe_finish(slug)
+
+    def _maybe_finish(self, slug: str):
+        """Update a company's job count once all of its jobs are acknowledged."""
+        if (
+            slug in self.sealed
+            and slug not in self.finished
+            and slug not in self.failed
+            and slug not in self.buffer_companies
+            and self.pending[slug] == 0
+        ):
+            self.finished.add(slug)
+            self._spawn(self._update_count(slug))
+
+    async def _update_count(self, slug: str):
+        try:
+            await self.client.update_company_job_count(
+                slug, self.counts[slug], self.scraped_at.get(slug) or datetime.utcnow()
+            )
+        except Exception as e:
+            self.finished.discard(slug)
+            self.failed.add(slug)
+            self.errors.append(f"job count update for {slug} failed: {e}")
@@ -0,0 +1,116 @@
+"""Offline reclassification of stored jobs.
+
+Reruns the classification and location rules over jobs that were already
+scraped, so rule changes can be applied without crawling again. Records
+are split into chunks and labelled across a process pool; only the fields
+the rules need are sent to the workers and only the labels come back.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+from .classification import infer_job_type, infer_level
+from .location import resolve_location
+
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Job fields derived by the rules
+LABEL_FIELDS = ("job_type", "level", "location_normalized", "remote")
+
+
+def classify_labels(title: str, team: str | None, location: str | None, remote: bool = False) -> dict:
+    """Derive the rule-based labels for a job, as create_job does.
+
+    `remote` is the job's stored flag; as in create_job, the location can
+    turn it on but never clears one a scraper already set.
+    """
+    info = resolve_location(location)
+    return {
+        "job_type": infer_job_type(title, team),
+        "level": infer_level(title),
+        "location_normalized": info.normalized,
+        "remote": remote or info.remote,
+    }
+
+
+_Fields = tuple[str, str | None, str | None, bool]
+
+
+def _classify_chunk(fields: list[_Fields]) -> list[dict]:
+    """Worker entry point: labels for a chunk of (title, team, location, remote)."""
+    return [classify_labels(*f) for f in fields]
+
+
+def _chunks(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(records)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _fields(chunk: list[dict]) -> list[_Fields]:
+    return [
+        (r.get("title") or "", r.get("team"), r.get("location"), bool(r.get("remote")))
+        for r in chunk
+    ]
+
+
+def changed_labels(record: dict, labels: dict) -> dict[str, tuple]:
+    """Labels that differ from the record, as {field: (old, new)}."""
+    return {
+        field: (record.get(field), value)
+        for field, value in labels.items()
+        if record.get(field) != value
+    }
+
+
+def reclassify(
+    records: Iterable[dict],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[dict, dict[str, tuple]]]:
+    """Relabel job records, yielding (updated record, changes) in input order.
+
+    Records are updated in place. `changes` is empty for jobs whose labels
+    didn't change. With one worker, or when everything fits in a single
+    chunk, the work is done in this process instead of starting a pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(records, chunk_size)
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+
+    def apply(chunk: list[dict], labels: list[dict]):
+        for record, new in zip(chunk, labels):
+            changes = changed_labels(record, new)
+            record.update(new)
+            yield record, changes
+
+    if workers == 1 or second is None:
+        for chunk in chain([first], [second] if second else [], chunks):
+            yield from apply(chunk, _classify_chunk(_fields(chunk)))
+        return
+
+    # Keep a bounded window of chunks in flight so large stores stream
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window: deque[tuple[list[dict], Future]] = deque()
+
+        def submit(chunk: list[dict]):
+            window.append((chunk, pool.submit(_classify_chunk, _fields(chunk))))
+
+        submit(first)
+        submit(second)
+        for chunk in chunks:
+            while len(window) >= workers * 2:
+                done, future = window.popleft()
+                yield from apply(done, future.result())
+            submit(chunk)
+        while window:
+            done, future = window.popleft()
+            yield from apply(done, future.result())
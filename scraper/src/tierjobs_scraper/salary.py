@@ -0,0 +1,200 @@
+"""Salary extraction from job description text.
+
+A precompiled pattern is run once over the plain text of a posting and
+picks out pay ranges such as "$150,000 - $200,000", "$150K–$200K USD",
+"$50/hr - $60/hr" or "$1.5M - $2M", together with the currency symbol or
+code written next to them and any per-hour/per-year marker. Ranges written
+with only a trailing code ("150,000 - 200,000 USD") are looked for next to
+each currency code. Hourly pay is annualized so salary_min and
+salary_max stay comparable across jobs. Shared by all scrapers.
+"""
+
+import heapq
+import re
+from typing import Iterator, NamedTuple
+
+
+HOURS_PER_YEAR = 2080
+
+# Plausible pay, per period
+ANNUAL_RANGE = (10_000, 10_000_000)
+HOURLY_RANGE = (7, 1_000)
+
+CURRENCY_SYMBOLS = {
+    "$": "USD",
+    "us$": "USD",
+    "c$": "CAD",
+    "ca$": "CAD",
+    "a$": "AUD",
+    "€": "EUR",
+    "£": "GBP",
+}
+CURRENCY_CODES = ("USD", "CAD", "EUR", "GBP", "AUD")
+
+_CODES = "|".join(CURRENCY_CODES)
+# Flat alternation of literals, so the regex engine can skip ahead to the
+# next currency marker instead of trying every position
+_PREFIX = rf"US\$|CA\$|C\$|A\$|\$|€|£|{_CODES}"
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_MULTIPLIER = r"\s?[kKmM]\b"
+_SEPARATOR = r"\s*(?:-|–|—|to|and)\s*"
+
+# Pay period after an amount or range
+_PERIOD = r"""
+    (?i:
+        \s*(?:/|per|an|a)\s*(?P<period>hour|hr|year|yr|annum)\b
+        |\s+(?P<period_word>hourly|annually)
+    )?
+"""
+
+# A currency-prefixed amount, optionally followed by a second amount
+# (range) and a pay period. Either end may carry its own per-unit marker
+# ("$50/hr - $60/hr").
+_SALARY_RE = re.compile(
+    rf"""
+    (?P<apre>{_PREFIX})\s?(?P<anum>{_NUMBER})(?P<amult>{_MULTIPLIER})?(?:\s?(?P<acode>{_CODES})\b)?
+    (?i:\s*(?:/|per|an|a)\s*(?P<aperiod>hour|hr|year|yr|annum)\b)?
+    (?:
+        {_SEPARATOR}
+        (?:(?P<bpre>{_PREFIX})\s?)?(?P<bnum>{_NUMBER})(?P<bmult>{_MULTIPLIER})?(?:\s?(?P<bcode>{_CODES})\b)?
+    )?
+    {_PERIOD}
+    """,
+    re.X,
+)
+
+# A range with no prefix, only a currency code after it ("150,000 -
+# 200,000 USD"). It could start at any digit, so it is only searched for
+# in a window ending at each currency code; the empty groups give its
+# matches the same shape as _SALARY_RE's.
+_BARE_RANGE_RE = re.compile(
+    rf"""
+    (?P<apre>)(?P<acode>)(?P<aperiod>)(?P<bpre>)
+    (?<![\d.,])(?P<anum>{_NUMBER})(?P<amult>{_MULTIPLIER})?
+    {_SEPARATOR}
+    (?P<bnum>{_NUMBER})(?P<bmult>{_MULTIPLIER})?\s?(?P<bcode>{_CODES})\b
+    {_PERIOD}
+    """,
+    re.X,
+)
+_CODE_RE = re.compile(rf"(?:{_CODES})\b")
+
+# Characters searched before a currency code for a bare range, and after
+# it for a pay period
+_BARE_RANGE_BEFORE = 48
+_BARE_RANGE_AFTER = 16
+
+# Values of the k/M suffixes
+_MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+# Hourly markers just before a range, e.g. "Hourly rate: $40 - $55"
+_HOURLY_BEFORE_RE = re.compile(r"\b(?:hourly|per hour)\b[^$€£\d]{0,20}$", re.I)
+
+
+class Salary(NamedTuple):
+    """A pay range as written in a posting."""
+
+    min: int
+    max: int
+    currency: str
+    period: str = "year"  # "year" or "hour"
+
+    def annualized(self) -> tuple[int, int]:
+        """(min, max) per year."""
+        if self.period == "hour":
+            return self.min * HOURS_PER_YEAR, self.max * HOURS_PER_YEAR
+        return self.min, self.max
+
+    def as_job_fields(self) -> dict:
+        """salary_min, salary_max and salary_currency for a job, annualized."""
+        salary_min, salary_max = self.annualized()
+        return {
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "salary_currency": self.currency,
+        }
+
+
+def _value(match: re.Match, n: str) -> float:
+    value = float(match.group(f"{n}num").replace(",", ""))
+    multiplier = match.group(f"{n}mult")
+    if multiplier:
+        value *= _MULTIPLIERS[multiplier.strip().lower()]
+    return value
+
+
+def _currency(match: re.Match, n: str) -> str | None:
+    code = match.group(f"{n}code")
+    if code:
+        return code
+    prefix = match.group(f"{n}pre") or ""
+    if prefix in CURRENCY_CODES:
+        return prefix
+    return CURRENCY_SYMBOLS.get(prefix.lower())
+
+
+def _period(match: re.Match, text: str) -> str:
+    word = match.group("period") or match.group("period_word") or match.group("aperiod") or ""
+    if word.lower().startswith("h") or _HOURLY_BEFORE_RE.search(text, max(0, match.start() - 40), match.start()):
+        return "hour"
+    return "year"
+
+
+def _plausible(low: float, high: float, period: str) -> bool:
+    floor, ceiling = HOURLY_RANGE if period == "hour" else ANNUAL_RANGE
+    return floor <= low <= high <= ceiling
+
+
+def _bare_ranges(text: str) -> Iterator[re.Match]:
+    """Ranges with just a trailing currency code, in order."""
+    searched = 0
+    for code in _CODE_RE.finditer(text):
+        if code.start() < searched:
+            continue
+        start = max(searched, code.start() - _BARE_RANGE_BEFORE)
+        searched = code.end() + _BARE_RANGE_AFTER
+        yield from _BARE_RANGE_RE.finditer(text, start, searched)
+
+
+def _matches(text: str) -> Iterator[re.Match]:
+    """Candidate amounts and ranges, in the order they appear."""
+    return heapq.merge(_SALARY_RE.finditer(text), _bare_ranges(text), key=re.Match.start)
+
+
+def extract_salary(text: str | None) -> Salary | None:
+    """Find the pay range in a posting's plain text.
+
+    Amounts need a currency symbol or code in front of them ("$150,000",
+    "USD 150,000"), or for a range a code after it ("150,000 - 200,000 USD");
+    the first such range wins. Without one, the
+    first two annual amounts with a currency are used as the range, which
+    is how postings that split the range across sentences usually read.
+    """
+    if not text:
+        return None
+
+    singles: list[tuple[float, str]] = []
+
+    for match in _matches(text):
+        currency_a = _currency(match, "a")
+        if match.group("bnum") is None:
+            # A lone "$5M" is funding or revenue, not pay
+            multiplier = match.group("amult") or ""
+            if len(singles) < 2 and "m" not in multiplier.lower():
+                value = _value(match, "a")
+                if _plausible(value, value, "year"):
+                    singles.append((value, currency_a))
+            continue
+
+        currency = _currency(match, "b") or currency_a
+        low, high = sorted((_value(match, "a"), _value(match, "b")))
+        period = _period(match, text)
+        if _plausible(low, high, period):
+            return Salary(int(low), int(high), currency, period)
+
+    if len(singles) == 2:
+        (low, currency), (high, _) = singles
+        low, high = sorted((low, high))
+        return Salary(int(low), int(high), currency)
+
+    return None
@@ -0,0 +1,211 @@
+"""Refresh scheduling for the scrape daemon.
+
+Every company gets its own refresh interval instead of one cron schedule
+for all of them. A company's weight grows steeply with its tier score and
+with how often its listing changed in recent runs, and intervals are
+handed out in proportion to weight under a fixed budget: on average the
+schedule makes as many refreshes as scraping every company once per
+`interval` would. Higher tiers and busier boards get fresher data, and
+quiet low-tier boards pay for it.
+"""
+
+import heapq
+import time
+
+from .models import Company
+
+
+DEFAULT_INTERVAL = 3600.0  # seconds; the cron schedule being replaced
+DEFAULT_MIN_INTERVAL = 300.0
+DEFAULT_MAX_INTERVAL = 86400.0
+
+# Tier scores run 55-100; raising them to this power spreads weights ~10x
+TIER_EXPONENT = 4
+
+# Weight of the latest run in the moving change rate
+CHANGE_SMOOTHING = 0.3
+INITIAL_CHANGE_RATE = 0.5
+
+# Added to the change rate so boards that never change are still refreshed
+CHANGE_FLOOR = 0.1
+
+
+class CompanyState:
+    """Refresh history of one company."""
+
+    __slots__ = ("slug", "tier_score", "change_rate", "runs", "last_found", "last_run", "next_due")
+
+    def __init__(
+        self,
+        slug: str,
+        tier_score: int,
+        change_rate: float = INITIAL_CHANGE_RATE,
+        runs: int = 0,
+        last_found: int | None = None,
+        last_run: float | None = None,
+        next_due: float = 0.0,
+    ):
+        self.slug = slug
+        self.tier_score = tier_score
+        # Moving average of how often a refresh found the listing changed
+        self.change_rate = change_rate
+        self.runs = runs
+        self.last_found = last_found
+        self.last_run = last_run
+        self.next_due = next_due
+
+    @property
+    def weight(self) -> float:
+        return (self.tier_score / 100) ** TIER_EXPONENT * (CHANGE_FLOOR + self.change_rate)
+
+    def record(self, changed: bool, jobs_found: int, now: float):
+        """Fold one successful refresh into the change rate."""
+        self.change_rate += CHANGE_SMOOTHING * (float(changed) - self.change_rate)
+        self.runs += 1
+        self.last_found = jobs_found
+        self.last_run = now
+
+    def as_dict(self) -> dict:
+        return {
+            "company_slug": self.slug,
+            "change_rate": self.change_rate,
+            "runs": self.runs,
+            "last_found": self.last_found,
+            "last_run": self.last_run,
+            "next_due": self.next_due,
+        }
+
+
+def allocate_intervals(
+    weights: dict[str, float],
+    interval: float = DEFAULT_INTERVAL,
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+) -> dict[str, float]:
+    """Refresh interval per key, proportional to weight, within the budget.
+
+    The refresh rates (1 / interval) add up to len(weights) / interval.
+    Keys whose share falls outside [min_interval, max_interval] are pinned
+    to the bound and the rest of the budget is shared among the others.
+    """
+    budget = len(weights) / interval
+    fastest, slowest = 1 / min_interval, 1 / max_interval
+    rates: dict[str, float] = {}
+    free = dict(weights)
+
+    while free:
+        remaining = max(0.0, budget - sum(rates.values()))
+        total = sum(free.values())
+        pinned = False
+        for key, weight in list(free.items()):
+            rate = remaining * weight / total if total else slowest
+            if rate > fastest or rate < slowest:
+                rates[key] = min(fastest, max(slowest, rate))
+                del free[key]
+                pinned = True
+        if not pinned:
+            for key, weight in free.items():
+                rates[key] = remaining * weight / total
+            break
+
+    return {key: 1 / rate for key, rate in rates.items()}
+
+
+class RefreshSchedule:
+    """Priority queue of companies ordered by when they're next due.
+
+    Usage:
+        schedule = RefreshSchedule(companies, saved=store.load_schedule())
+        slugs = schedule.due()
+        ... scrape them ...
+        schedule.record(slug, changed=True, jobs_found=42)
+    """
+
+    def __init__(
+        self,
+        companies: list[Company],
+        saved: dict[str, dict] | None = None,
+        interval: float = DEFAULT_INTERVAL,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        now: float | None = None,
+    ):
+        now = time.time() if now is None else now
+        saved = saved or {}
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.states: dict[str, CompanyState] = {}
+        for company in companies:
+            state = saved.get(company.slug, {})
+            self.states[company.slug] = CompanyState(
+                company.slug,
+                company.tier_score,
+                **{k: v for k, v in state.items() if k != "company_slug"},
+            )
+        self.intervals = self._allocate()
+
+        # Companies never refreshed before come due in priority order,
+        # spread over the shortest interval instead of all at once
+        new = sorted(
+            (state for state in self.states.values() if not state.runs),
+            key=lambda state: -state.weight,
+        )
+        for rank, state in enumerate(new):
+            state.next_due = now + self.min_interval * rank / len(new)
+
+        self.heap: list[tuple[float, str]] = [
+            (state.next_due, slug) for slug, state in self.states.items()
+        ]
+        heapq.heapify(self.heap)
+
+    def _allocate(self) -> dict[str, float]:
+        return allocate_intervals(
+            {slug: state.weight for slug, state in self.states.items()},
+            self.interval,
+            self.min_interval,
+            self.max_interval,
+        )
+
+    def due(self, now: float | None = None) -> list[str]:
+        """Pop every company due by `now`, highest priority first."""
+        now = time.time() if now is None else now
+        slugs = []
+        while self.heap and self.heap[0][0] <= now:
+            when, slug = heapq.heappop(self.heap)
+            # Entries left behind by a later reschedule are skipped
+            if when == self.states[slug].next_due and slug not in slugs:
+                slugs.append(slug)
+        return sorted(slugs, key=lambda slug: -self.states[slug].weight)
+
+    def next_due(self) -> float | None:
+        """When the next company comes due, or None if none are scheduled."""
+        while self.heap and self.heap[0][0] != self.states[self.heap[0][1]].next_due:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def record(self, slug: str, changed: bool, jobs_found: int, now: float | None = None):
+        """Record a successful refresh and schedule the next one."""
+        now = time.time() if now is None else now
+        self.states[slug].record(changed, jobs_found, now)
+        self.intervals = self._allocate()
+        self._schedule(slug, now + self.intervals[slug])
+
+    def record_failure(self, slug: str, now: float | None = None):
+        """Schedule a company whose refresh failed; its change rate is left alone."""
+        now = time.time() if now is None else now
+        self._schedule(slug, now + self.intervals[slug])
+
+    def _schedule(self, slug: str, when: float):
+        self.states[slug].next_due = when
+        heapq.heappush(self.heap, (when, slug))
+
+    def changed(self, slug: str, jobs_new: int, jobs_updated: int, jobs_found: int) -> bool:
+        """Whether a refresh found the listing different from last time."""
+        last_found = self.states[slug].last_found
+        return bool(jobs_new or jobs_updated) or (last_found is not None and last_found != jobs_found)
+
+    def snapshot(self, slugs: list[str] | None = None) -> list[dict]:
+        """State of some (or all) companies, for saving."""
+        slugs = self.states if slugs is None else slugs
+        return [self.states[slug].as_dict() for slug in slugs]
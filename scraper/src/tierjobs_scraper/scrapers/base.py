@@ -5,27 +5,75 @@ import json
 from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-import httpx
-from playwright.async_api import async_playwright, Page
-from bs4 import BeautifulSoup
-
-from ..models import Job, Company, ScrapeResult
+from ..browser import BrowserPool, CapturedResponse, UrlPattern, get_browser_pool
+from ..models import Company, JobRecord, ScrapeResult
 from ..classification import infer_job_type, infer_level
-from ..location import normalize_location, extract_remote_info
+from ..location import resolve_location
+from ..parsing import ParsePool, get_parse_pool
+from ..store import JobStore
+from ..transport import HttpTransport, get_transport
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 
 class BaseScraper(ABC):
     """Base class for all job scrapers."""
     
+    # Host the scraper talks to, used to group concurrency limits in scrape-all
+    host: str | None = None
+    
+    # Local job store used to tell new and updated jobs apart
+    store: JobStore | None = None
+    
     def __init__(self, company: Company):
         self.company = company
-        self.jobs: list[Job] = []
+        self.jobs: list[JobRecord] = []
     
     @abstractmethod
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from the company. Override in subclass."""
-        pass
+    def fetch_batches(self) -> AsyncIterator[list[dict | JobRecord]]:
+        """Yield the company's jobs in batches as they're fetched. Override in subclass.
+        
+        Items are raw payloads for parse_job, or JobRecords that are ready
+        as they are (e.g. reused from a previous run). Implemented as an
+        async generator.
+        """
+    
+    def parse_job(self, data: dict, **options) -> JobRecord | None:
+        """Build a job from a raw payload; None if it can't be parsed."""
+        raise NotImplementedError
+    
+    def parse_options(self) -> dict:
+        """Keyword arguments parse_job is called with."""
+        return {}
+    
+    async def parse_payloads(self, payloads: list[dict]) -> list[JobRecord | None]:
+        """Run parse_job over raw payloads, keeping order."""
+        options = self.parse_options()
+        return [self.parse_job(payload, **options) for payload in payloads]
+    
+    async def parse_batch(self, batch: list[dict | JobRecord]) -> list[JobRecord]:
+        """Turn a fetched batch into jobs, keeping order and dropping failures."""
+        to_parse = [i for i, item in enumerate(batch) if not isinstance(item, JobRecord)]
+        if to_parse:
+            batch = list(batch)
+            parsed = await self.parse_payloads([batch[i] for i in to_parse])
+            for i, job in zip(to_parse, parsed):
+                batch[i] = job
+        return [job for job in batch if job]
+    
+    async def iter_jobs(self) -> AsyncIterator[list[JobRecord]]:
+        """Scrape jobs from the company, yielding each batch once it's parsed."""
+        async for batch in self.fetch_batches():
+            jobs = await self.parse_batch(batch)
+            if jobs:
+                yield jobs
+    
+    async def scrape(self) -> list[JobRecord]:
+        """Scrape all jobs from the company."""
+        return [job async for batch in self.iter_jobs() for job in batch]
     
     async def run(self) -> ScrapeResult:
         """Run the scraper and return results."""
@@ -34,13 +82,19 @@ class BaseScraper(ABC):
         try:
             self.jobs = await self.scrape()
             
+            # Without a store, every job counts as new
+            jobs_new, jobs_updated = len(self.jobs), 0
+            if self.store:
+                jobs_new, jobs_updated = await asyncio.to_thread(self.store.upsert_jobs, self.jobs)
+            
             duration = int((datetime.utcnow() - start).total_seconds() * 1000)
             
             return ScrapeResult(
                 company=self.company.name,
                 success=True,
                 jobs_found=len(self.jobs),
-                jobs_new=len(self.jobs),  # TODO: track new vs updated
+                jobs_new=jobs_new,
+                jobs_updated=jobs_updated,
                 duration_ms=duration,
             )
         except Exception as e:
@@ -52,11 +106,15 @@ class BaseScraper(ABC):
                 duration_ms=duration,
             )
     
+    def worker_args(self) -> dict:
+        """Constructor arguments (besides company) to rebuild this scraper in a parse worker."""
+        return {}
+    
     def make_job_id(self, job_id: str) -> str:
         """Create a unique job ID."""
         return f"{self.company.slug}_{job_id}"
     
-    def create_job(self, **kwargs) -> Job:
+    def create_job(self, **kwargs) -> JobRecord:
         """Create a job with company info pre-filled.
         
         Automatically infers job_type, level, and normalizes location
@@ -74,17 +132,15 @@ class BaseScraper(ABC):
         if "level" not in kwargs:
             kwargs["level"] = infer_level(title)
         
-        # Normalize location
-        if location and "location_normalized" not in kwargs:
-            kwargs["location_normalized"] = normalize_location(location)
-        
-        # Check for remote status
-        if location and not kwargs.get("remote"):
-            is_remote, _ = extract_remote_info(location)
-            if is_remote:
+        # Normalize location and check for remote status in one lookup
+        if location:
+            info = resolve_location(location)
+            if "location_normalized" not in kwargs:
+                kwargs["location_normalized"] = info.normalized
+            if info.remote and not kwargs.get("remote"):
                 kwargs["remote"] = True
         
-        return Job(
+        return JobRecord(
             company=self.company.name,
             company_slug=self.company.slug,
             tier=self.company.tier,
@@ -96,33 +152,74 @@ class BaseScraper(ABC):
 class APIBasedScraper(BaseScraper):
     """Scraper for companies with JSON APIs."""
     
+    # Transport to fetch with; falls back to the process-wide shared one
+    transport: HttpTransport | None = None
+    
+    # Pool for CPU-heavy parsing; falls back to the process-wide shared one
+    parser: ParsePool | None = None
+    
     async def fetch_json(self, url: str) -> dict:
         """Fetch JSON from URL."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            return response.json()
+        transport = self.transport or get_transport()
+        return await transport.get_json(url)
+    
+    async def parse_payloads(self, payloads: list[dict]) -> list[JobRecord | None]:
+        """Run parse_job over raw payloads in the parse pool, keeping order."""
+        return await (self.parser or get_parse_pool()).parse(self, payloads, **self.parse_options())
 
 
 class PlaywrightScraper(BaseScraper):
     """Scraper using Playwright for JS-heavy sites."""
     
+    # Browser to render with; falls back to the process-wide shared one
+    browser: BrowserPool | None = None
+    
+    # Transport for calling captured endpoints directly; falls back to the shared one
+    transport: HttpTransport | None = None
+    
+    # URL globs or regexes of the JSON API requests the careers page makes
+    capture_patterns: tuple[UrlPattern, ...] = ()
+    
+    # Endpoints found by capture_json, by (company slug, page URL). Shared by
+    # all instances so later scrapes in this process skip the browser.
+    endpoints: dict[tuple[str, str], CapturedResponse] = {}
+    
     async def get_page_content(self, url: str, wait_for: str | None = None) -> str:
         """Get page HTML after JS execution."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            await page.goto(url, wait_until="networkidle")
-            
-            if wait_for:
-                await page.wait_for_selector(wait_for, timeout=10000)
-            
-            content = await page.content()
-            await browser.close()
-            
-            return content
+        return await (self.browser or get_browser_pool()).render(url, wait_for=wait_for)
+    
+    async def capture_json(
+        self,
+        url: str,
+        patterns: tuple[UrlPattern, ...] | None = None,
+        count: int = 1,
+    ) -> list[CapturedResponse]:
+        """Load a page and return the JSON responses matching `patterns` (default capture_patterns)."""
+        responses = await (self.browser or get_browser_pool()).capture_json(
+            url, patterns or self.capture_patterns, count=count
+        )
+        self.endpoints[(self.company.slug, url)] = responses[0]
+        return responses
     
-    def parse_html(self, html: str) -> BeautifulSoup:
+    async def fetch_captured_json(self, url: str, patterns: tuple[UrlPattern, ...] | None = None) -> Any:
+        """JSON behind a page: straight from its API once known, else captured in the browser."""
+        key = (self.company.slug, url)
+        endpoint = self.endpoints.get(key)
+        if endpoint is not None:
+            transport = self.transport or get_transport()
+            try:
+                return await transport.request_json(
+                    endpoint.method, endpoint.url, headers=endpoint.headers, content=endpoint.post_data
+                )
+            except Exception:
+                # The endpoint moved or needs browser state; find it again
+                self.endpoints.pop(key, None)
+        
+        responses = await self.capture_json(url, patterns)
+        return responses[0].data
+    
+    def parse_html(self, html: str) -> "BeautifulSoup":
         """Parse HTML content."""
+        from bs4 import BeautifulSoup
+        
         return BeautifulSoup(html, "html.parser")
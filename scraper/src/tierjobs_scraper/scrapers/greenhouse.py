@@ -4,12 +4,13 @@ Many companies use Greenhouse (boards.greenhouse.io).
 They have a public JSON API at: https://boards-api.greenhouse.io/v1/boards/{company}/jobs
 """
 
-import re
-import html
+import asyncio
 from datetime import datetime
-from bs4 import BeautifulSoup
+from typing import AsyncIterator
 from .base import APIBasedScraper
-from ..models import Job, Company
+from ..models import Company, JobRecord
+from ..html_text import html_to_text
+from ..salary import extract_salary
 
 
 # Map company slugs to their Greenhouse board names
@@ -45,100 +46,190 @@ GREENHOUSE_BOARDS = {
     "xai": "xai",
 }
 
+# Max job-detail requests in flight per board in full mode
+DEFAULT_DETAIL_CONCURRENCY = 8
+
+# Detail payloads per batch, as a multiple of the detail concurrency
+DETAIL_BATCH_FACTOR = 4
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a Greenhouse ISO timestamp, returning None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return None
+
 
 class GreenhouseScraper(APIBasedScraper):
     """Scraper for Greenhouse job boards."""
     
-    def __init__(self, company: Company, board_name: str | None = None, full: bool = False):
+    host = "boards-api.greenhouse.io"
+    
+    def __init__(
+        self,
+        company: Company,
+        board_name: str | None = None,
+        full: bool = False,
+        detail_concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+        previous: dict[str, JobRecord] | None = None,
+        bulk: bool = True,
+    ):
         super().__init__(company)
         self.board_name = board_name or GREENHOUSE_BOARDS.get(company.slug, company.slug)
         self.full = full
+        self.detail_concurrency = max(1, detail_concurrency)
+        # Jobs from the previous run keyed by Job.id; enables incremental full mode
+        self.previous = previous or {}
+        self.reused_count = 0
+        # In full mode, get every job's content in one listing call (?content=true)
+        self.bulk = bulk
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from Greenhouse API."""
+    async def fetch_batches(self) -> AsyncIterator[list[dict | JobRecord]]:
+        """Yield the board's jobs from the Greenhouse API in batches.
+        
+        In full mode, jobs unchanged since the previous run come back as
+        ready JobRecords; everything else is a payload for parse_job.
+        """
+        self.reused_count = 0
+        if self.full and self.bulk:
+            listing = await self.fetch_bulk_listing()
+            if listing is not None:
+                yield self.reuse_unchanged(listing)
+                return
+        
         url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_name}/jobs"
         
         data = await self.fetch_json(url)
-        jobs = []
+        listing = data.get("jobs", [])
         
-        for job_data in data.get("jobs", []):
-            if self.full:
-                # Fetch full details for each job
-                job = await self.fetch_full_job(str(job_data["id"]))
-            else:
-                job = self.parse_job(job_data)
-            if job:
-                jobs.append(job)
+        if not self.full:
+            yield listing
+            return
         
-        return jobs
+        async for batch in self.fetch_details(listing):
+            yield batch
     
-    async def fetch_full_job(self, job_id: str) -> Job | None:
-        """Fetch full job details including description."""
-        url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_name}/jobs/{job_id}"
+    async def fetch_bulk_listing(self) -> list[dict] | None:
+        """Fetch full job data for the whole board in a single request.
+        
+        Returns None if the bulk listing can't be fetched, so the caller can
+        fall back to per-job detail requests.
+        """
+        url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_name}/jobs?content=true"
         try:
             data = await self.fetch_json(url)
-            return self.parse_job(data, full=True)
+        except Exception as e:
+            print(f"Bulk content fetch failed for {self.board_name}, falling back to per-job: {e}")
+            return None
+        return data.get("jobs", [])
+    
+    def reuse_unchanged(self, listing: list[dict]) -> list[dict | JobRecord]:
+        """Swap listing entries unchanged since the previous run for their jobs.
+        
+        Unchanged jobs skip the detail fetch and the HTML and salary parsing.
+        """
+        batch = [self.reuse_previous(job_data) or job_data for job_data in listing]
+        self.reused_count += sum(isinstance(item, JobRecord) for item in batch)
+        return batch
+    
+    async def fetch_details(self, listing: list[dict]) -> AsyncIterator[list[dict | JobRecord]]:
+        """Fetch detail payloads for a listing with a bounded number in flight.
+        
+        Batches keep listing order and jobs that fail to fetch are skipped.
+        The next batch is fetched while the current one is handed on.
+        """
+        limit = asyncio.Semaphore(self.detail_concurrency)
+        size = self.detail_concurrency * DETAIL_BATCH_FACTOR
+        
+        async def fetch_one(item: dict | JobRecord) -> dict | JobRecord | None:
+            if isinstance(item, JobRecord):
+                return item
+            async with limit:
+                return await self.fetch_full_payload(str(item["id"]))
+        
+        # At most two batches in flight: the one being handed on and the next
+        in_flight: list[asyncio.Future] = []
+        try:
+            for start in range(0, len(listing), size):
+                in_flight.append(asyncio.gather(*(
+                    fetch_one(item) for item in self.reuse_unchanged(listing[start:start + size])
+                )))
+                if len(in_flight) == 2:
+                    batch = await in_flight[0]
+                    in_flight.pop(0)
+                    yield [item for item in batch if item is not None]
+            while in_flight:
+                batch = await in_flight[0]
+                in_flight.pop(0)
+                yield [item for item in batch if item is not None]
+        finally:
+            for pending in in_flight:
+                pending.cancel()
+    
+    def reuse_previous(self, job_data: dict) -> JobRecord | None:
+        """Return the previous run's job if this listing entry is unchanged.
+        
+        A job is unchanged when its id and updated_at match; the previous
+        description, salary, departments and offices are kept as-is.
+        """
+        prev = self.previous.get(self.make_job_id(str(job_data["id"])))
+        
+        # Only reuse jobs the previous run fetched in full
+        if (
+            not prev
+            or prev.text_ref("description_html") is None
+            or not prev.updated_at
+            or prev.updated_at != parse_timestamp(job_data.get("updated_at"))
+        ):
+            return None
+        
+        return JobRecord.from_job(
+            prev,
+            company=self.company.name,
+            tier=self.company.tier,
+            tier_score=self.company.tier_score,
+            scraped_at=datetime.utcnow(),
+        )
+    
+    async def fetch_full_payload(self, job_id: str) -> dict | None:
+        """Fetch the raw detail payload for a job, or None on failure."""
+        url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_name}/jobs/{job_id}"
+        try:
+            return await self.fetch_json(url)
         except Exception as e:
             print(f"Error fetching job {job_id}: {e}")
             return None
     
-    async def fetch_single_job(self, job_id: str) -> Job | None:
+    async def fetch_full_job(self, job_id: str) -> JobRecord | None:
+        """Fetch full job details including description."""
+        data = await self.fetch_full_payload(job_id)
+        return self.parse_job(data, full=True) if data else None
+    
+    async def fetch_single_job(self, job_id: str) -> JobRecord | None:
         """Fetch a single job by ID (for --full-id testing)."""
         return await self.fetch_full_job(job_id)
     
+    def worker_args(self) -> dict:
+        return {"board_name": self.board_name}
+    
+    def parse_options(self) -> dict:
+        return {"full": self.full}
+    
     def parse_html_content(self, html_content: str) -> str:
         """Parse HTML and return clean text."""
-        # First decode HTML entities (&lt; -> <, etc.)
-        decoded = html.unescape(html_content)
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(decoded, "html.parser")
-        # Get text with newlines preserved
-        text = soup.get_text(separator="\n", strip=True)
-        # Clean up multiple newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        return text
+        return html_to_text(html_content)
     
-    def extract_salary(self, html: str) -> tuple[int | None, int | None, str | None]:
-        """Extract salary range from HTML content."""
-        # First, find all dollar amounts in the HTML
-        # Pattern to find $xxx,xxx values (may be wrapped in HTML tags)
-        dollar_pattern = r'\$([0-9,]+)'
-        amounts = re.findall(dollar_pattern, html)
-        
-        if len(amounts) >= 2:
-            # Take the first two amounts as min/max (common pattern for salary ranges)
-            try:
-                # Filter to reasonable salary amounts (> $10k, < $10M)
-                valid_amounts = []
-                for amt in amounts:
-                    val = int(amt.replace(',', ''))
-                    if 10000 <= val <= 10000000:
-                        valid_amounts.append(val)
-                
-                if len(valid_amounts) >= 2:
-                    salary_min = valid_amounts[0]
-                    salary_max = valid_amounts[1]
-                    
-                    # Ensure min < max
-                    if salary_min > salary_max:
-                        salary_min, salary_max = salary_max, salary_min
-                    
-                    # Check for currency (default USD)
-                    currency = "USD"
-                    if "CAD" in html:
-                        currency = "CAD"
-                    elif "EUR" in html or "€" in html:
-                        currency = "EUR"
-                    elif "GBP" in html or "£" in html:
-                        currency = "GBP"
-                    
-                    return salary_min, salary_max, currency
-            except (ValueError, IndexError):
-                pass
-        
-        return None, None, None
+    def extract_salary(self, text: str | None) -> tuple[int | None, int | None, str | None]:
+        """Extract the (annualized) salary range from description text."""
+        salary = extract_salary(text)
+        if not salary:
+            return None, None, None
+        return *salary.annualized(), salary.currency
     
-    def parse_job(self, data: dict, full: bool = False) -> Job | None:
+    def parse_job(self, data: dict, full: bool = False) -> JobRecord | None:
         """Parse a job from Greenhouse API response."""
         try:
             job_id = str(data["id"])
@@ -185,22 +276,11 @@ class GreenhouseScraper(APIBasedScraper):
             if full and data.get("content"):
                 description_html = data["content"]
                 description = self.parse_html_content(description_html)
-                salary_min, salary_max, salary_currency = self.extract_salary(description_html)
+                salary_min, salary_max, salary_currency = self.extract_salary(description)
 
             # Raw fields - dates
-            posted_at = None
-            if data.get("first_published"):
-                try:
-                    posted_at = datetime.fromisoformat(data["first_published"].replace("Z", "+00:00"))
-                except Exception:
-                    pass
-
-            updated_at = None
-            if data.get("updated_at"):
-                try:
-                    updated_at = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-                except Exception:
-                    pass
+            posted_at = parse_timestamp(data.get("first_published"))
+            updated_at = parse_timestamp(data.get("updated_at"))
 
             # Raw fields - IDs
             internal_job_id = data.get("internal_job_id")
@@ -5,8 +5,10 @@ They have a public API at: https://api.lever.co/v0/postings/{company}
 """
 
 from datetime import datetime
+from typing import AsyncIterator
 from .base import APIBasedScraper
-from ..models import Job, Company
+from ..models import Company, JobRecord
+from ..salary import Salary, extract_salary
 
 
 # Map company slugs to their Lever site names
@@ -16,29 +18,46 @@ LEVER_SITES = {
     "plaid": "plaid",
 }
 
+# Lever salaryRange intervals we can express as a Salary period
+LEVER_INTERVALS = {
+    "per-year-salary": "year",
+    "per-hour-wage": "hour",
+}
+
 
 class LeverScraper(APIBasedScraper):
     """Scraper for Lever job boards."""
     
+    host = "api.lever.co"
+    
     def __init__(self, company: Company, site_name: str | None = None):
         super().__init__(company)
         self.site_name = site_name or LEVER_SITES.get(company.slug, company.slug)
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from Lever API."""
+    async def fetch_batches(self) -> AsyncIterator[list[dict]]:
+        """Yield the site's postings from the Lever API."""
         url = f"https://api.lever.co/v0/postings/{self.site_name}?mode=json"
         
-        data = await self.fetch_json(url)
-        jobs = []
-        
-        for job_data in data:
-            job = self.parse_job(job_data)
-            if job:
-                jobs.append(job)
-        
-        return jobs
+        yield await self.fetch_json(url)
+    
+    def worker_args(self) -> dict:
+        return {"site_name": self.site_name}
     
-    def parse_job(self, data: dict) -> Job | None:
+    def parse_salary_range(self, salary_range: dict | None) -> Salary | None:
+        """Salary from Lever's structured salaryRange field."""
+        if not salary_range or salary_range.get("min") is None or salary_range.get("max") is None:
+            return None
+        period = LEVER_INTERVALS.get(salary_range.get("interval"))
+        if not period:
+            return None
+        return Salary(
+            int(salary_range["min"]),
+            int(salary_range["max"]),
+            salary_range.get("currency") or "USD",
+            period,
+        )
+    
+    def parse_job(self, data: dict) -> JobRecord | None:
         """Parse a job from Lever API response."""
         try:
             job_id = data["id"]
@@ -54,6 +73,12 @@ class LeverScraper(APIBasedScraper):
             # Get description
             description = data.get("descriptionPlain")
 
+            # Salary: the structured range if the posting has one, else
+            # whatever the description and closing sections state
+            salary = self.parse_salary_range(data.get("salaryRange")) or extract_salary(
+                "\n".join(filter(None, (description, data.get("additionalPlain"))))
+            )
+
             # Extract posting date
             posted_at = None
             if data.get("createdAt"):
@@ -72,6 +97,7 @@ class LeverScraper(APIBasedScraper):
                 team=team,
                 description=description[:500] if description else None,
                 posted_at=posted_at,
+                **(salary.as_job_fields() if salary else {}),
             )
         except Exception as e:
             print(f"Error parsing job: {e}")
@@ -0,0 +1,130 @@
+"""Job and company serialization.
+
+One place that turns Job and Company models into the Convex wire format
+and the file/store record format. Fields are read straight off the model
+instead of going through model_dump(), and JSON encoding uses orjson when
+it's installed, falling back to the stdlib json module. Both backends
+produce the same bytes, which job fingerprints rely on.
+"""
+
+import json
+from datetime import datetime
+from operator import attrgetter
+
+from .models import Company, Job, JobLike
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+JSON_BACKEND = "orjson" if orjson else "json"
+
+# Job fields in declaration order, for building file records
+JOB_FIELDS = tuple(Job.model_fields)
+_job_values = attrgetter(*JOB_FIELDS)
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_safe(obj) -> bool:
+    """Whether orjson writes `obj` byte for byte as the json module would.
+
+    They only disagree on floats the json module writes in exponent form
+    (1e-05 vs 0.00001, 1e+16 vs 1e16) and on NaN and infinities.
+    """
+    if type(obj) is dict:
+        values = obj.values()
+    elif type(obj) is list or type(obj) is tuple:
+        values = obj
+    else:
+        values = (obj,)
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            if value and not 1e-4 <= abs(value) < 1e16:
+                return False
+        elif (kind is dict or kind is list or kind is tuple) and not _orjson_safe(value):
+            return False
+    return True
+
+
+def dumps(obj, sort_keys: bool = False) -> bytes:
+    """Encode an object as compact UTF-8 JSON."""
+    if orjson and _orjson_safe(obj):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(
+        obj,
+        default=_default,
+        sort_keys=sort_keys,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode()
+
+
+def loads(data: bytes | str):
+    """Decode JSON."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _ms(value: datetime | None) -> int | None:
+    """Datetime to Unix milliseconds."""
+    return int(value.timestamp() * 1000) if value else None
+
+
+def job_to_convex(job: JobLike) -> dict:
+    """Convert a Job or JobRecord to the Convex payload."""
+    # Job uses use_enum_values, so level and job_type are already strings
+    return {
+        "jobId": job.id,
+        "company": job.company,
+        "companySlug": job.company_slug,
+        "tier": job.tier,
+        "tierScore": job.tier_score,
+        "title": job.title,
+        "url": job.url,
+        "location": job.location,
+        "remote": job.remote,
+        "level": job.level,
+        "jobType": job.job_type,
+        "team": job.team,
+        "description": job.description,
+        "salaryMin": job.salary_min,
+        "salaryMax": job.salary_max,
+        "postedAt": _ms(job.posted_at),
+        "scrapedAt": _ms(job.scraped_at),
+        "score": job.score,
+    }
+
+
+def company_to_convex(company: Company) -> dict:
+    """Convert a Company to the Convex payload."""
+    return {
+        "name": company.name,
+        "slug": company.slug,
+        "domain": company.domain,
+        "careersUrl": company.careers_url,
+        "tier": company.tier,
+        "tierScore": company.tier_score,
+        "lastScraped": _ms(company.last_scraped),
+        "jobCount": company.job_count,
+    }
+
+
+def job_to_record(job: JobLike, exclude: frozenset[str] = frozenset()) -> dict:
+    """Convert a Job to a plain dict for files and the job store.
+
+    Same keys as model_dump(); datetimes are encoded by dumps(). Works for
+    both Job and JobRecord.
+    """
+    if exclude:
+        return {name: getattr(job, name) for name in JOB_FIELDS if name not in exclude}
+    return dict(zip(JOB_FIELDS, _job_values(job)))
@@ -0,0 +1,396 @@
+"""Local SQLite job store.
+
+Keeps every scraped job keyed by Job.id along with a content hash, so runs
+can tell new, updated and unchanged jobs apart and other commands can query
+the corpus without reparsing JSON output files. It also records the
+fingerprint of what was last pushed to each Convex deployment, so pushes
+can skip unchanged jobs.
+
+Descriptions live in a content-addressed blob table (see blobs.py): each
+distinct text is stored once, stored records only carry its hash, and
+JobRecords written to the store drop their text in favour of a lazy
+reference.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from .blobs import BlobRef, BlobStore, TEXT_FIELDS
+from .models import Job, JobLike, JobRecord
+from .serialization import dumps, job_to_record, loads
+
+
+DEFAULT_STORE_PATH = "jobs.db"
+
+# Changes on every scrape, so it's kept out of the hashed record
+_VOLATILE = frozenset({"scraped_at"})
+
+# Kept in the blob table; records hold "<field>_hash" instead
+_STORED_APART = _VOLATILE | frozenset(TEXT_FIELDS)
+
+# SQLite limits the number of bound parameters per statement
+_ID_CHUNK = 500
+
+# Rows fetched per lock acquisition when streaming query results
+_FETCH_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    company_slug TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    title TEXT NOT NULL,
+    job_type TEXT NOT NULL,
+    level TEXT NOT NULL,
+    location_normalized TEXT,
+    remote INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company_slug);
+CREATE INDEX IF NOT EXISTS jobs_type_level ON jobs (job_type, level);
+CREATE TABLE IF NOT EXISTS pushed (
+    target TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    pushed_at TEXT NOT NULL,
+    PRIMARY KEY (target, id)
+);
+CREATE TABLE IF NOT EXISTS schedule (
+    company_slug TEXT PRIMARY KEY,
+    change_rate REAL NOT NULL,
+    runs INTEGER NOT NULL,
+    last_found INTEGER,
+    last_run REAL,
+    next_due REAL NOT NULL
+);
+"""
+
+# Columns of the schedule table, in order
+SCHEDULE_COLUMNS = ("company_slug", "change_rate", "runs", "last_found", "last_run", "next_due")
+
+UPSERT = """
+INSERT INTO jobs (
+    id, company_slug, tier, title, job_type, level, location_normalized, remote,
+    content_hash, data, first_seen, last_seen, changed_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    company_slug = excluded.company_slug,
+    tier = excluded.tier,
+    title = excluded.title,
+    job_type = excluded.job_type,
+    level = excluded.level,
+    location_normalized = excluded.location_normalized,
+    remote = excluded.remote,
+    data = excluded.data,
+    last_seen = excluded.last_seen,
+    changed_at = CASE
+        WHEN jobs.content_hash = excluded.content_hash THEN jobs.changed_at
+        ELSE excluded.changed_at
+    END,
+    content_hash = excluded.content_hash
+"""
+
+
+def serialize_job(job: JobLike, text_hashes: dict[str, str] | None = None) -> tuple[str, str]:
+    """Serialize a job for storage, returning (data, content_hash).
+
+    scraped_at is left out of both so re-scraping an unchanged job
+    produces the same hash; it's kept in the last_seen column instead.
+    Descriptions are replaced by the blob hashes in `text_hashes`.
+    """
+    record = job_to_record(job, exclude=_STORED_APART)
+    for name, content_hash in (text_hashes or {}).items():
+        record[f"{name}_hash"] = content_hash
+    data = dumps(record)
+    return data.decode(), hashlib.sha256(data).hexdigest()
+
+
+def _raw_texts(job: JobLike) -> dict[str, str | BlobRef]:
+    """A job's non-empty descriptions, without loading BlobRefs."""
+    texts = {}
+    for name in TEXT_FIELDS:
+        value = job.text_ref(name) if isinstance(job, JobRecord) else getattr(job, name)
+        if value:
+            texts[name] = value
+    return texts
+
+
+class JobStore:
+    """SQLite-backed store of scraped jobs.
+
+    Safe to share between threads; every statement runs under one lock,
+    since all threads share a single connection.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or os.getenv("TIERJOBS_STORE") or DEFAULT_STORE_PATH)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.blobs = BlobStore(self.conn, self.lock)
+
+    def _select_by_ids(self, sql: str, job_ids: list[str], params: tuple = ()) -> dict[str, str]:
+        """Run a two-column SELECT over job IDs in chunks, returning a dict.
+
+        `sql` must end with `id IN ({ids})`.
+        """
+        found = {}
+        for i in range(0, len(job_ids), _ID_CHUNK):
+            chunk = job_ids[i:i + _ID_CHUNK]
+            rows = self.conn.execute(sql.format(ids=",".join("?" * len(chunk))), (*params, *chunk))
+            found.update((row[0], row[1]) for row in rows)
+        return found
+
+    def _iter_rows(self, sql: str, params=()) -> Iterator[sqlite3.Row]:
+        """Stream a SELECT, fetching rows in chunks under the lock.
+
+        The lock isn't held between chunks, so callers can write to the
+        store, or stop iterating, without blocking other threads.
+        """
+        with self.lock:
+            cursor = self.conn.execute(sql, params)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(_FETCH_CHUNK)
+            if not rows:
+                return
+            yield from rows
+
+    def existing_hashes(self, job_ids: list[str]) -> dict[str, str]:
+        """Get stored content hashes for the given job IDs."""
+        with self.lock:
+            return self._select_by_ids("SELECT id, content_hash FROM jobs WHERE id IN ({ids})", job_ids)
+
+    def pushed_fingerprints(self, target: str, job_ids: list[str]) -> dict[str, str]:
+        """Get the fingerprints last pushed to `target` for the given job IDs."""
+        with self.lock:
+            return self._select_by_ids(
+                "SELECT id, fingerprint FROM pushed WHERE target = ? AND id IN ({ids})",
+                job_ids,
+                (target,),
+            )
+
+    def mark_pushed(self, target: str, fingerprints: dict[str, str]):
+        """Record fingerprints that were successfully pushed to `target`."""
+        now = datetime.utcnow().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pushed (target, id, fingerprint, pushed_at) VALUES (?, ?, ?, ?)",
+                [(target, job_id, fp, now) for job_id, fp in fingerprints.items()],
+            )
+
+    def load_schedule(self) -> dict[str, dict]:
+        """Saved daemon refresh state, keyed by company slug."""
+        with self.lock:
+            rows = self.conn.execute(f"SELECT {', '.join(SCHEDULE_COLUMNS)} FROM schedule").fetchall()
+        return {row["company_slug"]: dict(row) for row in rows}
+
+    def save_schedule(self, states: list[dict]):
+        """Save daemon refresh state for some companies."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO schedule ({', '.join(SCHEDULE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(SCHEDULE_COLUMNS))})",
+                [tuple(state[column] for column in SCHEDULE_COLUMNS) for state in states],
+            )
+
+    def upsert_jobs(self, jobs: list[JobLike], release_texts: bool = True) -> tuple[int, int]:
+        """Insert or update jobs in one transaction.
+
+        With `release_texts`, JobRecords drop their descriptions for BlobRefs
+        afterwards. Callers about to serialize the jobs anyway should pass
+        False, or every description is read back and decompressed.
+
+        Returns:
+            (new, updated) - counts of jobs not seen before and jobs whose
+            content changed since they were last stored
+        """
+        if not jobs:
+            return 0, 0
+
+        new = 0
+        updated = 0
+        rows = []
+
+        with self.lock, self.conn:
+            texts = [_raw_texts(job) for job in jobs]
+            self._store_texts(texts)
+
+            existing = self.existing_hashes([job.id for job in jobs])
+            for job, job_texts in zip(jobs, texts):
+                text_hashes = {name: ref.hash for name, ref in job_texts.items()}
+                data, content_hash = serialize_job(job, text_hashes)
+                previous = existing.get(job.id)
+                if previous is None:
+                    new += 1
+                elif previous != content_hash:
+                    updated += 1
+                # Later duplicates in the same batch compare against this one
+                existing[job.id] = content_hash
+
+                seen = job.scraped_at.isoformat()
+                rows.append((
+                    job.id, job.company_slug, job.tier, job.title, job.job_type,
+                    job.level, job.location_normalized, int(job.remote),
+                    content_hash, data, seen, seen, seen,
+                ))
+            self.conn.executemany(UPSERT, rows)
+
+            # Stored records drop their text until something reads it
+            for job, job_texts in zip(jobs, texts):
+                if release_texts and isinstance(job, JobRecord):
+                    for name, ref in job_texts.items():
+                        setattr(job, name, ref)
+
+        return new, updated
+
+    def _store_texts(self, texts: list[dict[str, str | BlobRef]]):
+        """Put new descriptions in the blob table, replacing them with refs in place."""
+        pending = [
+            (job_texts, name)
+            for job_texts in texts
+            for name, value in job_texts.items()
+            if not isinstance(value, BlobRef)
+        ]
+        hashes = self.blobs.put_many([job_texts[name] for job_texts, name in pending])
+        for (job_texts, name), content_hash in zip(pending, hashes):
+            job_texts[name] = self.blobs.ref(content_hash)
+
+    def _resolve_texts(self, data: dict, lazy: bool = False) -> dict:
+        """Swap "<field>_hash" keys in a stored record for text or BlobRefs."""
+        for name in TEXT_FIELDS:
+            content_hash = data.pop(f"{name}_hash", None)
+            if content_hash:
+                data[name] = self.blobs.ref(content_hash) if lazy else self.blobs.get(content_hash)
+        return data
+
+    def iter_records(self) -> Iterator[dict]:
+        """Iterate raw stored job records (no scraped_at, descriptions as blob hashes)."""
+        for row in self._iter_rows("SELECT data FROM jobs ORDER BY company_slug, id"):
+            yield loads(row["data"])
+
+    def update_records(self, records: list[dict]):
+        """Rewrite stored records in place, e.g. after relabelling.
+
+        first_seen and last_seen are kept; changed_at is bumped.
+        """
+        if not records:
+            return
+
+        now = datetime.utcnow().isoformat()
+        rows = []
+        for record in records:
+            data = dumps(record)
+            rows.append((
+                record["job_type"], record["level"], record.get("location_normalized"),
+                int(record.get("remote", False)), hashlib.sha256(data).hexdigest(),
+                data.decode(), now, record["id"],
+            ))
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """
+                UPDATE jobs SET
+                    job_type = ?, level = ?, location_normalized = ?, remote = ?,
+                    content_hash = ?, data = ?, changed_at = ?
+                WHERE id = ?
+                """,
+                rows,
+            )
+
+    def _row_to_job(self, row: sqlite3.Row) -> Job:
+        return Job(**self._resolve_texts(loads(row["data"])), scraped_at=row["last_seen"])
+
+    def _row_to_record(self, row: sqlite3.Row) -> JobRecord:
+        """Row as a JobRecord whose descriptions are loaded lazily."""
+        data = self._resolve_texts(loads(row["data"]), lazy=True)
+        refs = {name: data.pop(name) for name in TEXT_FIELDS if name in data}
+        return JobRecord.from_job(Job(**data, scraped_at=row["last_seen"]), **refs)
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a single job by ID."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data, last_seen FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def query(
+        self,
+        company_slug: str | None = None,
+        tiers: list[str] | None = None,
+        job_types: list[str] | None = None,
+        levels: list[str] | None = None,
+        remote: bool | None = None,
+        seen_since: datetime | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Job]:
+        """Iterate stored jobs matching the given filters."""
+        clauses = []
+        params: list = []
+
+        if company_slug:
+            clauses.append("company_slug = ?")
+            params.append(company_slug)
+        for column, values in (("tier", tiers), ("job_type", job_types), ("level", levels)):
+            if values:
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        if remote is not None:
+            clauses.append("remote = ?")
+            params.append(int(remote))
+        if seen_since:
+            clauses.append("last_seen >= ?")
+            params.append(seen_since.isoformat())
+
+        sql = "SELECT data, last_seen FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY company_slug, id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self._iter_rows(sql, params):
+            yield self._row_to_job(row)
+
+    def jobs_for_company(self, company_slug: str) -> dict[str, JobRecord]:
+        """All stored jobs for a company keyed by Job.id, descriptions unloaded."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT data, last_seen FROM jobs WHERE company_slug = ? ORDER BY id", (company_slug,)
+            ).fetchall()
+        return {job.id: job for job in map(self._row_to_record, rows)}
+
+    def count(self, company_slug: str | None = None) -> int:
+        """Number of stored jobs, optionally for one company."""
+        with self.lock:
+            if company_slug:
+                row = self.conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE company_slug = ?", (company_slug,)
+                ).fetchone()
+            else:
+                row = self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return row[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
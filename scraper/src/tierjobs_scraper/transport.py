@@ -0,0 +1,262 @@
+"""Shared HTTP transport for scrapers.
+
+One pooled httpx client reused across every request, so listing and detail
+calls share keep-alive connections instead of paying a fresh TCP/TLS
+handshake each time. Requests are rate-limited per host with a token bucket,
+and 429/5xx responses to idempotent requests are retried with jittered
+exponential backoff that honors Retry-After. An optional ResponseCache adds
+conditional requests (ETag/Last-Modified) on top of get_json.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .cache import CacheEntry, ResponseCache
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Defaults tuned for public ATS APIs (Greenhouse, Lever)
+DEFAULT_RATE = 10.0  # requests per second per host
+DEFAULT_BURST = 20
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 0.5  # seconds
+DEFAULT_BACKOFF_MAX = 30.0  # seconds
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_KEEPALIVE_EXPIRY = 5.0  # seconds an idle pooled connection is kept
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Methods safe to send again after a failure that may have reached the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests/second with bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpTransport:
+    """Pooled async HTTP client with retries and per-host rate limiting."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        host_rates: dict[str, float] | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        cache: ResponseCache | None = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self.buckets: dict[str, TokenBucket] = {}
+
+        # Imported here so commands that never fetch don't pay for httpx
+        import httpx
+
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        """Get (or create) the token bucket for a host."""
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.host_rates.get(host, self.rate), self.burst)
+        return self.buckets[host]
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Delay before retry number `attempt` (0-based)."""
+        if retry_after is not None:
+            # Server told us when to come back; add a little jitter so
+            # concurrent requests don't all return at the same instant
+            return min(self.backoff_max, retry_after) + random.uniform(0, self.backoff_base)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> "httpx.Response":
+        """GET a URL, retrying transient failures. Raises on final error status."""
+        return await self.request("GET", url, headers=headers)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: str | bytes | None = None,
+        retry: bool | None = None,
+    ) -> "httpx.Response":
+        """Send a request, retrying transient failures. Raises on final error status.
+
+        Only idempotent methods are retried unless `retry` says otherwise; a
+        POST that timed out or got a 502 may already have been applied.
+        """
+        import httpx
+
+        bucket = self.bucket_for(urlsplit(url).netloc)
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        retries = self.max_retries if retry else 0
+
+        attempt = 0
+        while True:
+            final = attempt >= retries
+            await bucket.acquire()
+            try:
+                response = await self.client.request(method, url, headers=headers, content=content)
+            except httpx.TransportError:
+                if final:
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUSES and not final:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                await response.aclose()
+                await asyncio.sleep(self.backoff(attempt, retry_after))
+                attempt += 1
+                continue
+
+            # Conditional request hit; the caller reuses its cached body
+            if response.status_code == 304:
+                return response
+
+            response.raise_for_status()
+            return response
+
+    async def get_json(self, url: str):
+        """GET a URL and decode the JSON body, revalidating against the cache."""
+        if not self.cache:
+            response = await self.get(url)
+            return response.json()
+
+        entry = await asyncio.to_thread(self.cache.get, url)
+        if entry and self.cache.is_fresh(entry):
+            return entry.body
+
+        response = await self.get(url, headers=entry.conditional_headers() if entry else None)
+        if response.status_code == 304 and entry:
+            entry.stored_at = time.time()
+        else:
+            entry = CacheEntry(
+                url=url,
+                body=response.json(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                stored_at=time.time(),
+            )
+        await asyncio.to_thread(self.cache.put, entry)
+        return entry.body
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: str | bytes | None = None,
+        retry: bool | None = None,
+    ):
+        """Send a request and decode the JSON body; plain GETs go through get_json and its cache."""
+        if method.upper() == "GET" and not headers and content is None:
+            return await self.get_json(url)
+        response = await self.request(method, url, headers=headers, content=content, retry=retry)
+        return response.json()
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+# Process-wide transport shared by all scrapers
+_shared: HttpTransport | None = None
+_shared_options: dict = {}
+
+
+def configure_transport(**options):
+    """Set options used when the shared transport is next created."""
+    global _shared_options
+    _shared_options = options
+
+
+def get_transport() -> HttpTransport:
+    """Get the shared transport, creating it on first use."""
+    global _shared
+    if _shared is None:
+        _shared = HttpTransport(**_shared_options)
+    return _shared
+
+
+async def close_transport():
+    """Close the shared transport.
+
+    Call this before the event loop that used it shuts down; the next
+    get_transport() call will open a fresh pool.
+    """
+    global _shared
+    if _shared is not None:
+        transport, _shared = _shared, None
+        await transport.aclose()
@@ -0,0 +1,189 @@
+"""BrowserPool context reuse and JSON capture, with stand-ins for the Playwright objects."""
+
+import asyncio
+
+import pytest
+
+from tierjobs_scraper.browser import BrowserPool
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        assert not self.closed and self.browser.is_connected()
+        return FakePage()
+
+    async def close(self):
+        if not self.browser.is_connected():
+            raise RuntimeError("Target closed")
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts: list[FakeContext] = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+    def __init__(self):
+        self.browsers: list[FakeBrowser] = []
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    async def stop(self):
+        pass
+
+
+def make_pool(**options) -> BrowserPool:
+    pool = BrowserPool(block_resources=False, **options)
+    pool.playwright = FakePlaywright()
+    return pool
+
+
+async def open_page(pool: BrowserPool):
+    async with pool.page():
+        pass
+
+
+def test_contexts_are_reused():
+    async def main():
+        pool = make_pool(pages_per_context=3)
+        for _ in range(5):
+            await open_page(pool)
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool.launches == 1
+    assert pool.contexts_opened == 2
+
+
+def test_stale_contexts_are_not_reused_after_a_relaunch():
+    async def main():
+        pool = make_pool()
+        await open_page(pool)
+        first = pool.browser
+        first.connected = False  # crashed
+
+        await open_page(pool)
+        return pool, first
+
+    pool, first = asyncio.run(main())
+    assert pool.launches == 2
+    assert pool.contexts_opened == 2
+    assert pool.browser is not first
+    assert [pooled.browser for pooled in pool.idle] == [pool.browser]
+
+
+def test_context_released_after_a_relaunch_is_closed():
+    async def main():
+        pool = make_pool()
+        async with pool.page():
+            old = pool.browser
+            # Another page finds the browser gone and relaunches it
+            old.connected = False
+            await open_page(pool)
+            old.connected = True
+        return pool, old
+
+    pool, old = asyncio.run(main())
+    assert pool.launches == 2
+    assert old.contexts[0].closed
+    assert [pooled.browser for pooled in pool.idle] == [pool.browser]
+
+
+class FakeRequest:
+    method = "GET"
+    headers = {"accept": "application/json", "cookie": "session=1"}
+    post_data = None
+
+
+class FakeResponse:
+    ok = True
+    status = 200
+    request = FakeRequest()
+
+    def __init__(self, url: str, data):
+        self.url = url
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+
+class SlowPage(FakePage):
+    """Sends `responses`, then times the navigation out the way Playwright does."""
+
+    def __init__(self, responses: list[FakeResponse]):
+        self.responses = responses
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    async def goto(self, url, wait_until):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        for response in self.responses:
+            for handler in self.handlers:
+                handler(response)
+        await asyncio.sleep(0.01)
+        raise PlaywrightTimeoutError("Timeout 30000ms exceeded.")
+
+
+def capture(responses: list[FakeResponse], monkeypatch, **options):
+    pytest.importorskip("playwright")
+
+    async def new_page(self):
+        return SlowPage(responses)
+
+    monkeypatch.setattr(FakeContext, "new_page", new_page)
+    return asyncio.run(make_pool().capture_json("https://example.com/careers", ("*/api/jobs*",), **options))
+
+
+def test_capture_returns_what_arrived_before_a_navigation_timeout(monkeypatch):
+    responses = [
+        FakeResponse("https://example.com/app.js", None),
+        FakeResponse("https://example.com/api/jobs?page=1", {"jobs": [1, 2]}),
+    ]
+    found = capture(responses, monkeypatch, count=2)
+    assert [response.data for response in found] == [{"jobs": [1, 2]}]
+    assert found[0].headers == {"accept": "application/json"}
+
+
+def test_capture_raises_timeout_when_nothing_arrived(monkeypatch):
+    with pytest.raises(TimeoutError, match="No JSON response"):
+        capture([FakeResponse("https://example.com/app.js", None)], monkeypatch)
@@ -0,0 +1,28 @@
+"""ResponseCache writes from concurrent threads."""
+
+import threading
+
+from tierjobs_scraper.cache import CacheEntry, ResponseCache
+
+
+def test_concurrent_puts(tmp_path):
+    cache = ResponseCache(tmp_path, prune_every=0)
+    errors = []
+
+    def put(n: int):
+        try:
+            for i in range(200):
+                cache.put(CacheEntry(url=f"https://example.com/{i % 5}", body={"n": n, "i": i}))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=put, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert cache.writes == 1600
+    assert not list(tmp_path.glob("*/*.tmp"))
+    for i in range(5):
+        assert cache.get(f"https://example.com/{i}").body["i"] % 5 == i
@@ -0,0 +1,163 @@
+"""RuleClassifier must label titles exactly like the original keyword chains."""
+
+import random
+
+import pytest
+
+from tierjobs_scraper.classification import (
+    JOB_TYPE_RULES,
+    LEVEL_RULES,
+    infer_job_type,
+    infer_level,
+)
+
+
+# The any() chains the rule tables replaced, kept verbatim as the reference
+
+def reference_job_type(title: str, team: str | None = None) -> str:
+    combined = f"{title.lower()} {(team or '').lower()}"
+    if any(x in combined for x in [
+        "machine learning", "ml engineer", "ml ", "ai engineer",
+        "deep learning", "nlp", "computer vision", "cv engineer",
+        "llm", "language model", "generative ai"
+    ]):
+        return "mle"
+    if any(x in combined for x in [
+        "research scientist", "research engineer", "researcher",
+        "research fellow", "applied research"
+    ]):
+        return "research"
+    if any(x in combined for x in [
+        "data scientist", "data science", "analytics engineer",
+        "data analyst"
+    ]):
+        return "ds"
+    if any(x in combined for x in [
+        "quant", "quantitative", "trading", "algorithmic"
+    ]):
+        return "quant"
+    if any(x in combined for x in [
+        "product manager", "program manager", "technical program",
+        "tpm", "product lead", "product owner"
+    ]):
+        return "pm"
+    if any(x in combined for x in [
+        "designer", "design", "ux", "ui", "user experience",
+        "user interface", "visual design", "interaction design"
+    ]):
+        return "design"
+    if any(x in combined for x in [
+        "devops", "sre", "site reliability", "infrastructure",
+        "platform engineer", "cloud engineer", "systems engineer"
+    ]):
+        return "devops"
+    if any(x in combined for x in [
+        "security", "infosec", "cybersecurity", "appsec",
+        "penetration", "red team", "blue team"
+    ]):
+        return "security"
+    if any(x in combined for x in [
+        "software engineer", "software developer", "backend",
+        "frontend", "full stack", "fullstack", "web developer",
+        "mobile engineer", "ios engineer", "android engineer",
+        "engineer", "developer", "sde"
+    ]):
+        return "swe"
+    return "other"
+
+
+def reference_level(title: str) -> str:
+    title_lower = title.lower()
+    if any(x in title_lower for x in ["cto", "ceo", "cfo", "coo", "chief"]):
+        return "exec"
+    if any(x in title_lower for x in ["vp", "vice president"]):
+        return "vp"
+    if "director" in title_lower:
+        return "director"
+    if any(x in title_lower for x in ["principal", "distinguished", "fellow"]):
+        return "principal"
+    if "staff" in title_lower:
+        return "staff"
+    if any(x in title_lower for x in ["senior", "sr.", "sr "]):
+        return "senior"
+    if any(x in title_lower for x in ["junior", "jr.", "jr "]):
+        return "junior"
+    if any(x in title_lower for x in ["new grad", "entry level", "early career", "associate"]):
+        return "new_grad"
+    if "intern" in title_lower:
+        return "intern"
+    return "mid"
+
+
+KEYWORDS = sorted({k for _, keywords in JOB_TYPE_RULES + LEVEL_RULES for k in keywords})
+FILLER = ["", "Engineer", "Manager", "II", "Team", "(Remote)", "-", "of", "Lead", "Analyst", "Build"]
+TEAMS = [None, "", "Engineering", "Research", "Design", "Security", "Trading", "Infrastructure", "Product"]
+
+
+def keyword_titles() -> list[tuple[str, str | None]]:
+    """Every keyword alone, in different case, glued to neighbours and paired with every other."""
+    titles = []
+    for keyword in KEYWORDS:
+        titles += [
+            (keyword, None),
+            (keyword.upper(), None),
+            (keyword.title(), "Engineering"),
+            (f"x{keyword}x", None),
+            (f"Senior {keyword} Engineer", None),
+            (keyword.strip(), None),
+        ]
+        titles += [(f"{keyword} {other}", None) for other in KEYWORDS]
+        titles += [("Engineer", keyword), ("Manager", keyword.title())]
+    return titles
+
+
+def random_titles(n: int, seed: int = 13) -> list[tuple[str, str | None]]:
+    rng = random.Random(seed)
+    words = KEYWORDS + FILLER
+    titles = []
+    for _ in range(n):
+        title = " ".join(rng.choice(words) for _ in range(rng.randrange(1, 5)))
+        if rng.random() < 0.3:
+            title = title.upper() if rng.random() < 0.5 else title.title()
+        if rng.random() < 0.2:
+            # Drop a space so keywords run into each other
+            title = title.replace(" ", "", 1)
+        titles.append((title, rng.choice(TEAMS)))
+    return titles
+
+
+@pytest.mark.parametrize("titles", [keyword_titles(), random_titles(20000)], ids=["keywords", "random"])
+def test_labels_match_reference(titles):
+    type_mismatches = [
+        (title, team, infer_job_type(title, team), reference_job_type(title, team))
+        for title, team in titles
+        if infer_job_type(title, team) != reference_job_type(title, team)
+    ]
+    level_mismatches = [
+        (title, infer_level(title), reference_level(title))
+        for title, _ in titles
+        if infer_level(title) != reference_level(title)
+    ]
+    assert not type_mismatches[:10]
+    assert not level_mismatches[:10]
+
+
+@pytest.mark.parametrize("title, team, job_type, level", [
+    # Keywords match anywhere, not just on word boundaries
+    ("Director of Engineering", None, "swe", "exec"),  # "cto" in "director"
+    ("Build Engineer", None, "design", "mid"),  # "ui" in "build"
+    ("Internal Tools Engineer", None, "swe", "intern"),
+    ("Customer Success Manager", None, "other", "mid"),  # "sre" isn't in "success"
+    ("Html Engineer", None, "mle", "mid"),  # "ml " in "html engineer"
+    ("Associate Counsel", None, "other", "new_grad"),
+    ("Sr. Software Engineer", None, "swe", "senior"),
+    ("Senior Engineer", "Machine Learning", "mle", "senior"),
+    ("Research Fellow", None, "research", "principal"),
+    ("Trading Systems Engineer", None, "quant", "mid"),
+    ("Mentor", None, "other", "mid"),
+])
+def test_substring_matching_is_unchanged(title, team, job_type, level):
+    assert reference_job_type(title, team) == job_type
+    assert reference_level(title) == level
+    assert infer_job_type(title, team) == job_type
+    assert infer_level(title) == level
@@ -0,0 +1,128 @@
+"""ScrapeDaemon rescheduling and job count updates."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from tierjobs_scraper.daemon import ScrapeDaemon
+from tierjobs_scraper.models import Company, JobRecord
+from tierjobs_scraper.scheduler import RefreshSchedule
+from tierjobs_scraper.scrapers.base import BaseScraper
+from tierjobs_scraper.store import JobStore
+
+
+class FakeScraper(BaseScraper):
+    """Lists the same few jobs after `delay` seconds."""
+
+    def __init__(self, company: Company, delay: float):
+        super().__init__(company)
+        self.delay = delay
+
+    async def fetch_batches(self):
+        await asyncio.sleep(self.delay)
+        yield [
+            self.create_job(
+                id=self.make_job_id(str(i)),
+                title="Software Engineer",
+                url=f"https://{self.company.domain}/jobs/{i}",
+                scraped_at=datetime(2024, 1, 1),
+            )
+            for i in range(3)
+        ]
+
+
+class FakeClient:
+    """Stands in for AsyncConvexClient; every job counts as already pushed."""
+
+    max_batch_jobs = 100
+    max_batch_bytes = 1 << 20
+
+    def __init__(self):
+        self.count_updates: list[tuple[str, int, datetime | None]] = []
+
+    async def health_check(self):
+        return True
+
+    def encode_jobs(self, jobs):
+        return list(jobs)
+
+    def unpushed(self, items):
+        return []
+
+    async def update_company_job_count(self, slug, job_count, last_scraped=None):
+        self.count_updates.append((slug, job_count, last_scraped))
+        return {}
+
+
+def company(slug: str) -> Company:
+    return Company(name=slug.title(), slug=slug, domain=f"{slug}.com", careers_url=None, tier="A", tier_score=85)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    yield store
+    store.close()
+
+
+def make_daemon(store, delays: dict[str, float], client=None, **schedule_options) -> ScrapeDaemon:
+    companies = {slug: company(slug) for slug in delays}
+    schedule = RefreshSchedule(list(companies.values()), **schedule_options)
+    return ScrapeDaemon(
+        companies,
+        store,
+        schedule,
+        lambda company, previous: FakeScraper(company, delays[company.slug]),
+        client=client,
+        log=lambda message: None,
+    )
+
+
+def test_companies_are_rescheduled_as_they_finish(store):
+    daemon = make_daemon(store, {"fast": 0.0, "slow": 0.5})
+
+    async def main():
+        refresh = asyncio.create_task(daemon.refresh(["fast", "slow"]))
+        await asyncio.sleep(0.2)
+        runs = {slug: state.runs for slug, state in daemon.schedule.states.items()}
+        await refresh
+        return runs
+
+    assert asyncio.run(main()) == {"fast": 1, "slow": 0}
+    assert daemon.schedule.states["slow"].runs == 1
+
+
+def test_job_count_is_sent_after_every_refresh(store):
+    client = FakeClient()
+    daemon = make_daemon(store, {"stripe": 0.0}, client=client)
+
+    async def main():
+        await daemon.refresh(["stripe"])
+        await daemon.refresh(["stripe"])
+
+    asyncio.run(main())
+    # Same count both times, but the scrape time still has to reach Convex
+    assert [(slug, count) for slug, count, _ in client.count_updates] == [("stripe", 3), ("stripe", 3)]
+    first, second = (last_scraped for _, _, last_scraped in client.count_updates)
+    assert first is not None and second > first
+
+
+def test_slow_refresh_does_not_hold_up_other_companies(store):
+    daemon = make_daemon(
+        store,
+        {"fast": 0.0, "slow": 1.5},
+        interval=0.2,
+        min_interval=0.1,
+        max_interval=0.3,
+    )
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.call_later(1.0, daemon.stop)
+        await daemon.run()
+
+    asyncio.run(main())
+    states = daemon.schedule.states
+    assert states["slow"].runs == 1
+    assert states["fast"].runs >= 3
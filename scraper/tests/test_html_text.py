@@ -0,0 +1,106 @@
+"""Parity of html_text with the BeautifulSoup extraction it replaced."""
+
+import html
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from tierjobs_scraper import html_text
+from tierjobs_scraper.html_text import extract_text, html_to_text
+
+bs4 = pytest.importorskip("bs4")
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SAMPLES = json.loads((FIXTURES / "greenhouse_content.json").read_text())
+
+# Samples that must be handed to BeautifulSoup, by the prefilter regex or by
+# the tokenizer giving up part way through
+NEEDS_SOUP = {
+    "numeric_references",
+    "script_and_style",
+    "doctype_and_cdata",
+    "processing_instruction",
+    "textarea_and_title",
+}
+FALLS_BACK = {
+    "stray_less_than",
+    "unquoted_broken_attribute",
+    "odd_comments",
+    "trailing_entity",
+}
+
+
+def reference_html_to_text(content: str) -> str:
+    """GreenhouseScraper.parse_html_content before the tokenizer."""
+    decoded = html.unescape(content)
+    soup = bs4.BeautifulSoup(decoded, "html.parser")
+    text = soup.get_text(separator="\n", strip=True)
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+
+def outcome(convert, content):
+    """Text, or the exception type for markup html.parser rejects outright."""
+    try:
+        return convert(content)
+    except Exception as e:
+        return type(e)
+
+
+def sample_ids():
+    return [sample["name"] for sample in SAMPLES]
+
+
+@pytest.fixture
+def soup_calls(monkeypatch):
+    calls = []
+    soup_text = html_text._soup_text
+
+    def counting(markup):
+        calls.append(markup)
+        return soup_text(markup)
+
+    monkeypatch.setattr(html_text, "_soup_text", counting)
+    return calls
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=sample_ids())
+def test_matches_beautifulsoup(sample):
+    assert html_to_text(sample["content"]) == reference_html_to_text(sample["content"])
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=sample_ids())
+def test_takes_expected_path(sample, soup_calls):
+    markup = html.unescape(sample["content"])
+    prefiltered = html_text._NEEDS_SOUP_RE.search(markup) is not None
+    assert prefiltered == (sample["name"] in NEEDS_SOUP)
+
+    if not prefiltered:
+        try:
+            html_text._fast_strings(markup)
+        except html_text._FallBack:
+            fell_back = True
+        else:
+            fell_back = False
+        assert fell_back == (sample["name"] in FALLS_BACK)
+
+    extract_text(markup)
+    assert bool(soup_calls) == (sample["name"] in NEEDS_SOUP | FALLS_BACK)
+
+
+def test_matches_beautifulsoup_on_spliced_fragments():
+    # Splice pieces of the samples together, cutting through tags and entities
+    rng = random.Random(18)
+    markups = [html.unescape(sample["content"]) for sample in SAMPLES]
+    for _ in range(2000):
+        pieces = []
+        for _ in range(rng.randint(1, 4)):
+            markup = rng.choice(markups)
+            start = rng.randrange(len(markup))
+            pieces.append(markup[start:start + rng.randint(1, 80)])
+        content = html.escape("".join(pieces), quote=False)
+        expected = outcome(reference_html_to_text, content)
+        assert outcome(html_to_text, content) == expected, content
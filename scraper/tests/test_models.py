@@ -0,0 +1,92 @@
+"""JobRecord layout, memory use and pickling."""
+
+import gc
+import pickle
+import tracemalloc
+from datetime import datetime
+
+from tierjobs_scraper.blobs import BlobRef
+from tierjobs_scraper.models import INTERNED_FIELDS, Job, JobRecord
+from tierjobs_scraper.store import JobStore
+
+
+def fresh(text: str) -> str:
+    """An equal string that is a distinct object, like one decoded from JSON."""
+    return "".join(list(text))
+
+
+def job_fields(i: int) -> dict:
+    return {
+        "id": f"stripe_{i}",
+        "company": fresh("Stripe"),
+        "company_slug": fresh("stripe"),
+        "tier": fresh("S"),
+        "tier_score": 95,
+        "title": f"Software Engineer {i}",
+        "url": f"https://boards.greenhouse.io/stripe/jobs/{i}",
+        "location": fresh("San Francisco, CA"),
+        "location_normalized": fresh("San Francisco"),
+        "team": fresh("Engineering"),
+        "departments": [fresh("Engineering")],
+        "offices": [fresh("San Francisco")],
+        "job_type": fresh("swe"),
+        "level": fresh("senior"),
+        "salary_currency": fresh("USD"),
+        "scraped_at": datetime(2024, 1, 1),
+    }
+
+
+def bytes_per_job(build, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        jobs = [build(**job_fields(i)) for i in range(n)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(jobs) == n
+    return (after - before) / n
+
+
+def test_record_has_no_instance_dict():
+    record = JobRecord(**job_fields(0))
+    assert not hasattr(record, "__dict__")
+
+
+def test_repeated_strings_are_shared():
+    first, second = JobRecord(**job_fields(0)), JobRecord(**job_fields(1))
+    for name in INTERNED_FIELDS:
+        assert getattr(first, name) is getattr(second, name), name
+    assert first.departments[0] is second.departments[0]
+    assert first.offices[0] is second.offices[0]
+
+
+def test_record_is_smaller_than_job():
+    job_bytes = bytes_per_job(Job, 2000)
+    record_bytes = bytes_per_job(JobRecord, 2000)
+    assert record_bytes < job_bytes / 2, f"Job {job_bytes:.0f} B/job, JobRecord {record_bytes:.0f} B/job"
+
+
+def test_record_round_trips_through_job():
+    record = JobRecord(**job_fields(0))
+    job = record.to_job()
+    assert job.model_dump() == Job(**job_fields(0)).model_dump()
+    assert JobRecord.from_job(job) == record
+
+
+def test_record_pickles_with_loaded_descriptions(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    try:
+        record = JobRecord(**job_fields(0), description="Build payments", description_html="<p>Build payments</p>")
+        store.upsert_jobs([record])
+        assert type(record.text_ref("description")) is BlobRef
+
+        copy = pickle.loads(pickle.dumps(record))
+    finally:
+        store.close()
+    assert copy == record
+    assert copy.text_ref("description") == "Build payments"
+    assert copy.text_ref("description_html") == "<p>Build payments</p>"
+    for name in INTERNED_FIELDS:
+        assert getattr(copy, name) is getattr(record, name), name
@@ -0,0 +1,60 @@
+"""ParsePool worker and inline parsing."""
+
+import asyncio
+
+from tierjobs_scraper.models import Company
+from tierjobs_scraper.parsing import ParsePool
+from tierjobs_scraper.scrapers.lever import LeverScraper
+
+
+def make_scraper() -> LeverScraper:
+    company = Company(
+        name="Plaid",
+        slug="plaid",
+        domain="plaid.com",
+        careers_url=None,
+        tier="A",
+        tier_score=85,
+        scraper_type="lever",
+    )
+    return LeverScraper(company)
+
+
+def make_payloads(n: int) -> list[dict]:
+    return [
+        {
+            "id": f"posting-{i}",
+            "text": f"Senior Software Engineer {i}",
+            "hostedUrl": f"https://jobs.lever.co/plaid/posting-{i}",
+            "categories": {"location": "San Francisco", "team": "Engineering"},
+            "descriptionPlain": "Build the data platform.",
+            "additionalPlain": "The base salary for this role is $160,000 - $210,000.",
+            "createdAt": 1704067200000 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def without_scraped_at(jobs) -> list[dict]:
+    return [{**job.as_dict(), "scraped_at": None} for job in jobs]
+
+
+def test_workers_match_inline_parsing():
+    scraper = make_scraper()
+    payloads = make_payloads(30)
+    pool = ParsePool(workers=1, batch_size=10, inline_below=0)
+    try:
+        parsed = asyncio.run(pool.parse(scraper, payloads))
+        assert pool.executor is not None
+        assert pool.executor._mp_context.get_start_method() != "fork"
+    finally:
+        pool.close()
+    inline = [scraper.parse_job(payload) for payload in payloads]
+    assert without_scraped_at(parsed) == without_scraped_at(inline)
+
+
+def test_small_batches_are_parsed_inline():
+    pool = ParsePool(workers=1, inline_below=8)
+    parsed = asyncio.run(pool.parse(make_scraper(), make_payloads(7)))
+    assert len(parsed) == 7
+    assert pool.executor is None
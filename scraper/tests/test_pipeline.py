@@ -0,0 +1,94 @@
+"""ScrapePipeline output through WriterSink."""
+
+import asyncio
+import json
+import random
+from datetime import datetime
+
+import pytest
+
+from tierjobs_scraper.models import Company, JobRecord
+from tierjobs_scraper.output import open_writer
+from tierjobs_scraper.pipeline import ScrapePipeline, WriterSink
+from tierjobs_scraper.scrapers.base import BaseScraper
+
+
+class FakeScraper(BaseScraper):
+    """Yields ready-made jobs in batches, optionally failing part way."""
+
+    def __init__(self, slug: str, batches: int, fail_after: int | None = None, seed: int = 0):
+        super().__init__(
+            Company(name=slug.title(), slug=slug, domain=f"{slug}.com", careers_url=None, tier="A", tier_score=85)
+        )
+        self.batch_count = batches
+        self.fail_after = fail_after
+        self.rng = random.Random(seed)
+
+    async def fetch_batches(self):
+        for b in range(self.batch_count):
+            if b == self.fail_after:
+                # Let the earlier batches reach the sinks first
+                await asyncio.sleep(0.05)
+                raise RuntimeError("board went away")
+            yield [self.make_job(b * 3 + i) for i in range(3)]
+
+    async def parse_batch(self, batch):
+        # Finish out of order across the parse workers
+        await asyncio.sleep(self.rng.random() * 0.01)
+        return batch
+
+    def make_job(self, i: int) -> JobRecord:
+        return self.create_job(
+            id=self.make_job_id(str(i)),
+            title="Software Engineer",
+            url=f"https://{self.company.domain}/jobs/{i}",
+            scraped_at=datetime(2024, 1, 1),
+        )
+
+
+def run_pipeline(path, scrapers):
+    sink = WriterSink(open_writer(path), order=[scraper.company.slug for scraper in scrapers])
+    try:
+        runs = asyncio.run(ScrapePipeline(scrapers, sinks=[sink], parse_concurrency=8).run())
+    finally:
+        sink.close()
+    return runs
+
+
+def read_ids(path) -> list[str]:
+    if path.suffix == ".ndjson":
+        return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+    return [job["id"] for job in json.loads(path.read_text())]
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".json"])
+def test_failed_companies_are_left_out(tmp_path, suffix):
+    path = tmp_path / f"jobs{suffix}"
+    scrapers = [
+        FakeScraper("stripe", batches=4, seed=1),
+        FakeScraper("figma", batches=4, fail_after=2, seed=2),
+        FakeScraper("plaid", batches=4, seed=3),
+    ]
+    runs = run_pipeline(path, scrapers)
+    assert [run.success for run in runs] == [True, False, True]
+
+    ids = read_ids(path)
+    assert not any(job_id.startswith("figma_") for job_id in ids)
+    assert len(ids) == 24
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".json"])
+def test_jobs_keep_scrape_order_within_a_company(tmp_path, suffix):
+    path = tmp_path / f"jobs{suffix}"
+    scrapers = [FakeScraper(slug, batches=6, seed=seed) for seed, slug in enumerate(["stripe", "figma", "plaid"])]
+    run_pipeline(path, scrapers)
+
+    ids = read_ids(path)
+    companies = [job_id.split("_")[0] for job_id in ids]
+    # Each company's jobs are contiguous, in the order they were fetched
+    assert [slug for i, slug in enumerate(companies) if i == 0 or companies[i - 1] != slug] == sorted(
+        set(companies), key=companies.index
+    )
+    for scraper in scrapers:
+        slug = scraper.company.slug
+        assert [job_id for job_id in ids if job_id.startswith(slug)] == [f"{slug}_{i}" for i in range(18)]
@@ -0,0 +1,33 @@
+"""Offline reclassification of stored records."""
+
+from tierjobs_scraper.reclassify import classify_labels, reclassify
+
+
+def make_record(**fields) -> dict:
+    record = {
+        "id": "stripe_1",
+        "company_slug": "stripe",
+        "title": "Software Engineer",
+        "team": "Payments",
+        "location": "San Francisco, CA",
+    }
+    record.update(classify_labels(record["title"], record["team"], record["location"]))
+    record.update(fields)
+    return record
+
+
+def test_stored_remote_flag_is_kept():
+    record = make_record(remote=True)
+    assert record["remote"] is True
+
+    [(relabelled, changes)] = reclassify([dict(record)], workers=1)
+    assert changes == {}
+    assert relabelled == record
+
+
+def test_remote_location_sets_flag():
+    record = make_record(location="Remote - US", remote=False)
+
+    [(relabelled, changes)] = reclassify([record], workers=1)
+    assert relabelled["remote"] is True
+    assert changes["remote"] == (False, True)
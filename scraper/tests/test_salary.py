@@ -0,0 +1,46 @@
+"""Salary extraction from posting text."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tierjobs_scraper.models import Company
+from tierjobs_scraper.salary import Salary, extract_salary
+from tierjobs_scraper.scrapers.lever import LeverScraper
+
+
+CASES = json.loads((Path(__file__).parent / "fixtures" / "salary_cases.json").read_text())
+
+
+@pytest.mark.parametrize("case", CASES["descriptions"], ids=lambda case: case["text"][:40])
+def test_extract_salary(case):
+    expected = Salary(*case["expected"]) if case["expected"] else None
+    assert extract_salary(case["text"]) == expected
+
+
+@pytest.mark.parametrize("case", CASES["lever_postings"], ids=lambda case: case["name"])
+def test_lever_posting_salary(case):
+    scraper = LeverScraper(
+        Company(
+            name="Plaid",
+            slug="plaid",
+            domain="plaid.com",
+            careers_url=None,
+            tier="A",
+            tier_score=85,
+            scraper_type="lever",
+        )
+    )
+    posting = {
+        "id": "abc123",
+        "text": "Software Engineer",
+        "hostedUrl": "https://jobs.lever.co/plaid/abc123",
+        "categories": {"location": "San Francisco", "team": "Engineering"},
+        "descriptionPlain": case["descriptionPlain"],
+        "additionalPlain": case["additionalPlain"],
+        "salaryRange": case.get("salaryRange"),
+    }
+    job = scraper.parse_job(posting)
+    salary = [job.salary_min, job.salary_max, job.salary_currency]
+    assert salary == (case["expected"] or [None, None, None])
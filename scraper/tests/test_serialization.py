@@ -0,0 +1,98 @@
+"""JSON encoding must not depend on whether orjson is installed."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tierjobs_scraper import serialization
+from tierjobs_scraper.convex_client import job_fingerprint
+from tierjobs_scraper.models import Job, JobRecord
+from tierjobs_scraper.serialization import dumps, job_to_convex, job_to_record, loads
+
+pytest.importorskip("orjson")
+
+
+TEXTS = [
+    "Software Engineer",
+    "Ingénieur logiciel — Paris",
+    "東京 / Tokyo",
+    "Emoji 🚀 team",
+    'Quotes "inside" and \\backslashes\\',
+    "Tabs\tnewlines\ncarriage\rreturns",
+    "Control \x00\x01\x1f and DEL \x7f",
+    "Separators \u2028 \u2029",
+    "<p>Markup &amp; entities</p>",
+    "",
+]
+
+
+def make_jobs(n: int, seed: int = 0) -> list[JobRecord]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    jobs = []
+    for i in range(n):
+        text = rng.choice(TEXTS)
+        posted = start + timedelta(seconds=rng.randrange(10**7))
+        jobs.append(JobRecord(
+            id=f"company_{i}",
+            company="Company",
+            company_slug="company",
+            tier=rng.choice(["S+", "A", "B-"]),
+            tier_score=rng.randrange(55, 101),
+            title=f"{text} {i}",
+            url=f"https://boards.greenhouse.io/company/jobs/{i}",
+            location=rng.choice([None, "San Francisco, CA", "Zürich", "Remote"]),
+            remote=rng.random() < 0.3,
+            team=rng.choice([None, "Infra", "Recherche"]),
+            departments=["Engineering", text],
+            description=text * rng.randrange(1, 4),
+            metadata={"n": i, "ratio": rng.random(), "big": 10**17 + i, "nested": {"k": [text, None, True]}},
+            salary_min=rng.choice([None, 120000]),
+            salary_max=rng.choice([None, 250000]),
+            posted_at=rng.choice([None, posted, posted.replace(tzinfo=timezone.utc)]),
+            scraped_at=start,
+            score=rng.choice([None, 0.0, -0.0, 0.1, 1 / 3, 87.5, 123456789.125, 1e-5, 1e-7, 1e16, 2.5e22]),
+        ))
+    return jobs
+
+
+def encode_all(jobs: list[JobRecord]) -> list[bytes]:
+    out = []
+    for job in jobs:
+        payload = job_to_convex(job)
+        out.append(dumps(payload))
+        out.append(dumps(payload, sort_keys=True))
+        out.append(dumps(job_to_record(job)))
+        out.append(job_fingerprint(payload).encode())
+    return out
+
+
+def test_orjson_and_stdlib_encode_identically(monkeypatch):
+    jobs = make_jobs(500)
+    with_orjson = encode_all(jobs)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert encode_all(jobs) == with_orjson
+
+
+def test_non_finite_floats_encode_identically(monkeypatch):
+    payload = {"values": [float("nan"), float("inf"), -float("inf"), 1e-300, 1.5]}
+    with_orjson = dumps(payload)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps(payload) == with_orjson
+
+
+def test_loads_round_trips_on_both_backends(monkeypatch):
+    payloads = [job_to_convex(job) for job in make_jobs(50)]
+    encoded = [dumps(payload) for payload in payloads]
+    decoded = [loads(data) for data in encoded]
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert [loads(data) for data in encoded] == decoded == payloads
+
+
+def test_job_and_record_encode_identically():
+    for record in make_jobs(50):
+        job = record.to_job()
+        assert isinstance(job, Job)
+        assert dumps(job_to_convex(job)) == dumps(job_to_convex(record))
+        assert dumps(job_to_record(job)) == dumps(job_to_record(record))
@@ -0,0 +1,46 @@
+"""CLI startup cost: light commands must not import the scraping stack."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules only scrape commands need; each adds tens of milliseconds
+HEAVY_MODULES = ("httpx", "playwright", "bs4")
+
+# Generous, since -X importtime and shared CI machines are noisy; the
+# heavy modules above would add well over 250ms on their own
+DEFAULT_BUDGET_MS = 750
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def import_times(*args: str) -> list[tuple[str, int, int]]:
+    """(module, nesting level, cumulative microseconds) for every import."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "tierjobs_scraper.cli", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        module = name.strip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((module, level, int(cumulative)))
+    return imports
+
+
+def test_companies_command_imports_stay_light():
+    imports = import_times("companies")
+    modules = {module.split(".")[0] for module, _, _ in imports}
+    assert modules.isdisjoint(HEAVY_MODULES), sorted(modules & set(HEAVY_MODULES))
+
+    total_ms = sum(cumulative for _, level, cumulative in imports if level == 0) / 1000
+    budget_ms = float(os.environ.get("TIERJOBS_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+    assert total_ms < budget_ms, f"companies imports: {total_ms:.0f}ms, budget {budget_ms:.0f}ms"
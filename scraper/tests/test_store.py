@@ -0,0 +1,92 @@
+"""JobStore description blobs."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from tierjobs_scraper.blobs import BlobRef
+from tierjobs_scraper.models import JobRecord
+from tierjobs_scraper.store import JobStore
+
+
+def make_record(i: int, description: str) -> JobRecord:
+    return JobRecord(
+        id=f"stripe_{i}",
+        company="Stripe",
+        company_slug="stripe",
+        tier="S",
+        tier_score=95,
+        title=f"Software Engineer {i}",
+        url=f"https://example.com/{i}",
+        description=description,
+        description_html=f"<p>{description}</p>",
+        scraped_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    yield store
+    store.close()
+
+
+def test_upsert_releases_texts_by_default(store):
+    record = make_record(0, "Build payments")
+    assert store.upsert_jobs([record]) == (1, 0)
+    assert type(record.text_ref("description")) is BlobRef
+    assert record.description == "Build payments"
+    assert record.description_html == "<p>Build payments</p>"
+
+
+def test_upsert_can_keep_texts_resident(store):
+    record = make_record(0, "Build payments")
+    store.upsert_jobs([record], release_texts=False)
+    assert record.text_ref("description") == "Build payments"
+    assert store.get(record.id).description == "Build payments"
+
+
+def test_descriptions_are_stored_once(store):
+    store.upsert_jobs([make_record(i, "Shared boilerplate") for i in range(10)])
+    assert store.blobs.count() == 2  # description and description_html
+
+
+def test_blob_cache_is_thread_safe(store):
+    records = [make_record(i, f"Description {i}") for i in range(400)]
+    store.upsert_jobs(records)
+    store.blobs.cache_size = 16
+    refs = [record.text_ref("description") for record in records]
+    errors = []
+
+    def read():
+        try:
+            for _ in range(5):
+                for i, ref in enumerate(refs):
+                    assert ref.load() == f"Description {i}"
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(store.blobs.cache) <= 16
+
+
+def test_streaming_reads_do_not_hold_the_lock(store):
+    store.upsert_jobs([make_record(i, f"Description {i}") for i in range(1200)])
+    jobs = store.query(company_slug="stripe")
+    records = store.iter_records()
+    next(jobs), next(records)
+
+    # Another thread can write while both iterators are part way through
+    writer = threading.Thread(target=store.upsert_jobs, args=([make_record(5000, "New")],))
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert store.count() == 1201
+    assert sum(1 for _ in jobs) >= 1199
+    assert sum(1 for _ in records) >= 1199